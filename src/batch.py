@@ -0,0 +1,308 @@
+"""
+Пакетная обработка входных файлов.
+
+Файлы обрабатываются пулом процессов: модули приложения импортируются один раз в основном процессе
+и наследуются рабочими процессами, поэтому запуск интерпретатора и импорт зависимостей
+не повторяются для каждого файла.
+"""
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from time import perf_counter
+from typing import Any, NamedTuple, Optional
+
+import click
+
+from logger import get_logger
+from main import ENGINES, OUTPUT_FORMATS, CitationEnum, generate, get_renderer, preload
+
+logger = get_logger(__name__)
+
+# наименование файла отчета о пакетной обработке (сохраняется в выходной директории)
+REPORT_FILE_NAME = "report.json"
+
+
+class FileResult(NamedTuple):
+    """
+    Результат обработки входного файла.
+    """
+
+    # путь к входному файлу
+    path_input: str
+    # путь к выходному файлу
+    path_output: str
+    # время обработки в секундах
+    seconds: float
+    # описание ошибки (не задано при успешной обработке)
+    error: Optional[str]
+
+
+def find_inputs(path_input: str) -> list[Path]:
+    """
+    Получение списка входных файлов.
+
+    :param path_input: Директория с файлами .xlsx или шаблон пути (glob).
+    :return: Пути к входным файлам в порядке сортировки (без файлов блокировки Excel «~$...»).
+    """
+
+    if Path(path_input).is_dir():
+        paths = Path(path_input).glob("*.xlsx")
+    else:
+        paths = (Path(path) for path in glob.glob(path_input, recursive=True))
+
+    return sorted(path for path in paths if path.is_file() and not path.name.startswith("~$"))
+
+
+def process_file(path_input: str, path_output: str, options: dict[str, Any]) -> FileResult:
+    """
+    Обработка одного входного файла (выполняется в рабочем процессе).
+
+    :param path_input: Путь к входному файлу.
+    :param path_output: Путь к выходному файлу.
+    :param options: Параметры генерации выходного файла (см. `main.generate`).
+    :return: Результат обработки.
+    """
+
+    started = perf_counter()
+    try:
+        Path(path_output).parent.mkdir(parents=True, exist_ok=True)
+        generate(path_input=path_input, path_output=path_output, **options)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.error("При обработке файла %s возникла ошибка: %s", path_input, ex)
+        return FileResult(path_input, path_output, perf_counter() - started, f"{type(ex).__name__}: {ex}")
+
+    return FileResult(path_input, path_output, perf_counter() - started, None)
+
+
+def process_files(
+    paths: list[Path], output_dir: Path, workers: int, options: dict[str, Any], extension: str
+) -> list[FileResult]:
+    """
+    Обработка входных файлов пулом процессов.
+
+    :param paths: Пути к входным файлам.
+    :param output_dir: Директория для выходных файлов.
+    :param workers: Количество рабочих процессов (0 – последовательная обработка в текущем процессе).
+    :param options: Параметры генерации выходного файла (см. `main.generate`).
+    :param extension: Расширение выходных файлов.
+    :return: Результаты обработки в порядке входных файлов (при аварийном завершении рабочего процесса
+        необработанные файлы отмечаются ошибкой `BrokenProcessPool`).
+    """
+
+    # выходные файлы повторяют расположение входных файлов относительно их общей директории
+    base = Path(os.path.commonpath([path.parent for path in paths])) if paths else output_dir
+    tasks = [
+        (str(path), str(output_dir / path.relative_to(base).with_suffix(f".{extension}"))) for path in paths
+    ]
+    if not workers:
+        return [process_file(path_input, path_output, options) for path_input, path_output in tasks]
+
+    preload()
+    started = perf_counter()
+    results: dict[str, FileResult] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_file, path_input, path_output, options): (path_input, path_output)
+            for path_input, path_output in tasks
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BrokenProcessPool as ex:
+                # рабочий процесс завершился аварийно (например, из-за нехватки памяти): файл отмечается ошибкой
+                path_input, path_output = futures[future]
+                logger.error("При обработке файла %s рабочий процесс завершился аварийно: %s", path_input, ex)
+                result = FileResult(path_input, path_output, perf_counter() - started, f"{type(ex).__name__}: {ex}")
+            results[result.path_input] = result
+            logger.info("Обработано файлов: %s из %s.", len(results), len(tasks))
+
+    return [results[path_input] for path_input, _ in tasks]
+
+
+def write_report(results: list[FileResult], seconds: float, path: Path) -> None:
+    """
+    Сохранение отчета о пакетной обработке.
+
+    :param results: Результаты обработки файлов.
+    :param seconds: Общее время обработки в секундах.
+    :param path: Путь к файлу отчета.
+    """
+
+    report = {
+        "total": len(results),
+        "succeeded": sum(result.error is None for result in results),
+        "failed": sum(result.error is not None for result in results),
+        "seconds": round(seconds, 3),
+        "files": [{**result._asdict(), "seconds": round(result.seconds, 3)} for result in results],
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+@click.command()
+@click.option(
+    "--citation",
+    "-c",
+    "citation",
+    type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
+    default=CitationEnum.GOST.name,
+    show_default=True,
+    help="Стиль цитирования",
+)
+@click.option(
+    "--path_input",
+    "-pi",
+    "path_input",
+    type=str,
+    required=True,
+    help="Директория с входными файлами .xlsx или шаблон пути (например, «input/**/*.xlsx»)",
+)
+@click.option(
+    "--path_output",
+    "-po",
+    "path_output",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Директория для выходных файлов и отчета о пакетной обработке",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Количество процессов для обработки файлов (0 – последовательная обработка в текущем процессе)",
+)
+@click.option(
+    "--engine",
+    "-e",
+    "engine",
+    type=click.Choice(ENGINES, case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Способ генерации Word-файла (см. `main.py --help`)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Формат выходных файлов (см. `main.py --help`)",
+)
+@click.option(
+    "--streaming",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковое чтение входных файлов в режиме только для чтения",
+)
+@click.option(
+    "--bulk",
+    "bulk",
+    is_flag=True,
+    default=False,
+    help="Пакетная проверка значений по столбцам и создание моделей без построчной валидации",
+)
+@click.option(
+    "--records",
+    "records",
+    is_flag=True,
+    default=False,
+    help="Компактные записи со слотами вместо моделей pydantic",
+)
+@click.option(
+    "--incremental",
+    "incremental",
+    is_flag=True,
+    default=False,
+    help="Инкрементальная сборка каждого файла по манифесту предыдущего запуска",
+)
+@click.option(
+    "--cache",
+    "cache_path",
+    type=str,
+    default="",
+    show_default=True,
+    help="Путь к файлу кэша оформленных источников (SQLite), общему для всех процессов; пустое значение – без кэша",
+)
+def process_batch(
+    citation: str,
+    path_input: str,
+    path_output: str,
+    workers: int,
+    engine: str,
+    output_format: str,
+    streaming: bool,
+    bulk: bool,
+    records: bool,
+    incremental: bool,
+    cache_path: str,
+) -> None:
+    """
+    Пакетная генерация файлов с оформленными библиографическими списками.
+
+    Для каждого входного файла создается выходной файл с тем же именем (с сохранением вложенных директорий),
+    в выходной директории сохраняется отчет о времени обработки и ошибках по файлам.
+
+    :param str citation: Стиль цитирования
+    :param str path_input: Директория с входными файлами или шаблон пути
+    :param str path_output: Директория для выходных файлов
+    :param int workers: Количество процессов для обработки файлов
+    :param str engine: Способ генерации Word-файла
+    :param str output_format: Формат выходных файлов
+    :param bool streaming: Потоковое чтение входных файлов
+    :param bool bulk: Пакетная проверка значений по столбцам
+    :param bool records: Компактные записи со слотами вместо моделей pydantic
+    :param bool incremental: Инкрементальная сборка каждого файла
+    :param str cache_path: Путь к файлу кэша оформленных источников (переменная окружения CITATION_CACHE_PATH
+        в пакетной обработке не используется)
+    """
+
+    paths = find_inputs(path_input)
+    logger.info("Пакетная обработка: файлов – %s, процессов – %s.", len(paths), workers)
+
+    output_dir = Path(path_output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_format = output_format.lower()
+    renderer = get_renderer(output_format, engine)
+    options = {
+        "citation": citation,
+        "streaming": streaming,
+        "bulk": bulk,
+        "records": records,
+        "engine": engine,
+        "output_format": output_format,
+        "incremental": incremental,
+        "cache_path": cache_path,
+        # снимок источников создается для одного входного файла, поэтому в пакетной обработке не используется
+        # (иначе рабочие процессы перезаписывали бы общий файл снимка из переменной окружения SNAPSHOT_PATH)
+        "snapshot_path": "",
+    }
+
+    started = perf_counter()
+    results = process_files(paths, output_dir, workers, options, renderer.extension)
+    seconds = perf_counter() - started
+    write_report(results, seconds, output_dir / REPORT_FILE_NAME)
+
+    failed = [result for result in results if result.error is not None]
+    logger.info(
+        "Пакетная обработка завершена: успешно – %s, с ошибками – %s, время – %.3f с.",
+        len(results) - len(failed),
+        len(failed),
+        seconds,
+    )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # запуск пакетной обработки входных файлов
+    process_batch()
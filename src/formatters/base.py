@@ -1,7 +1,15 @@
 """
 Базовые функции форматирования списка источников
 """
+from collections import Counter, defaultdict
+from itertools import islice
+from time import perf_counter
+from typing import Iterable, Iterator, Optional, Type, Union
 
+from pydantic import BaseModel
+
+from formatters.cache import BATCH_SIZE, CitationCache, citation_key
+from formatters.sorting import external_sort
 from formatters.styles.base import BaseCitationStyle
 from logger import get_logger
 
@@ -14,14 +22,111 @@ class BaseCitationFormatter:
     Базовый класс для итогового форматирования списка источников.
     """
 
-    def __init__(self, formatted_items: list[BaseCitationStyle]) -> None:
+    # соответствие наименований моделей стилям оформления источников
+    formatters_map: dict[str, Type[BaseCitationStyle]] = {}
+
+    def __init__(
+        self, formatted_items: Iterable[BaseCitationStyle], cache: Optional[CitationCache] = None
+    ) -> None:
         """
         Конструктор.
 
-        :param formatted_items: Список объектов для итогового форматирования
+        :param formatted_items: Список (или итератор) объектов для итогового форматирования
+        :param cache: Кэш оформленных источников
         """
 
         self.formatted_items = formatted_items
+        self.cache = cache
+        # количество оформленных источников и время оформления по стилям
+        self.counts: Counter[str] = Counter()
+        self.timings: defaultdict[str, float] = defaultdict(float)
+
+    def get_style(self, model: BaseModel) -> Type[BaseCitationStyle]:
+        """
+        Получение стиля оформления модели.
+
+        Стиль выбирается по наименованию класса модели или ближайшего базового класса
+        (например, представления записи в снимке источников оформляются стилем записи).
+
+        :param model: Модель источника.
+        :raises KeyError: Если для модели нет стиля оформления.
+        :return: Класс стиля оформления.
+        """
+
+        model_type = type(model)
+        style = self.formatters_map.get(model_type.__name__)
+        if style is not None:
+            return style
+
+        for base in model_type.__mro__[1:]:
+            if base.__name__ in self.formatters_map:
+                return self.formatters_map[base.__name__]
+
+        raise KeyError(model_type.__name__)
+
+    def build(self, model: BaseModel, formatted: Optional[str] = None) -> BaseCitationStyle:
+        """
+        Оформление модели в соответствии со стилем цитирования.
+
+        :param model: Модель источника.
+        :param formatted: Оформленная строка источника (например, из кэша), если она уже известна.
+        :return: Оформленный источник.
+        """
+
+        started = perf_counter()
+        item = self.get_style(model)(model, formatted)
+
+        style = type(item).__name__
+        self.counts[style] += 1
+        self.timings[style] += perf_counter() - started
+
+        return item
+
+    def iter_build(self, models: Iterable[BaseModel]) -> Iterator[BaseCitationStyle]:
+        """
+        Оформление моделей в соответствии со стилем цитирования.
+
+        При наличии кэша оформленные строки запрашиваются пакетами, оформляются только отсутствующие в кэше модели,
+        новые строки записываются в кэш после каждого пакета.
+
+        :param models: Список (или итератор) моделей источников.
+        :return: Итератор оформленных источников.
+        """
+
+        if self.cache is None:
+            yield from (self.build(model) for model in models)
+            return
+
+        iterator = iter(models)
+        while batch := list(islice(iterator, BATCH_SIZE)):
+            keys = [citation_key(self.get_style(model), model) for model in batch]
+            found = self.cache.lookup(keys)
+            for model, key in zip(batch, keys):
+                item = self.build(model, found.get(key))
+                if key not in found:
+                    self.cache.store(key, item.formatted)
+                yield item
+            self.cache.flush()
+
+    def log_summary(self) -> None:
+        """
+        Вывод в лог количества оформленных источников и времени оформления по стилям.
+        """
+
+        for style, count in self.counts.items():
+            logger.info("Оформлено %s: источников – %s, время – %.3f с.", style, count, self.timings[style])
+
+    def sort_key(self, item: BaseCitationStyle) -> tuple:
+        """
+        Получение ключа сортировки источника.
+
+        Последним элементом ключа всегда является оформленная строка источника.
+
+        :param item: Оформленный источник.
+        :return: Ключ сортировки.
+        """
+
+        return (item.formatted,)
 
     def format(self) -> list[BaseCitationStyle]:
         """
@@ -32,4 +137,63 @@ class BaseCitationFormatter:
 
         logger.info("Общее форматирование ...")
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        items = sorted(self.formatted_items, key=self.sort_key)
+        self.log_summary()
+
+        return items
+
+    def iter_format(
+        self, memory_limit: Optional[int] = None, items: bool = False
+    ) -> Iterator[Union[str, BaseCitationStyle]]:
+        """
+        Ленивое форматирование списка источников.
+
+        Для сортировки в памяти хранятся только компактные ключи (без объектов стилей и моделей),
+        оформленные строки возвращаются по мере обхода итератора.
+
+        :param memory_limit: Объем памяти для сортировки (в байтах), при превышении которого
+            используется внешняя сортировка во временных файлах. По умолчанию сортировка выполняется в памяти.
+        :param items: Возвращать оформленные источники вместо строк (в ключах сортировки хранятся класс стиля
+            и данные источника, объект стиля создается заново после сортировки без повторного оформления).
+        :return: Итератор оформленных строк (или оформленных источников).
+        """
+
+        logger.info("Общее форматирование ...")
+
+        keys: Iterator[tuple]
+        if items:
+            # порядковый номер исключает сравнение классов стилей и данных при совпадении строк;
+            # во временные файлы внешней сортировки попадают только ключ, номер, класс стиля и данные источника
+            keys = (
+                (*self.sort_key(item), index, type(item), item.data)
+                for index, item in enumerate(self.formatted_items)
+            )
+        else:
+            keys = (self.sort_key(item) for item in self.formatted_items)
+
+        if memory_limit:
+            for key in external_sort(keys, memory_limit):
+                yield restore_item(key) if items else key[-1]
+            self.log_summary()
+            return
+
+        buffer = list(keys)
+        self.log_summary()
+        # сортировка в обратном порядке позволяет освобождать ключи по мере выдачи строк
+        buffer.sort(reverse=True)
+        while buffer:
+            key = buffer.pop()
+            yield restore_item(key) if items else key[-1]
+
+
+def restore_item(key: tuple) -> BaseCitationStyle:
+    """
+    Восстановление оформленного источника по ключу сортировки.
+
+    :param key: Ключ сортировки: ключ стиля (последний элемент – оформленная строка), номер, класс стиля и данные.
+    :return: Оформленный источник.
+    """
+
+    *_, formatted, _, style, data = key
+
+    return style(data, formatted)
@@ -0,0 +1,168 @@
+"""
+Постоянный кэш оформленных источников (SQLite).
+
+Ключ записи – хэш наименования и шаблона стиля цитирования и значений атрибутов источника,
+поэтому модели и компактные записи с одинаковыми значениями используют общую запись кэша,
+а изменение шаблона стиля не требует очистки кэша.
+"""
+import hashlib
+import sqlite3
+import time
+from typing import Type, Union
+
+from pydantic import BaseModel
+
+from formatters.records import BaseRecord
+from formatters.styles.base import BaseCitationStyle
+from logger import get_logger
+from settings import CITATION_CACHE_SIZE
+
+logger = get_logger(__name__)
+
+# версия формата ключей (необходимо увеличить при изменении правил оформления, не затрагивающих шаблоны стилей)
+CACHE_VERSION = 1
+
+# количество ключей, запрашиваемых из кэша за одну операцию
+BATCH_SIZE = 500
+
+# время ожидания блокировки базы (в секундах): кэш может использоваться несколькими процессами пакетной обработки
+LOCK_TIMEOUT = 60
+
+# интервал (в наносекундах), в течение которого повторное использование записи не отмечается в базе
+TOUCH_INTERVAL = 3600 * 10**9
+
+
+def citation_key(style: Type[BaseCitationStyle], data: Union[BaseModel, BaseRecord]) -> bytes:
+    """
+    Получение ключа кэша для оформления источника стилем цитирования.
+
+    :param style: Класс стиля цитирования.
+    :param data: Модель или компактная запись источника.
+    :return: Ключ кэша.
+    """
+
+    fields = data.fields if isinstance(data, BaseRecord) else data.__fields__
+    values = tuple(getattr(data, field) for field in fields)
+
+    return hashlib.blake2b(
+        f"{CACHE_VERSION}:{style.__module__}.{style.__qualname__}:{style.string_format()}:{values!r}".encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+class CitationCache:
+    """
+    Кэш оформленных строк источников с вытеснением давно не использованных записей.
+
+    Новые записи и отметки об использовании записываются в базу при вызове `flush()` (после каждого пакета
+    оформленных источников), давно не использованные записи вытесняются при закрытии кэша. Отметка использования
+    обновляется не чаще, чем раз в `TOUCH_INTERVAL`, поэтому повторные запуски почти не изменяют базу.
+
+    Запись выполняется короткими транзакциями, поэтому одну базу могут одновременно использовать несколько
+    процессов: запись другого процесса ожидает снятия блокировки не дольше `LOCK_TIMEOUT`.
+    """
+
+    def __init__(self, path: str, max_entries: int = CITATION_CACHE_SIZE) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу базы данных кэша.
+        :param max_entries: Максимальное количество записей в кэше.
+        """
+
+        self.path = path
+        self.max_entries = max_entries
+        # отметка использования записей в текущем запуске
+        self.stamp = time.time_ns()
+        # количество попаданий и промахов
+        self.hits = 0
+        self.misses = 0
+
+        self.pending: dict[bytes, str] = {}
+        self.touched: set[bytes] = set()
+
+        self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS citations "
+                "(key BLOB PRIMARY KEY, formatted TEXT NOT NULL, used INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS citations_used ON citations (used)")
+
+    def lookup(self, keys: list[bytes]) -> dict[bytes, str]:
+        """
+        Получение оформленных строк по ключам.
+
+        :param keys: Ключи кэша.
+        :return: Оформленные строки найденных ключей.
+        """
+
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), BATCH_SIZE):
+            chunk = unique[start : start + BATCH_SIZE]
+            for key, formatted, used in self.connection.execute(
+                f"SELECT key, formatted, used FROM citations WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+            ):
+                found[key] = formatted
+                if used < self.stamp - TOUCH_INTERVAL:
+                    self.touched.add(key)
+
+        hits = sum(key in found for key in keys)
+        self.hits += hits
+        self.misses += len(keys) - hits
+
+        return found
+
+    def store(self, key: bytes, formatted: str) -> None:
+        """
+        Добавление оформленной строки в кэш.
+
+        :param key: Ключ кэша.
+        :param formatted: Оформленная строка источника.
+        """
+
+        self.pending[key] = formatted
+
+    def flush(self) -> None:
+        """
+        Запись новых строк и отметок использования в базу.
+        """
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO citations (key, formatted, used) VALUES (?, ?, ?)",
+                ((key, formatted, self.stamp) for key, formatted in self.pending.items()),
+            )
+            self.connection.executemany(
+                "UPDATE citations SET used = ? WHERE key = ?", ((self.stamp, key) for key in self.touched)
+            )
+
+        self.pending.clear()
+        self.touched.clear()
+
+    def evict(self) -> None:
+        """
+        Вытеснение давно не использованных записей сверх максимального количества записей.
+        """
+
+        with self.connection:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM citations").fetchone()
+            if count > self.max_entries:
+                self.connection.execute(
+                    "DELETE FROM citations WHERE key IN (SELECT key FROM citations ORDER BY used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def close(self) -> None:
+        """
+        Запись изменений, вытеснение давно не использованных записей и закрытие базы данных кэша.
+        """
+
+        self.flush()
+        self.evict()
+        self.connection.close()
+
+        logger.info(
+            "Кэш оформленных источников %s: попаданий – %s, промахов – %s.", self.path, self.hits, self.misses
+        )
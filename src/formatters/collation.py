@@ -0,0 +1,102 @@
+"""
+Сопоставление (collation) оформленных строк для сортировки библиографического списка.
+
+Ключ сопоставления – байтовая строка, которая вычисляется один раз для источника, поэтому сортировка
+сводится к побайтовому сравнению ключей. Порядок ключей соответствует порядку ГОСТ:
+источники на русском языке располагаются перед источниками на иностранных языках,
+регистр букв не учитывается, буквы «ё» и «е» не различаются.
+
+Ключ вычисляется без обработки отдельных символов в Python: строка приводится к нижнему регистру,
+кодируется в cp1251 (один байт на символ, кириллица – в алфавитном порядке) и байты перекодируются таблицей
+`bytes.translate` в коды сопоставления. Символы, отсутствующие в cp1251, заменяет обработчик ошибок кодирования.
+"""
+import codecs
+import string
+import unicodedata
+
+# кодировка промежуточного представления строки
+ENCODING = "cp1251"
+
+# наименование обработчика ошибок кодирования символов, отсутствующих в cp1251
+ERRORS = "collation"
+
+# порядок символов: пробельные символы, знаки препинания, цифры, кириллица, латиница, прочие символы
+CYRILLIC = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+LATIN = string.ascii_lowercase
+ORDER = " " + string.punctuation + string.digits + CYRILLIC + LATIN
+
+# символ cp1251, которым заменяются символы других алфавитов (располагаются после латиницы)
+OTHER = "¤"
+
+# типографские знаки и их аналоги среди знаков препинания ASCII
+TYPOGRAPHIC = {
+    "–": "-",
+    "—": "-",
+    "‑": "-",
+    "«": '"',
+    "»": '"',
+    "„": '"',
+    "“": '"',
+    "”": '"',
+    "‘": "'",
+    "’": "'",
+    "№": "#",
+}
+
+
+def build_table() -> bytes:
+    """
+    Построение таблицы перекодирования байтов cp1251 в коды сопоставления.
+
+    :return: Таблица для `bytes.translate`.
+    """
+
+    codes = {char: index + 1 for index, char in enumerate(ORDER)}
+    # управляющие и пробельные символы сравниваются как пробел, прочие символы – после латиницы
+    table = [codes[" "] if byte <= 0x20 or byte in (0x7F, 0xA0) else len(ORDER) + 1 for byte in range(256)]
+
+    aliases = {**TYPOGRAPHIC, "ё": "е"}
+    for byte in range(256):
+        char = bytes([byte]).decode(ENCODING, errors="ignore")
+        char = aliases.get(char, char)
+        if char in codes:
+            table[byte] = codes[char]
+
+    return bytes(table)
+
+
+def replace_unencodable(error: UnicodeError) -> tuple[str, int]:
+    """
+    Замена символов, отсутствующих в cp1251: латинские буквы с диакритическими знаками заменяются базовыми буквами,
+    символы других алфавитов – символом, располагаемым после латиницы.
+
+    :param error: Ошибка кодирования.
+    :return: Замена и позиция, с которой продолжается кодирование.
+    """
+
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+
+    replacement = []
+    for char in error.object[error.start : error.end]:
+        base = unicodedata.normalize("NFKD", char)[:1]
+        replacement.append(base if base in LATIN else TYPOGRAPHIC.get(char, OTHER))
+
+    return "".join(replacement), error.end
+
+
+codecs.register_error(ERRORS, replace_unencodable)
+
+# таблица перекодирования байтов cp1251 в коды сопоставления
+COLLATION_TABLE = build_table()
+
+
+def collation_key(text: str) -> bytes:
+    """
+    Получение ключа сопоставления строки.
+
+    :param text: Оформленная строка.
+    :return: Ключ сопоставления (побайтовое сравнение ключей соответствует порядку строк по ГОСТ).
+    """
+
+    return text.casefold().encode(ENCODING, ERRORS).translate(COLLATION_TABLE)
@@ -0,0 +1,311 @@
+"""
+Поиск повторяющихся источников.
+
+Ключевые поля источника нормализуются (регистр, буквы «ё» и «е», пробелы и знаки препинания, запись инициалов
+авторов), и хэш нормализованных значений добавляется в индекс, поэтому точные повторы находятся за один проход
+без попарного сравнения источников.
+
+В режиме поиска похожих источников для каждого источника дополнительно вычисляется сигнатура MinHash
+по символьным триграммам нормализованных значений. Сигнатура строится за один проход по триграммам
+(one permutation hashing): хэши распределяются по ячейкам, и в каждой ячейке сохраняется минимальный хэш.
+Сигнатура разбивается на полосы (LSH), и источник сравнивается только с оставленными источниками, у которых
+совпадает хотя бы одна полоса. Похожим считается источник того же типа, у которого совпадают год и номер выпуска,
+а оценка коэффициента Жаккара не меньше порога.
+"""
+import hashlib
+import json
+import re
+from array import array
+from typing import Any, Iterable, Iterator, Optional, Type, Union
+from zlib import crc32
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    InternetResourceModel,
+    JournalArticleModel,
+    NewspaperModel,
+)
+from formatters.records import BaseRecord
+from logger import get_logger
+from settings import DEDUPLICATION_THRESHOLD
+
+logger = get_logger(__name__)
+
+# версия формата отчета
+REPORT_VERSION = 1
+
+# суффикс файла отчета об объединенных источниках (добавляется к пути выходного файла)
+DUPLICATES_SUFFIX = ".duplicates.json"
+
+# режимы поиска: exact – совпадение нормализованных значений, fuzzy – дополнительно похожие источники (MinHash/LSH)
+MODES = ("exact", "fuzzy")
+
+# поля, по которым сравниваются источники
+KEY_FIELDS: dict[Type[BaseModel], tuple[str, ...]] = {
+    BookModel: ("authors", "title", "publishing_house", "year"),
+    InternetResourceModel: ("article", "website", "link"),
+    ArticlesCollectionModel: ("authors", "article_title", "collection_title", "year", "pages"),
+    JournalArticleModel: ("authors", "article_title", "journal_title", "year", "issue", "pages"),
+    NewspaperModel: ("authors", "article_title", "newspaper_title", "year", "date", "issue"),
+}
+
+# поля со списком авторов (порядок слов не учитывается)
+AUTHOR_FIELDS = frozenset({"authors"})
+# поля, значения которых должны совпадать и у похожих источников
+EXACT_FIELDS = frozenset({"year", "issue"})
+
+# параметры MinHash/LSH: количество ячеек и полос сигнатуры
+# (вероятность сравнения источников с коэффициентом Жаккара s равна 1 - (1 - s ** 4) ** 8)
+SIGNATURE_SIZE = 32
+BANDS = 8
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+SHINGLE_SIZE = 3
+
+# 32-битный хэш триграммы: старшие биты – номер ячейки, младшие – значение в ячейке
+MASK = (1 << 32) - 1
+BIN_BITS = 5
+VALUE_BITS = 32 - BIN_BITS
+VALUE_MASK = (1 << VALUE_BITS) - 1
+# множитель для перемешивания битов crc32 (результаты не зависят от запуска, в отличие от `hash()`)
+MULTIPLIER = 0x9E3779B1
+
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(value: Any, words_order: bool = True) -> str:
+    """
+    Нормализация значения поля.
+
+    Значение приводится к нижнему регистру, буква «ё» заменяется на «е», знаки препинания – на пробелы,
+    а подряд идущие однобуквенные слова (инициалы) объединяются: «Иванов И. М.» и «иванов И.М.» совпадают.
+
+    :param value: Значение поля.
+    :param words_order: Учитывать порядок слов.
+    :return: Нормализованное значение.
+    """
+
+    if value is None:
+        return ""
+
+    words: list[str] = []
+    initials = False
+    for word in NON_WORD.sub(" ", str(value).casefold().replace("ё", "е")).split():
+        initial = len(word) == 1 and word.isalpha()
+        if initial and initials:
+            words[-1] += word
+        else:
+            words.append(word)
+        initials = initial
+
+    if not words_order:
+        words.sort()
+
+    return " ".join(words)
+
+
+def key_fields(data: Union[BaseModel, BaseRecord]) -> tuple[str, tuple[str, ...]]:
+    """
+    Получение наименования типа и ключевых полей источника.
+
+    :param data: Модель или компактная запись источника.
+    :return: Наименование модели и ключевые поля.
+    """
+
+    model = data.model if isinstance(data, BaseRecord) else type(data)
+
+    return model.__name__, KEY_FIELDS.get(model, tuple(model.__fields__))
+
+
+def signature(text: str) -> array:
+    """
+    Вычисление сигнатуры MinHash.
+
+    :param text: Нормализованные значения ключевых полей.
+    :return: Минимальные хэши триграмм в ячейках сигнатуры.
+    """
+
+    # короткие значения (короче триграммы) хэшируются целиком
+    shingles = {text[index : index + SHINGLE_SIZE] for index in range(len(text) - SHINGLE_SIZE + 1)} or {text}
+
+    bins = [-1] * SIGNATURE_SIZE
+    for shingle in shingles:
+        value = crc32(shingle.encode("utf-8")) * MULTIPLIER & MASK
+        number, value = value >> VALUE_BITS, value & VALUE_MASK
+        if bins[number] < 0 or value < bins[number]:
+            bins[number] = value
+
+    # пустая ячейка получает значение ближайшей следующей заполненной ячейки с ее смещением в старших битах
+    result = array("I", [0]) * SIGNATURE_SIZE
+    for number, value in enumerate(bins):
+        offset = 0
+        while value < 0:
+            offset += 1
+            value = bins[(number + offset) % SIGNATURE_SIZE]
+        result[number] = offset << VALUE_BITS | value
+
+    return result
+
+
+def similarity(first: array, second: array) -> float:
+    """
+    Оценка коэффициента Жаккара по сигнатурам MinHash.
+
+    :param first: Первая сигнатура.
+    :param second: Вторая сигнатура.
+    :return: Доля совпадающих значений сигнатур.
+    """
+
+    return sum(1 for left, right in zip(first, second) if left == right) / SIGNATURE_SIZE
+
+
+class Deduplicator:
+    """
+    Исключение повторяющихся источников с сохранением первого из них.
+
+    Источники нумеруются в порядке поступления (для входного файла – в порядке чтения листов и строк).
+    В памяти хранятся хэши оставленных источников и, в режиме поиска похожих источников, их сигнатуры.
+    """
+
+    def __init__(self, mode: str = "exact", threshold: float = DEDUPLICATION_THRESHOLD) -> None:
+        """
+        Конструктор.
+
+        :param mode: Режим поиска (элемент `MODES`, без учета регистра).
+        :param threshold: Минимальная оценка коэффициента Жаккара для похожих источников.
+        :raises ValueError: Если режим поиска не поддерживается.
+        """
+
+        self.mode = mode.lower()
+        if self.mode not in MODES:
+            raise ValueError(f"Режим поиска повторяющихся источников {mode} не поддерживается")
+        self.threshold = threshold
+
+        # количество просмотренных источников
+        self.rows = 0
+        # номера оставленных источников и описания объединенных с ними источников
+        self.groups: dict[int, list[dict[str, Any]]] = {}
+        self.types: dict[int, str] = {}
+
+        self._index: dict[bytes, int] = {}
+        self._signatures: dict[int, array] = {}
+        self._bands: list[dict[int, list[int]]] = [{} for _ in range(BANDS)]
+
+    @property
+    def duplicates(self) -> int:
+        """
+        Количество исключенных источников.
+
+        :return: Количество источников.
+        """
+
+        return sum(len(group) for group in self.groups.values())
+
+    def find(self, index: int, data: Union[BaseModel, BaseRecord]) -> Optional[tuple[int, float]]:
+        """
+        Поиск ранее просмотренного источника, повтором которого является источник (с добавлением его в индекс).
+
+        :param index: Номер источника.
+        :param data: Модель или компактная запись источника.
+        :return: Номер оставленного источника и оценка сходства или `None`, если источник не повторяется.
+        """
+
+        name, fields = key_fields(data)
+        values = [normalize(getattr(data, field), field not in AUTHOR_FIELDS) for field in fields]
+        text = "\x1f".join(values)
+
+        digest = hashlib.blake2b(f"{name}\x1e{text}".encode("utf-8"), digest_size=16).digest()
+        kept = self._index.setdefault(digest, index)
+        if kept != index:
+            return kept, 1.0
+        if self.mode != "fuzzy":
+            return None
+
+        exact = tuple(value for field, value in zip(fields, values) if field in EXACT_FIELDS)
+        current = signature(" ".join(value for field, value in zip(fields, values) if field not in EXACT_FIELDS))
+        # ключи полос включают наименование типа, год и номер выпуска: источники с разными значениями не сравниваются
+        bands = [
+            hash((name, exact, *current[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND])) for band in range(BANDS)
+        ]
+        best: Optional[tuple[int, float]] = None
+        candidates = {candidate for band, key in zip(self._bands, bands) for candidate in band.get(key, ())}
+        for candidate in sorted(candidates):
+            value = similarity(current, self._signatures[candidate])
+            if value >= self.threshold and (best is None or value > best[1]):
+                best = candidate, value
+        if best is not None:
+            # похожий источник в дальнейшем находится по сигнатуре оставленного
+            self._index[digest] = best[0]
+            return best
+
+        self._signatures[index] = current
+        # ячейки полос не ограничены: источник сравнивается со всеми оставленными источниками с совпадающей полосой
+        for band, key in zip(self._bands, bands):
+            band.setdefault(key, []).append(index)
+
+        return None
+
+    def iter_unique(
+        self, items: Iterable[Union[BaseModel, BaseRecord]]
+    ) -> Iterator[Union[BaseModel, BaseRecord]]:
+        """
+        Получение источников без повторов по мере поступления.
+
+        :param items: Модели или компактные записи источников.
+        :return: Итератор источников без повторов.
+        """
+
+        for data in items:
+            index = self.rows
+            self.rows += 1
+            found = self.find(index, data)
+            if found is None:
+                yield data
+                continue
+
+            kept, value = found
+            name, fields = key_fields(data)
+            self.types[kept] = name
+            self.groups.setdefault(kept, []).append(
+                {
+                    "index": index,
+                    "similarity": round(value, 4),
+                    "fields": {field: getattr(data, field) for field in fields},
+                }
+            )
+
+        logger.info("Исключено повторяющихся источников: %s из %s.", self.duplicates, self.rows)
+
+    def unique(self, items: Iterable[Union[BaseModel, BaseRecord]]) -> list[Union[BaseModel, BaseRecord]]:
+        """
+        Получение списка источников без повторов.
+
+        :param items: Модели или компактные записи источников.
+        :return: Список источников без повторов.
+        """
+
+        return list(self.iter_unique(items))
+
+    def save(self, path: str) -> None:
+        """
+        Сохранение отчета об объединенных источниках в формате JSON.
+
+        :param path: Путь к файлу отчета.
+        """
+
+        report = {
+            "version": REPORT_VERSION,
+            "mode": self.mode,
+            "threshold": self.threshold if self.mode == "fuzzy" else None,
+            "rows": self.rows,
+            "duplicates": self.duplicates,
+            "groups": [
+                {"index": kept, "type": self.types[kept], "duplicates": group}
+                for kept, group in sorted(self.groups.items())
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2, default=str)
+        logger.info("Отчет о повторяющихся источниках сохранен: %s.", path)
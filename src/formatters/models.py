@@ -132,3 +132,16 @@ class NewspaperModel(BaseModel):
     year: int = Field(..., gt=0)
     date: str
     issue: int = Field(..., gt=0)
+
+
+# модели источников по наименованиям
+MODELS: dict[str, type[BaseModel]] = {
+    model.__name__: model
+    for model in (
+        BookModel,
+        InternetResourceModel,
+        ArticlesCollectionModel,
+        JournalArticleModel,
+        NewspaperModel,
+    )
+}
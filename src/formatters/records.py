@@ -0,0 +1,150 @@
+"""
+Компактные записи (DTO) со слотами – альтернатива моделям pydantic для больших списков источников.
+
+Записи повторяют поля моделей из `formatters.models`, но не хранят `__dict__` и `__fields_set__`
+и не выполняют валидацию: значения должны быть проверены заранее (например, пакетной проверкой читателя).
+"""
+
+from typing import Any, ClassVar, Type
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    BookModel,
+    InternetResourceModel,
+    ArticlesCollectionModel,
+    JournalArticleModel,
+    NewspaperModel,
+)
+
+
+class BaseRecord:
+    """
+    Базовый класс компактной записи.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    # модель, поля которой повторяет запись, и наименования ее полей
+    # (у записей совпадают со слотами, представления могут хранить значения иначе)
+    model: ClassVar[Type[BaseModel]]
+    fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, **values: Any) -> None:
+        """
+        Конструктор.
+
+        :param values: Значения полей записи (незаданные поля получают значение `None`).
+        """
+
+        for field in self.fields:
+            setattr(self, field, values.get(field))
+
+    @classmethod
+    def construct(cls, **values: Any) -> "BaseRecord":
+        """
+        Создание записи (по аналогии с `BaseModel.construct()`).
+
+        :param values: Значения полей записи.
+        :return: Запись.
+        """
+
+        return cls(**values)
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "BaseRecord":
+        """
+        Создание записи по модели.
+
+        :param model: Модель pydantic.
+        :return: Запись.
+        """
+
+        return cls(**{field: getattr(model, field) for field in cls.fields})
+
+    def to_model(self) -> BaseModel:
+        """
+        Создание модели pydantic по записи (без повторной валидации).
+
+        :return: Модель pydantic.
+        """
+
+        return self.model.construct(**self.dict())
+
+    def dict(self) -> dict:
+        """
+        Получение значений полей записи.
+
+        :return: Значения полей по наименованиям.
+        """
+
+        return {field: getattr(self, field) for field in self.fields}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BaseRecord):
+            return type(self) is type(other) and self.dict() == other.dict()
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.fields)
+
+        return f"{type(self).__name__}({values})"
+
+
+class BookRecord(BaseRecord):
+    """
+    Запись книги (см. :class:`formatters.models.BookModel`).
+    """
+
+    __slots__ = fields = tuple(BookModel.__fields__)
+    model = BookModel
+
+
+class InternetResourceRecord(BaseRecord):
+    """
+    Запись интернет-ресурса (см. :class:`formatters.models.InternetResourceModel`).
+    """
+
+    __slots__ = fields = tuple(InternetResourceModel.__fields__)
+    model = InternetResourceModel
+
+
+class ArticlesCollectionRecord(BaseRecord):
+    """
+    Запись статьи из сборника (см. :class:`formatters.models.ArticlesCollectionModel`).
+    """
+
+    __slots__ = fields = tuple(ArticlesCollectionModel.__fields__)
+    model = ArticlesCollectionModel
+
+
+class JournalArticleRecord(BaseRecord):
+    """
+    Запись статьи из журнала (см. :class:`formatters.models.JournalArticleModel`).
+    """
+
+    __slots__ = fields = tuple(JournalArticleModel.__fields__)
+    model = JournalArticleModel
+
+
+class NewspaperRecord(BaseRecord):
+    """
+    Запись статьи из газеты (см. :class:`formatters.models.NewspaperModel`).
+    """
+
+    __slots__ = fields = tuple(NewspaperModel.__fields__)
+    model = NewspaperModel
+
+
+# соответствие моделей компактным записям
+RECORDS: dict[Type[BaseModel], Type[BaseRecord]] = {
+    record.model: record
+    for record in (
+        BookRecord,
+        InternetResourceRecord,
+        ArticlesCollectionRecord,
+        JournalArticleRecord,
+        NewspaperRecord,
+    )
+}
@@ -0,0 +1,139 @@
+"""
+Внешняя сортировка ключей источников для списков, не помещающихся в памяти.
+
+Ключи накапливаются в памяти до заданного объема и сохраняются во временные файлы отсортированными сериями.
+Серии объединяются слиянием не более чем по `MERGE_FAN_IN` за проход, поэтому количество одновременно
+открытых временных файлов ограничено при любом количестве ключей.
+"""
+import heapq
+import pickle
+import sys
+import tempfile
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# количество ключей, сериализуемых во временный файл за одну операцию
+CHUNK_SIZE = 1024
+
+# максимальное количество серий, объединяемых за один проход слияния
+MERGE_FAN_IN = 64
+
+# значения, размер которых в памяти измеряется `sys.getsizeof` без учета вложенных объектов
+SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def key_size(key: tuple) -> int:
+    """
+    Приблизительный размер ключа сортировки в памяти.
+
+    Строки и числа измеряются `sys.getsizeof`, для остальных значений (моделей, записей, вложенных кортежей)
+    учитывается размер сериализованных данных – именно они сохраняются во временный файл серии.
+
+    :param key: Ключ сортировки.
+    :return: Размер в байтах.
+    """
+
+    return sys.getsizeof(key) + sum(
+        sys.getsizeof(value)
+        if isinstance(value, SCALAR_TYPES)
+        else len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        for value in key
+    )
+
+
+def spill(keys: list[tuple], directory: Optional[str] = None) -> IO[bytes]:
+    """
+    Сортировка ключей и сохранение их во временный файл (отсортированную серию).
+
+    :param keys: Ключи сортировки.
+    :param directory: Директория для временных файлов.
+    :return: Временный файл, установленный на начало серии.
+    """
+
+    keys.sort()
+
+    return write_run(keys, directory)
+
+
+def write_run(keys: Iterable[tuple], directory: Optional[str] = None) -> IO[bytes]:
+    """
+    Сохранение отсортированных ключей во временный файл пакетами по `CHUNK_SIZE`.
+
+    :param keys: Ключи сортировки в порядке сортировки.
+    :param directory: Директория для временных файлов.
+    :return: Временный файл, установленный на начало серии.
+    """
+
+    run = tempfile.TemporaryFile(dir=directory)
+    iterator = iter(keys)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        pickle.dump(chunk, run, protocol=pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+
+    return run
+
+
+def iter_run(run: IO[bytes]) -> Iterator[tuple]:
+    """
+    Чтение ключей отсортированной серии из временного файла.
+
+    :param run: Временный файл серии.
+    :return: Итератор ключей в порядке сортировки.
+    """
+
+    with run:
+        while True:
+            try:
+                chunk = pickle.load(run)
+            except EOFError:
+                return
+            yield from chunk
+
+
+def external_sort(keys: Iterable[tuple], memory_limit: int, directory: Optional[str] = None) -> Iterator[tuple]:
+    """
+    Внешняя сортировка слиянием.
+
+    Ключи накапливаются в памяти до достижения заданного объема, после чего отсортированная серия
+    сохраняется во временный файл. Серии объединяются k-путевым слиянием (не более `MERGE_FAN_IN` серий
+    за проход), порядок результата совпадает с порядком сортировки в памяти.
+
+    :param keys: Ключи сортировки.
+    :param memory_limit: Объем памяти для накопления ключей (в байтах).
+    :param directory: Директория для временных файлов.
+    :return: Итератор ключей в порядке сортировки.
+    """
+
+    runs = []
+    buffer: list[tuple] = []
+    size = 0
+    for key in keys:
+        buffer.append(key)
+        size += key_size(key)
+        if size >= memory_limit:
+            runs.append(spill(buffer, directory))
+            buffer, size = [], 0
+
+    if not runs:
+        # все ключи поместились в памяти
+        buffer.sort()
+        yield from buffer
+        return
+
+    if buffer:
+        runs.append(spill(buffer, directory))
+    del buffer
+
+    logger.info("Слияние отсортированных серий: %s ...", len(runs))
+    # промежуточные проходы объединяют группы серий в более длинные серии
+    while len(runs) > MERGE_FAN_IN:
+        runs = [
+            write_run(heapq.merge(*(iter_run(run) for run in runs[start : start + MERGE_FAN_IN])), directory)
+            for start in range(0, len(runs), MERGE_FAN_IN)
+        ]
+
+    yield from heapq.merge(*(iter_run(run) for run in runs))
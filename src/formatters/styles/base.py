@@ -4,18 +4,61 @@
 
 from abc import ABC, abstractmethod
 from string import Template
+from typing import Any, ClassVar, Optional, Union
 
 from pydantic import BaseModel
 
+from formatters.records import BaseRecord
+
+
+def compile_template(template: Template) -> str:
+    """
+    Преобразование шаблона `string.Template` в строку формата для `str.format_map()`.
+
+    Результат заполнения совпадает с `Template.substitute()`, но разбор шаблона регулярным
+    выражением выполняется один раз.
+
+    :param template: Шаблон для форматирования строки.
+    :raises ValueError: Если шаблон содержит некорректный заполнитель.
+    :return: Строка формата.
+    """
+
+    parts = []
+    position = 0
+    for match in template.pattern.finditer(template.template):
+        parts.append(template.template[position : match.start()].replace("{", "{{").replace("}", "}}"))
+        position = match.end()
+
+        if match.group("escaped") is not None:
+            parts.append(template.delimiter.replace("{", "{{").replace("}", "}}"))
+        elif (name := match.group("named") or match.group("braced")) is not None:
+            parts.append(f"{{{name}}}")
+        else:
+            raise ValueError(f"Некорректный заполнитель в шаблоне: {template.template!r}")
+
+    parts.append(template.template[position:].replace("{", "{{").replace("}", "}}"))
+
+    return "".join(parts)
+
 
 class BaseCitationStyle(ABC):
     """
     Абстрактный базовый класс стиля цитирования.
     """
 
-    def __init__(self, data: BaseModel) -> None:
+    # скомпилированные шаблоны стилей цитирования (общие для всех объектов класса)
+    formats: ClassVar[dict[type, str]] = {}
+
+    def __init__(self, data: Union[BaseModel, BaseRecord], formatted: Optional[str] = None) -> None:
+        """
+        Конструктор.
+
+        :param data: Модель или компактная запись источника.
+        :param formatted: Оформленная строка источника (например, из кэша), если она уже известна.
+        """
+
         self.data = data
-        self.formatted = self.substitute()
+        self.formatted = self.substitute() if formatted is None else formatted
 
     @property
     @abstractmethod
@@ -34,6 +77,34 @@ class BaseCitationStyle(ABC):
         :return:
         """
 
+    def fill(self, **values: Any) -> str:
+        """
+        Заполнение скомпилированного шаблона стиля значениями.
+
+        Шаблон компилируется при первом обращении и сохраняется для класса стиля.
+
+        :param values: Значения заполнителей шаблона.
+        :return: Отформатированная строка.
+        """
+
+        return self.string_format().format_map(values)
+
+    @classmethod
+    def string_format(cls) -> str:
+        """
+        Получение скомпилированного шаблона стиля.
+
+        Шаблон не зависит от оформляемого источника, поэтому для его получения объект создается без данных.
+
+        :return: Строка формата для `str.format_map()`.
+        """
+
+        string_format = cls.formats.get(cls)
+        if string_format is None:
+            string_format = cls.formats[cls] = compile_template(cls.__new__(cls).template)
+
+        return string_format
+
     def __str__(self) -> str:
         return self.formatted
 
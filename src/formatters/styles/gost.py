@@ -2,9 +2,13 @@
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
 from string import Template
+from typing import Iterable, Optional
 
 from pydantic import BaseModel
 
+from formatters.base import BaseCitationFormatter
+from formatters.cache import CitationCache
+from formatters.collation import collation_key
 from formatters.models import (
     BookModel,
     InternetResourceModel,
@@ -12,9 +16,15 @@ from formatters.models import (
     JournalArticleModel,
     NewspaperModel,
 )
+from formatters.records import (
+    BookRecord,
+    InternetResourceRecord,
+    ArticlesCollectionRecord,
+    JournalArticleRecord,
+    NewspaperRecord,
+)
 from formatters.styles.base import BaseCitationStyle
 from logger import get_logger
-from operator import itemgetter, attrgetter
 
 logger = get_logger(__name__)
 
@@ -42,9 +52,9 @@ class GOSTBook(BaseCitationStyle):
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        logger.debug('Форматирование книги "%s" ...', self.data.title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             title=self.data.title,
             edition=self.get_edition(),
@@ -79,9 +89,9 @@ class GOSTInternetResource(BaseCitationStyle):
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
-        return self.template.substitute(
+        return self.fill(
             article=self.data.article,
             website=self.data.website,
             link=self.data.link,
@@ -104,9 +114,9 @@ class GOSTCollectionArticle(BaseCitationStyle):
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             article_title=self.data.article_title,
             collection_title=self.data.collection_title,
@@ -131,9 +141,9 @@ class GOSTJournalArticle(BaseCitationStyle):
         )
 
     def substitute(self) -> str:
-        logger.info('Journal article formatting "%s" ...', self.data.article_title)
+        logger.debug('Journal article formatting "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             article_title=self.data.article_title,
             journal_title=self.data.journal_title,
@@ -157,9 +167,9 @@ class GOSTNewspaper(BaseCitationStyle):
         )
 
     def substitute(self) -> str:
-        logger.info('Newspaper article formatting "%s" ...', self.data.article_title)
+        logger.debug('Newspaper article formatting "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             article_title=self.data.article_title,
             newspaper_title=self.data.newspaper_title,
@@ -169,7 +179,7 @@ class GOSTNewspaper(BaseCitationStyle):
         )
 
 
-class GOSTCitationFormatter:
+class GOSTCitationFormatter(BaseCitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
     """
@@ -180,28 +190,28 @@ class GOSTCitationFormatter:
         ArticlesCollectionModel.__name__: GOSTCollectionArticle,
         JournalArticleModel.__name__: GOSTJournalArticle,
         NewspaperModel.__name__: GOSTNewspaper,
+        # компактные записи со слотами
+        BookRecord.__name__: GOSTBook,
+        InternetResourceRecord.__name__: GOSTInternetResource,
+        ArticlesCollectionRecord.__name__: GOSTCollectionArticle,
+        JournalArticleRecord.__name__: GOSTJournalArticle,
+        NewspaperRecord.__name__: GOSTNewspaper,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
+    def __init__(self, models: Iterable[BaseModel], cache: Optional[CitationCache] = None) -> None:
         """
         Конструктор.
 
-        :param models: Список объектов для форматирования
+        :param models: Список (или итератор) объектов для форматирования
+        :param cache: Кэш оформленных источников
         """
 
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
+        super().__init__(self.iter_build(models), cache)
 
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
+    # префиксы ключей сортировки по стилям оформления (порядок типов источников)
+    sort_prefixes = {style: bytes([SORT_ORDER[style.__name__]]) for style in set(formatters_map.values())}
 
-        :return:
-        """
-        return sorted(
-            self.formatted_items,
-            key=lambda item: (SORT_ORDER[type(item).__name__], item.formatted),
-        )
+    def sort_key(self, item: BaseCitationStyle) -> tuple:
+        # ключ сопоставления вычисляется один раз для источника, сортировка сравнивает байтовые строки;
+        # оформленная строка упорядочивает источники с совпадающими ключами
+        return self.sort_prefixes[type(item)] + collation_key(item.formatted), item.formatted
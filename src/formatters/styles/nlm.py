@@ -2,16 +2,14 @@
 National Library of Medicine citation format
 """
 from string import Template
+from typing import Iterable, Optional
 
 from pydantic import BaseModel
 
-from formatters.models import (
-    BookModel,
-    InternetResourceModel,
-    ArticlesCollectionModel,
-    JournalArticleModel,
-    NewspaperModel,
-)
+from formatters.base import BaseCitationFormatter
+from formatters.cache import CitationCache
+from formatters.models import JournalArticleModel, NewspaperModel
+from formatters.records import JournalArticleRecord, NewspaperRecord
 from formatters.styles.base import BaseCitationStyle
 from logger import get_logger
 
@@ -32,9 +30,9 @@ class NLMJournalArticle(BaseCitationStyle):
         )
 
     def substitute(self) -> str:
-        logger.info('Journal article formatting "%s" ...', self.data.article_title)
+        logger.debug('Journal article formatting "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             article_title=self.data.article_title,
             journal_title=self.data.journal_title,
@@ -58,9 +56,9 @@ class NLMNewspaper(BaseCitationStyle):
         )
 
     def substitute(self) -> str:
-        logger.info('Newspaper article formatting "%s" ...', self.data.article_title)
+        logger.debug('Newspaper article formatting "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
+        return self.fill(
             authors=self.data.authors,
             article_title=self.data.article_title,
             newspaper_title=self.data.newspaper_title,
@@ -70,7 +68,7 @@ class NLMNewspaper(BaseCitationStyle):
         )
 
 
-class NLMCitationFormatter:
+class NLMCitationFormatter(BaseCitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
     """
@@ -78,29 +76,23 @@ class NLMCitationFormatter:
     formatters_map = {
         JournalArticleModel.__name__: NLMJournalArticle,
         NewspaperModel.__name__: NLMNewspaper,
+        # компактные записи со слотами
+        JournalArticleRecord.__name__: NLMJournalArticle,
+        NewspaperRecord.__name__: NLMNewspaper,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
+    def __init__(self, models: Iterable[BaseModel], cache: Optional[CitationCache] = None) -> None:
         """
         Конструктор.
 
-        :param models: Список объектов для форматирования
+        :param models: Список (или итератор) объектов для форматирования
+        :param cache: Кэш оформленных источников
         """
 
-        formatted_items = []
-        for model in models:
-            logger.info("model: " + str(model))
-            logger.info("model type: " + str(type(model)))
+        super().__init__(self.iter_build(models), cache)
 
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
+    def build(self, model: BaseModel, formatted: Optional[str] = None) -> BaseCitationStyle:
+        logger.debug("model: %s", model)
+        logger.debug("model type: %s", type(model))
 
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
-
-        :return:
-        """
-
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        return super().build(model, formatted)
@@ -0,0 +1,229 @@
+"""
+Инкрементальная сборка списка источников.
+
+Рядом с выходным файлом сохраняется манифест с отпечатками листов и строк входного файла
+и ключами сортировки оформленных строк. При повторном запуске листы, отпечаток которых не изменился,
+не читаются, а на измененных листах оформляются только новые или измененные строки.
+
+Отпечаток листа .xlsx включает контрольные суммы таблицы общих строк и стилей (см. `SourcesReader.checksums`),
+поэтому их изменение (например, новая строка текста на любом листе) приводит к повторному чтению всех листов.
+Строки, значения которых не изменились, при этом повторно не оформляются: их отпечатки совпадают с манифестом.
+"""
+import heapq
+import json
+import os
+from typing import Any, Optional, Sequence, Type
+
+from pydantic import ValidationError
+
+from formatters.base import BaseCitationFormatter
+from formatters.cache import CitationCache
+from logger import get_logger
+from readers.base import BaseReader, row_fingerprint
+from readers.reader import SourcesReader
+from readers.validation import CellError, ColumnRule, RowError, SheetValidationError
+
+logger = get_logger(__name__)
+
+# версия формата манифеста
+MANIFEST_VERSION = 3
+
+# суффикс файла манифеста (добавляется к пути выходного файла)
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def dump_key(key: Sequence) -> list:
+    """
+    Преобразование ключа сортировки для сохранения в JSON.
+
+    :param key: Ключ сортировки.
+    :return: Ключ, в котором байтовые строки (ключи сопоставления) заменены словарями с шестнадцатеричным значением.
+    """
+
+    return [{"hex": part.hex()} if isinstance(part, bytes) else part for part in key]
+
+
+def load_key(key: Sequence) -> tuple:
+    """
+    Восстановление ключа сортировки, сохраненного в JSON.
+
+    :param key: Ключ сортировки из манифеста.
+    :return: Ключ сортировки.
+    """
+
+    return tuple(bytes.fromhex(part["hex"]) if isinstance(part, dict) else part for part in key)
+
+
+class IncrementalBuild:
+    """
+    Инкрементальная сборка списка источников по манифесту предыдущего запуска.
+    """
+
+    def __init__(self, reader: SourcesReader, citation_style: str, output_format: str, path: str) -> None:
+        """
+        Конструктор.
+
+        :param reader: Читатель исходного файла.
+        :param citation_style: Стиль цитирования.
+        :param output_format: Формат выходного файла.
+        :param path: Путь к файлу манифеста.
+        """
+
+        self.reader = reader
+        self.citation_style = citation_style
+        self.output_format = output_format
+        self.path = path
+
+        # изменились ли листы входного файла или параметры сборки с предыдущего запуска
+        self.changed = False
+        # листы (отпечаток и пары «отпечаток строки – ключ сортировки» в порядке сортировки)
+        self.sheets: dict[str, dict] = {}
+
+    def load(self) -> dict[str, dict]:
+        """
+        Загрузка листов из манифеста предыдущего запуска.
+
+        Манифест другой версии, стиля цитирования или формата выходного файла не используется.
+
+        :return: Листы манифеста (пустой словарь, если манифест отсутствует или не подходит).
+        """
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if (manifest.get("version"), manifest.get("citation"), manifest.get("format")) != (
+            MANIFEST_VERSION,
+            self.citation_style,
+            self.output_format,
+        ):
+            return {}
+
+        sheets: dict[str, Any] = manifest["sheets"]
+        for sheet in sheets.values():
+            sheet["rows"] = [(row, load_key(key)) for row, key in sheet["rows"]]
+
+        return sheets
+
+    def format(self, formatter: Type[BaseCitationFormatter], cache: Optional[CitationCache] = None) -> list[str]:
+        """
+        Получение оформленного списка источников с повторной обработкой только измененных строк.
+
+        Значения строк извлекаются и проверяются так же, как при чтении исходного файла
+        (с учетом параметров `bulk` и `records` читателя).
+
+        :param formatter: Класс итогового форматирования списка источников.
+        :param cache: Кэш оформленных источников.
+        :raises SheetValidationError: Если на измененном листе есть строки с ошибками (с указанием листа и строки).
+        :return: Оформленные строки источников в порядке сортировки.
+        """
+
+        previous = self.load()
+        # читатели создаются без рабочей книги: она загружается, только если есть измененные листы
+        readers = [
+            reader(None, self.reader.bulk, self.reader.records)  # type: ignore
+            for reader in self.reader.get_readers(self.citation_style)
+        ]
+        self.changed = set(previous) != {sheet_reader.sheet for sheet_reader in readers}
+        for sheet_reader in readers:
+            sheet = sheet_reader.sheet
+            fingerprint = self.reader.sheet_fingerprint(sheet)
+            old = previous.get(sheet)
+            if old is not None and old["fingerprint"] == fingerprint:
+                logger.info("Лист «%s» не изменился.", sheet)
+                self.sheets[sheet] = old
+                continue
+
+            self.changed = True
+            sheet_reader.workbook = self.reader.workbook
+            known = dict(old["rows"]) if old is not None else {}
+            rows: list[tuple[str, Optional[tuple]]] = []
+            changed: list[dict] = []
+            numbers: list[int] = []
+            errors: list[RowError] = []
+            for number, attrs in sheet_reader.iter_extract():
+                if isinstance(attrs, CellError):
+                    errors.append(RowError(sheet, number, attrs.field, str(attrs)))
+                    continue
+
+                key = known.get(fingerprint_row := row_fingerprint(attrs.values()))
+                rows.append((fingerprint_row, key))
+                if key is None:
+                    changed.append(attrs)
+                    numbers.append(number)
+
+            # оформление только новых и измененных строк
+            models = self.build_models(sheet_reader, changed, numbers, errors)
+            if errors:
+                errors.sort(key=lambda error: error.row)
+                raise SheetValidationError(errors)
+
+            # оформление завершается до сборки строк листа: последний пакет записывается в кэш сразу,
+            # а ключи выдаются в порядке измененных строк
+            citation_formatter = formatter(models, cache)
+            keys = iter([citation_formatter.sort_key(item) for item in citation_formatter.formatted_items])
+            citation_formatter.log_summary()
+            rows = [(fingerprint_row, key or next(keys)) for fingerprint_row, key in rows]
+
+            rows.sort(key=lambda pair: pair[1])
+            self.sheets[sheet] = {"fingerprint": fingerprint, "rows": rows}
+            logger.info("Лист «%s»: строк – %s, оформлено заново – %s.", sheet, len(rows), len(changed))
+
+        # листы упорядочены по ключам сортировки, поэтому общий порядок получается слиянием
+        merged = heapq.merge(*(sheet["rows"] for sheet in self.sheets.values()), key=lambda pair: pair[1])
+
+        return [key[-1] for _, key in merged]
+
+    @staticmethod
+    def build_models(
+        sheet_reader: BaseReader, records: list[dict], numbers: list[int], errors: list[RowError]
+    ) -> list[Any]:
+        """
+        Создание моделей (или компактных записей) новых и измененных строк листа.
+
+        :param sheet_reader: Читатель листа.
+        :param records: Значения атрибутов строк.
+        :param numbers: Номера строк на листе.
+        :param errors: Список для добавления найденных ошибок.
+        :return: Модели корректных строк.
+        """
+
+        if sheet_reader.bulk:
+            rules = ColumnRule.compile(sheet_reader.model, sheet_reader.plan.fields)
+            return list(sheet_reader.build_batch(rules, records, numbers, errors))
+
+        models = []
+        for number, attrs in zip(numbers, records):
+            try:
+                models.append(sheet_reader.model(**attrs))
+            except ValidationError as error:
+                errors.extend(
+                    RowError(sheet_reader.sheet, number, ".".join(map(str, item["loc"])), item["msg"])
+                    for item in error.errors()
+                )
+
+        return models
+
+    def save(self) -> None:
+        """
+        Сохранение манифеста (запись выполняется через временный файл).
+        """
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "citation": self.citation_style,
+            "format": self.output_format,
+            "sheets": {
+                name: {
+                    "fingerprint": sheet["fingerprint"],
+                    "rows": [(row, dump_key(key)) for row, key in sheet["rows"]],
+                }
+                for name, sheet in self.sheets.items()
+            },
+        }
+
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False)
+        os.replace(f"{self.path}.tmp", self.path)
@@ -1,10 +1,104 @@
 """
 Функции для логирования.
+
+Записи логов передаются через очередь в фоновый поток (`QueueListener`), который выполняет
+запись в файлы и вывод в консоль, поэтому вызовы логирования не блокируются на операциях ввода-вывода.
+
+Фоновый обработчик запускается при первой записи, а файлы логов открываются при первой записи в них,
+поэтому импорт модулей и запуск команд, которые ничего не записывают, не создают потоков и файлов.
 """
+import atexit
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
 
+# очередь записей логов, обработчики записей и фоновый обработчик очереди (общие для процесса)
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_handlers: list[logging.Handler] = []
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+def start() -> None:
+    """
+    Запуск фонового обработчика очереди записей логов (если он еще не запущен).
+    """
+
+    global _listener  # pylint: disable=global-statement
+
+    with _lock:
+        if _listener is None:
+            _listener = QueueListener(_queue, *_handlers, respect_handler_level=True)
+            _listener.start()
+        else:
+            _listener.handlers = tuple(_handlers)
+
+
+def shutdown() -> None:
+    """
+    Остановка фонового обработчика с записью всех записей, оставшихся в очереди.
+
+    Обработчики закрываются и будут открыты повторно при следующем запуске.
+    """
+
+    global _listener  # pylint: disable=global-statement
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        for handler in _handlers:
+            # поток обработчика может быть уже закрыт при завершении интерпретатора (как в `logging.shutdown`)
+            try:
+                handler.flush()
+                handler.close()
+            except (OSError, ValueError):
+                pass
+
+
+def _restart_in_child() -> None:
+    """
+    Сброс фонового обработчика в дочернем процессе (поток обработчика не наследуется при `fork`).
+
+    Фоновый обработчик дочернего процесса запускается при первой записи.
+    """
+
+    global _listener, _lock  # pylint: disable=global-statement
+
+    # блокировка могла быть захвачена другим потоком родительского процесса в момент `fork`
+    _lock = threading.Lock()
+    _listener = None
+
+    # дочерние процессы `multiprocessing` завершаются без вызова обработчиков `atexit`
+    from multiprocessing.util import Finalize  # pylint: disable=import-outside-toplevel
+
+    Finalize(None, shutdown, exitpriority=0)
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Передача записей в очередь с запуском фонового обработчика при первой записи.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Передача записи в очередь.
+
+        :param record: Запись лога.
+        """
+
+        if _listener is None:
+            start()
+        super().enqueue(record)
+
+
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_restart_in_child)
+
 
 def get_logger(
     module_name: str,
@@ -14,22 +108,35 @@ def get_logger(
     """
     Настройка логгера.
 
+    Обработчики добавляются один раз для модуля: повторный вызов возвращает настроенный логгер.
+
     :param module_name: Наименование модуля
     :param logging_level: Уровень логирования
     :param logging_format: Формат логов
     :return:
     """
 
-    # запись логов в файлы
     logger = logging.getLogger(module_name)
     logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
-    file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
+    if any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+        return logger
 
     # вывод логов в консоль
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
+    if not _handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(logging_format))
+        _handlers.append(stream_handler)
+
+    # запись логов в файлы (в файл модуля попадают только записи его логгера)
+    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log", delay=True)
+    file_handler.setFormatter(logging.Formatter(logging_format))
+    file_handler.addFilter(logging.Filter(module_name))
+    _handlers.append(file_handler)
+    if _listener is not None:
+        # обработчик нового модуля добавляется в уже запущенный фоновый обработчик
+        start()
+
+    # передача записей в очередь фонового обработчика
+    logger.addHandler(LazyQueueHandler(_queue))
 
     return logger
@@ -1,19 +1,37 @@
 """
 Запуск приложения.
+
+Модули форматирования, чтения и генерации выходного файла (а с ними openpyxl, python-docx и pydantic)
+импортируются при выполнении команды, а не при загрузке модуля, поэтому вывод справки и проверка параметров
+не тратят время на импорт зависимостей.
 """
+import os
+import sys
 from enum import Enum, unique
+from typing import TYPE_CHECKING, Iterable, Optional, Sized, Type, Union
 
 import click
 
-from formatters.styles.gost import GOSTCitationFormatter
-from formatters.styles.nlm import NLMCitationFormatter
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import Renderer
-from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH
+from outputs import ENGINES, OUTPUT_FORMATS
+from settings import CITATION_CACHE_PATH, INPUT_FILE_PATH, OUTPUT_FILE_PATH, SNAPSHOT_PATH, SORT_MEMORY_LIMIT
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from formatters.base import BaseCitationFormatter
+    from formatters.cache import CitationCache
+    from formatters.records import BaseRecord
+    from formatters.styles.base import BaseCitationStyle
+    from incremental import IncrementalBuild
+    from readers.reader import SourcesReader
+    from renderer import Renderer, TextRenderer
 
 logger = get_logger(__name__)
 
+# режимы поиска повторяющихся источников (`formatters.deduplication.MODES`)
+DEDUPLICATION_MODES = ("exact", "fuzzy")
+
 
 @unique
 class CitationEnum(Enum):
@@ -27,6 +45,237 @@ class CitationEnum(Enum):
     APA = "apa"  # American Psychological Association
 
 
+def get_formatter(citation: str) -> tuple[str, Type["BaseCitationFormatter"]]:
+    """
+    Получение наименования стиля цитирования для читателей и класса итогового форматирования.
+
+    :param citation: Стиль цитирования (наименование элемента `CitationEnum`, без учета регистра).
+    :raises ValueError: Если стиль цитирования не поддерживается.
+    :return: Наименование стиля цитирования и класс итогового форматирования.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    match citation.upper():
+        case CitationEnum.GOST.name:
+            from formatters.styles.gost import GOSTCitationFormatter
+
+            return "gost", GOSTCitationFormatter
+        case CitationEnum.NLM.name:
+            from formatters.styles.nlm import NLMCitationFormatter
+
+            return "nlm", NLMCitationFormatter
+
+    raise ValueError(f"Стиль цитирования {citation} не поддерживается")
+
+
+def get_renderer(output_format: str, engine: str = "docx") -> Union[Type["Renderer"], Type["TextRenderer"]]:
+    """
+    Получение класса генерации выходного файла.
+
+    :param output_format: Формат выходного файла (без учета регистра).
+    :param engine: Способ генерации Word-файла (для формата docx).
+    :raises KeyError: Если формат или способ генерации не поддерживается.
+    :return: Класс генерации выходного файла.
+    """
+
+    from renderer import FORMATS, RENDERERS  # pylint: disable=import-outside-toplevel
+
+    output_format = output_format.lower()
+
+    return RENDERERS[engine.lower()] if output_format == "docx" else FORMATS[output_format]
+
+
+def preload() -> None:
+    """
+    Импорт модулей всех этапов обработки.
+
+    Используется перед запуском пула процессов, чтобы рабочие процессы наследовали загруженные модули.
+    """
+
+    # pylint: disable=import-outside-toplevel,unused-import
+    import formatters.cache
+    import formatters.deduplication
+    import formatters.styles.gost
+    import formatters.styles.nlm
+    import incremental
+    import readers.reader
+    import renderer
+
+
+def generate(
+    citation: str = CitationEnum.GOST.name,
+    path_input: str = INPUT_FILE_PATH,
+    path_output: str = OUTPUT_FILE_PATH,
+    streaming: bool = False,
+    bulk: bool = False,
+    records: bool = False,
+    lazy: bool = False,
+    sort_memory: int = SORT_MEMORY_LIMIT,
+    workers: int = 0,
+    engine: str = "docx",
+    output_format: str = "docx",
+    cache_path: str = CITATION_CACHE_PATH,
+    incremental: bool = False,
+    profile: bool = False,
+    profile_cpu: bool = False,
+    dedup: Optional[str] = None,
+    snapshot_path: str = SNAPSHOT_PATH,
+) -> None:
+    """
+    Генерация выходного файла с оформленным библиографическим списком (параметры – как у `process_input`).
+
+    Функция не зависит от разбора командной строки и используется как в команде обработки одного файла,
+    так и в пакетной обработке.
+
+    :param str citation: Стиль цитирования
+    :param str path_input: Путь к входному файлу
+    :param str path_output: Путь к выходному файлу («-» – стандартный вывод)
+    :param bool streaming: Потоковое чтение входного файла
+    :param bool bulk: Пакетная проверка значений по столбцам
+    :param bool records: Компактные записи со слотами вместо моделей pydantic
+    :param bool lazy: Ленивая обработка (в памяти хранятся только ключи сортировки)
+    :param int sort_memory: Объем памяти для сортировки в мегабайтах (0 – сортировка в памяти)
+    :param int workers: Количество процессов для параллельного чтения листов (0 – последовательное чтение)
+    :param str engine: Способ генерации Word-файла
+    :param str output_format: Формат выходного файла
+    :param str cache_path: Путь к файлу кэша оформленных источников (пустое значение – без кэша)
+    :param bool incremental: Инкрементальная сборка по манифесту предыдущего запуска
+    :param bool profile: Отчет о времени и памяти этапов обработки рядом с выходным файлом
+    :param bool profile_cpu: Профилирование вызовов функций (cProfile) с сохранением профиля рядом с выходным файлом
+    :param Optional[str] dedup: Режим исключения повторяющихся источников (`None` – без исключения)
+    :param str snapshot_path: Путь к файлу снимка прочитанных источников (пустое значение – без снимка)
+    :raises ValueError: Если сочетание параметров не поддерживается.
+    """
+
+    # параметры запуска для отчета о производительности
+    parameters = dict(locals())
+
+    # pylint: disable=import-outside-toplevel
+    from profiler import Profiler
+
+    if (profile or profile_cpu) and path_output == "-":
+        raise ValueError("Отчет о производительности не поддерживается для стандартного вывода")
+    profiler = Profiler(profile, profile_cpu)
+    profiler.start()
+
+    reader: Optional["SourcesReader"] = None
+    cache: Optional["CitationCache"] = None
+    # исходный файл, снимок и кэш закрываются, а измерения завершаются и при ошибке на любом этапе
+    try:
+        with profiler.stage("import"):
+            from formatters.cache import CitationCache
+            from formatters.deduplication import DUPLICATES_SUFFIX, Deduplicator
+            from incremental import MANIFEST_SUFFIX, IncrementalBuild
+            from readers.reader import SourcesReader
+
+            citation_style, formatter = get_formatter(citation)
+            renderer = get_renderer(output_format, engine)
+
+        output_format = output_format.lower()
+        if incremental and (renderer.structured or path_output == "-"):
+            raise ValueError(
+                "Инкрементальная сборка не поддерживается для стандартного вывода и форматов с атрибутами источников"
+            )
+        if incremental and dedup:
+            raise ValueError("Инкрементальная сборка не поддерживается при исключении повторяющихся источников")
+        if snapshot_path and (incremental or workers):
+            raise ValueError("Снимок источников не поддерживается при инкрементальной сборке и параллельном чтении")
+        deduplicator = Deduplicator(dedup) if dedup else None
+
+        lazy = lazy or bool(sort_memory)
+        # при инкрементальной сборке листы читаются потоково и только при изменении
+        reader = SourcesReader(
+            path_input, read_only=streaming or incremental, bulk=bulk, records=records, snapshot=snapshot_path or None
+        )
+        cache = CitationCache(cache_path) if cache_path else None
+
+        build: Optional["IncrementalBuild"] = None
+        citation_formatter: Optional["BaseCitationFormatter"] = None
+        formatted_models: Iterable[Union[str, "BaseCitationStyle"]]
+        if incremental:
+            with profiler.stage("incremental") as stats:
+                build = IncrementalBuild(reader, citation_style, output_format, f"{path_output}{MANIFEST_SUFFIX}")
+                formatted_models = build.format(formatter, cache)
+                stats["rows"] = len(formatted_models)
+        else:
+            models: Iterable[Union["BaseModel", "BaseRecord"]]
+            if workers:
+                # листы читаются параллельно, модели объединяются в порядке регистрации читателей
+                with profiler.stage("read_parallel") as stats:
+                    models = reader.read_parallel(citation_style, workers)
+                    stats["rows"] = len(models)
+            elif lazy:
+                # чтение и оформление выполняются по мере генерации выходного файла (учитываются в ее этапе)
+                models = reader.iter_read(citation_style)
+            else:
+                if snapshot_path:
+                    # рабочая книга загружается, только если снимок отсутствует или устарел
+                    with profiler.stage("load_snapshot"):
+                        reader.snapshot  # pylint: disable=pointless-statement
+                else:
+                    with profiler.stage("load_workbook"):
+                        reader.workbook  # pylint: disable=pointless-statement
+                with profiler.stage("read") as stats:
+                    models = reader.read(citation_style)
+                    stats["rows"] = len(models)
+
+            if deduplicator is not None:
+                if lazy:
+                    # повторы исключаются по мере чтения источников
+                    models = deduplicator.iter_unique(models)
+                else:
+                    with profiler.stage("deduplicate") as stats:
+                        models = deduplicator.unique(models)
+                        stats.update(rows=deduplicator.rows, duplicates=deduplicator.duplicates)
+
+            citation_formatter = formatter(models, cache)
+            if lazy:
+                # модели и оформленные строки передаются между этапами в виде итераторов
+                formatted_models = citation_formatter.iter_format(
+                    sort_memory * 1024 * 1024, items=renderer.structured
+                )
+            else:
+                with profiler.stage("format") as stats:
+                    items = citation_formatter.format()
+                    formatted_models = items if renderer.structured else tuple(str(item) for item in items)
+                    # время оформления источников по стилям, остальное время этапа – сортировка
+                    stats.update(
+                        rows=len(items), substitute_seconds=round(sum(citation_formatter.timings.values()), 4)
+                    )
+                if profiler.enabled:
+                    stats["sort_seconds"] = round(stats["seconds"] - stats["substitute_seconds"], 4)
+
+        if build is not None and not build.changed and os.path.exists(path_output):
+            logger.info("Входной файл не изменился, генерация выходного файла пропущена.")
+        else:
+            logger.info("Генерация выходного файла ...")
+            with profiler.stage("render") as stats:
+                renderer(formatted_models).render(sys.stdout.buffer if path_output == "-" else path_output)
+                if isinstance(formatted_models, Sized):
+                    stats["rows"] = len(formatted_models)
+                elif citation_formatter is not None:
+                    stats["rows"] = sum(citation_formatter.counts.values())
+                    # при ленивой обработке чтение, оформление и сортировка выполняются по мере генерации
+                    # и отдельно не измеряются: в отчете указываются этапы, вошедшие в генерацию,
+                    # и время оформления источников по стилям
+                    stats.update(
+                        includes=["read", *(["deduplicate"] if deduplicator else []), "format", "sort"],
+                        substitute_seconds=round(sum(citation_formatter.timings.values()), 4),
+                    )
+
+        if deduplicator is not None and path_output != "-":
+            # отчет об объединенных источниках (при ленивой обработке – после генерации выходного файла)
+            deduplicator.save(f"{path_output}{DUPLICATES_SUFFIX}")
+        if build is not None:
+            build.save()
+    finally:
+        if reader is not None:
+            reader.close()
+        if cache is not None:
+            cache.close()
+        profiler.stop(path_output, parameters)
+
+
 @click.command()
 @click.option(
     "--citation",
@@ -44,7 +293,8 @@ class CitationEnum(Enum):
     type=str,
     default=INPUT_FILE_PATH,
     show_default=True,
-    help="Путь к входному файлу",
+    help="Путь к входному файлу (рабочей книге Excel, директории с таблицами листов «<лист>.csv», "
+    "«<лист>.parquet», «<лист>.arrow» или отдельной таблице «<лист>.csv»)",
 )
 @click.option(
     "--path_output",
@@ -53,45 +303,222 @@ class CitationEnum(Enum):
     type=str,
     default=OUTPUT_FILE_PATH,
     show_default=True,
-    help="Путь к выходному файлу",
+    help="Путь к выходному файлу («-» – стандартный вывод)",
+)
+@click.option(
+    "--streaming",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковое чтение входного файла в режиме только для чтения",
+)
+@click.option(
+    "--bulk",
+    "bulk",
+    is_flag=True,
+    default=False,
+    help="Пакетная проверка значений по столбцам и создание моделей без построчной валидации",
+)
+@click.option(
+    "--records",
+    "records",
+    is_flag=True,
+    default=False,
+    help="Компактные записи со слотами вместо моделей pydantic (включает пакетную проверку значений)",
+)
+@click.option(
+    "--lazy",
+    "lazy",
+    is_flag=True,
+    default=False,
+    help="Ленивая обработка: этапы передают данные друг другу в виде итераторов",
+)
+@click.option(
+    "--sort_memory",
+    "-sm",
+    "sort_memory",
+    type=click.IntRange(min=0),
+    default=SORT_MEMORY_LIMIT,
+    show_default=True,
+    help="Объем памяти для сортировки (МБ), при превышении которого используется внешняя сортировка "
+    "(0 – сортировка в памяти). Включает ленивую обработку",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Количество процессов для параллельного чтения листов входного файла (0 – последовательное чтение)",
+)
+@click.option(
+    "--engine",
+    "-e",
+    "engine",
+    type=click.Choice(ENGINES, case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Способ генерации Word-файла: docx – построчно средствами python-docx, bulk – пакетная потоковая запись "
+    "абзацев в архив",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Формат выходного файла: docx – Word, txt – простой текст, html – HTML, "
+    "jsonl – JSON Lines с атрибутами источников, bibtex – BibTeX",
+)
+@click.option(
+    "--cache",
+    "cache_path",
+    type=str,
+    default=CITATION_CACHE_PATH,
+    show_default=True,
+    help="Путь к файлу кэша оформленных источников (SQLite), пустое значение – без кэша",
+)
+@click.option(
+    "--incremental",
+    "incremental",
+    is_flag=True,
+    default=False,
+    help="Инкрементальная сборка: повторно обрабатываются только измененные листы и строки "
+    "(манифест сохраняется рядом с выходным файлом)",
+)
+@click.option(
+    "--profile",
+    "profile",
+    is_flag=True,
+    default=False,
+    help="Отчет о времени, количестве строк и памяти этапов обработки в формате JSON "
+    "(сохраняется рядом с выходным файлом, трассировка памяти замедляет обработку)",
+)
+@click.option(
+    "--profile_cpu",
+    "profile_cpu",
+    is_flag=True,
+    default=False,
+    help="Профилирование вызовов функций средствами cProfile (профиль сохраняется рядом с выходным файлом, "
+    "включает отчет о производительности)",
+)
+@click.option(
+    "--dedup",
+    "dedup",
+    type=click.Choice(DEDUPLICATION_MODES, case_sensitive=False),
+    default=None,
+    help="Исключение повторяющихся источников: exact – совпадение нормализованных ключевых полей, "
+    "fuzzy – дополнительно похожие источники (MinHash/LSH). Отчет сохраняется рядом с выходным файлом",
+)
+@click.option(
+    "--snapshot",
+    "snapshot_path",
+    type=str,
+    default=SNAPSHOT_PATH,
+    show_default=True,
+    help="Путь к файлу двоичного снимка прочитанных источников всех стилей цитирования: пока листы входного файла "
+    "не изменились, источники загружаются из снимка без чтения рабочей книги (пустое значение – без снимка)",
 )
 def process_input(
     citation: str = CitationEnum.GOST.name,
     path_input: str = INPUT_FILE_PATH,
     path_output: str = OUTPUT_FILE_PATH,
+    streaming: bool = False,
+    bulk: bool = False,
+    records: bool = False,
+    lazy: bool = False,
+    sort_memory: int = SORT_MEMORY_LIMIT,
+    workers: int = 0,
+    engine: str = "docx",
+    output_format: str = "docx",
+    cache_path: str = CITATION_CACHE_PATH,
+    incremental: bool = False,
+    profile: bool = False,
+    profile_cpu: bool = False,
+    dedup: Optional[str] = None,
+    snapshot_path: str = SNAPSHOT_PATH,
 ) -> None:
     """
     Генерация файла Word с оформленным библиографическим списком.
 
     :param str citation: Стиль цитирования
     :param str path_input: Путь к входному файлу
-    :param str path_output: Путь к выходному файлу
+    :param str path_output: Путь к выходному файлу («-» – стандартный вывод)
+    :param bool streaming: Потоковое чтение входного файла
+    :param bool bulk: Пакетная проверка значений по столбцам
+    :param bool records: Компактные записи со слотами вместо моделей pydantic
+    :param bool lazy: Ленивая обработка (в памяти хранятся только ключи сортировки)
+    :param int sort_memory: Объем памяти для сортировки в мегабайтах (0 – сортировка в памяти)
+    :param int workers: Количество процессов для параллельного чтения листов (0 – последовательное чтение)
+    :param str engine: Способ генерации Word-файла
+    :param str output_format: Формат выходного файла
+    :param str cache_path: Путь к файлу кэша оформленных источников (пустое значение – без кэша)
+    :param bool incremental: Инкрементальная сборка по манифесту предыдущего запуска
+    :param bool profile: Отчет о времени и памяти этапов обработки рядом с выходным файлом
+    :param bool profile_cpu: Профилирование вызовов функций (cProfile) с сохранением профиля рядом с выходным файлом
+    :param Optional[str] dedup: Режим исключения повторяющихся источников (`None` – без исключения)
+    :param str snapshot_path: Путь к файлу снимка прочитанных источников (пустое значение – без снимка)
     """
 
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
-        - Путь к выходному файлу: %s.""",
+        - Путь к выходному файлу: %s.
+        - Потоковое чтение: %s.
+        - Пакетная проверка значений: %s.
+        - Компактные записи: %s.
+        - Ленивая обработка: %s.
+        - Объем памяти для сортировки, МБ: %s.
+        - Количество процессов чтения: %s.
+        - Способ генерации выходного файла: %s.
+        - Формат выходного файла: %s.
+        - Кэш оформленных источников: %s.
+        - Инкрементальная сборка: %s.
+        - Отчет о производительности: %s.
+        - Профилирование вызовов функций: %s.
+        - Исключение повторяющихся источников: %s.
+        - Снимок источников: %s.""",
         citation,
         path_input,
         path_output,
+        streaming,
+        bulk,
+        records,
+        lazy,
+        sort_memory,
+        workers,
+        engine,
+        output_format,
+        cache_path,
+        incremental,
+        profile,
+        profile_cpu,
+        dedup,
+        snapshot_path,
     )
 
-    match citation:
-        case CitationEnum.GOST.name:
-            models = SourcesReader(path_input).read("gost")
-            formatted_models = tuple(
-                str(item) for item in GOSTCitationFormatter(models).format()
-            )
-        case CitationEnum.NLM.name:
-            models = SourcesReader(path_input).read("nlm")
-            formatted_models = tuple(
-                str(item) for item in NLMCitationFormatter(models).format()
-            )
-
-    logger.info("Генерация выходного файла ...")
-    Renderer(formatted_models).render(path_output)
+    generate(
+        citation,
+        path_input,
+        path_output,
+        streaming,
+        bulk,
+        records,
+        lazy,
+        sort_memory,
+        workers,
+        engine,
+        output_format,
+        cache_path,
+        incremental,
+        profile,
+        profile_cpu,
+        dedup,
+        snapshot_path,
+    )
 
     logger.info("Команда успешно завершена.")
 
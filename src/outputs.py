@@ -0,0 +1,24 @@
+"""
+Наименования способов генерации Word-файла и форматов выходного файла.
+
+Модуль не импортирует python-docx и lxml, поэтому наименования используются для проверки параметров командной строки
+без загрузки модуля `renderer`, а классы генерации (`renderer.RENDERERS` и `renderer.FORMATS`) строятся по ним же.
+"""
+
+# способы генерации Word-файла и наименования классов модуля `renderer`
+RENDERER_CLASSES: dict[str, str] = {
+    "docx": "Renderer",
+    "bulk": "BulkRenderer",
+}
+
+# форматы выходного файла (кроме Word) и наименования классов модуля `renderer`
+FORMAT_CLASSES: dict[str, str] = {
+    "txt": "PlainTextRenderer",
+    "html": "HTMLRenderer",
+    "jsonl": "JSONLinesRenderer",
+    "bibtex": "BibTeXRenderer",
+}
+
+# способы генерации Word-файла и форматы выходного файла
+ENGINES: tuple[str, ...] = tuple(RENDERER_CLASSES)
+OUTPUT_FORMATS: tuple[str, ...] = ("docx", *FORMAT_CLASSES)
@@ -0,0 +1,181 @@
+"""
+Инструментирование этапов обработки.
+
+Для каждого этапа измеряются время (общее и процессорное), количество обработанных строк,
+объем памяти Python (tracemalloc) и резидентной памяти процесса. Отчет сохраняется в JSON рядом
+с выходным файлом, при необходимости сохраняется и профиль cProfile для анализа средствами `pstats`.
+"""
+import cProfile
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter, process_time
+from typing import Any, Iterator, Optional
+
+from logger import get_logger
+
+try:
+    import resource
+except ImportError:
+    # модуль недоступен в Windows
+    resource = None  # type: ignore
+
+logger = get_logger(__name__)
+
+# версия формата отчета
+PROFILE_VERSION = 1
+
+# суффиксы файлов отчета и профиля cProfile (добавляются к пути выходного файла)
+PROFILE_SUFFIX = ".profile.json"
+CPROFILE_SUFFIX = ".prof"
+
+
+def current_rss() -> int:
+    """
+    Получение текущего объема резидентной памяти процесса.
+
+    :return: Объем памяти в байтах (без /proc – пиковый объем за время работы процесса).
+    """
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    """
+    Получение пикового объема резидентной памяти процесса за время его работы.
+
+    :return: Объем памяти в байтах (0, если объем памяти процесса недоступен).
+    """
+
+    if resource is None:
+        return 0
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # в macOS значение в байтах, в Linux – в килобайтах
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def megabytes(value: int) -> float:
+    """
+    Перевод объема памяти в мегабайты.
+
+    :param value: Объем памяти в байтах.
+    :return: Объем памяти в мегабайтах (с округлением).
+    """
+
+    return round(value / 1024 / 1024, 2)
+
+
+class Profiler:
+    """
+    Сбор показателей этапов обработки.
+
+    Выключенный профилировщик ничего не измеряет, поэтому этапы размечаются независимо от режима запуска.
+    """
+
+    def __init__(self, enabled: bool = False, cpu: bool = False) -> None:
+        """
+        Конструктор.
+
+        :param enabled: Измерение показателей этапов (включая трассировку памяти tracemalloc).
+        :param cpu: Профилирование вызовов функций средствами cProfile.
+        """
+
+        self.enabled = enabled or cpu
+        self.cpu = cpu
+        # показатели этапов в порядке выполнения
+        self.stages: list[dict[str, Any]] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        """
+        Запуск измерений.
+        """
+
+        if not self.enabled:
+            return
+
+        tracemalloc.start()
+        if self.cpu:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[dict[str, Any]]:
+        """
+        Измерение показателей этапа.
+
+        В словарь показателей этапа можно добавить собственные значения, например количество строк (`rows`).
+
+        :param name: Наименование этапа.
+        :return: Словарь показателей этапа.
+        """
+
+        stats: dict[str, Any] = {"stage": name}
+        if not self.enabled:
+            yield stats
+            return
+
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        started, cpu_started = perf_counter(), process_time()
+        try:
+            yield stats
+        finally:
+            seconds = perf_counter() - started
+            memory, memory_peak = tracemalloc.get_traced_memory()
+            stats.update(
+                seconds=round(seconds, 4),
+                cpu_seconds=round(process_time() - cpu_started, 4),
+                memory_delta_mb=megabytes(memory - memory_before),
+                memory_peak_mb=megabytes(memory_peak),
+                rss_mb=megabytes(current_rss()),
+                peak_rss_mb=megabytes(max(peak_rss(), current_rss())),
+            )
+            if stats.get("rows") and seconds:
+                stats["rows_per_second"] = round(stats["rows"] / seconds, 1)
+            self.stages.append(stats)
+            logger.info("Этап «%s»: время – %.3f с, память – %.1f МБ.", name, seconds, stats["memory_peak_mb"])
+
+    def stop(self, path_output: str, parameters: dict[str, Any]) -> None:
+        """
+        Остановка измерений и сохранение отчета (и профиля cProfile) рядом с выходным файлом.
+
+        :param path_output: Путь к выходному файлу.
+        :param parameters: Параметры запуска.
+        """
+
+        if not self.enabled:
+            return
+
+        seconds = perf_counter() - self._started
+        tracemalloc.stop()
+        report: dict[str, Any] = {
+            "version": PROFILE_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pid": os.getpid(),
+            "parameters": parameters,
+            "seconds": round(seconds, 4),
+            "peak_rss_mb": megabytes(peak_rss()),
+            "stages": self.stages,
+        }
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(f"{path_output}{CPROFILE_SUFFIX}")
+            report["cprofile"] = f"{path_output}{CPROFILE_SUFFIX}"
+            self._profile = None
+
+        with open(f"{path_output}{PROFILE_SUFFIX}", "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        logger.info("Отчет о производительности сохранен: %s.", f"{path_output}{PROFILE_SUFFIX}")
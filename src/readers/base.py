@@ -2,31 +2,303 @@
 Функции чтения исходного файла.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from functools import cached_property
+from itertools import compress, islice, repeat, zip_longest
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Sequence, Type, Union
 
 from openpyxl.workbook import Workbook
 from pydantic import BaseModel
 
+from formatters.records import RECORDS
 from logger import get_logger
+from readers.validation import CellError, ColumnRule, RowError, SheetValidationError, validate_batch
+
+if TYPE_CHECKING:
+    from readers.tables import TableWorkbook
 
 logger = get_logger(__name__)
 
+# количество строк в пакете при пакетной проверке значений
+BATCH_SIZE = 10000
+
+
+def to_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+
+    :param value: Значение ячейки.
+    :return: Целое число.
+    """
+
+    return int(str(value))
+
+
+def to_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку без начальных и конечных пробелов.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return str(value).strip()
+
+
+def to_date(value: Any) -> Any:
+    """
+    Преобразование значения ячейки с датой в строку формата "ДД.ММ.ГГГГ".
+
+    :param value: Значение ячейки.
+    :return: Строка с датой (значения других типов возвращаются без изменений).
+    """
+
+    return value.strftime("%d.%m.%Y") if isinstance(value, date) else value
+
+
+# функции преобразования значений ячеек по типам данных атрибутов
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    int: to_int,
+    str: to_str,
+    date: to_date,
+}
+
+# функции преобразования столбца заполненных значений целиком (цепочки `map` без вызова функций Python для ячеек)
+COLUMN_CONVERTERS: dict[type, Callable[[list], list]] = {
+    int: lambda values: list(map(int, map(str, values))),
+    str: lambda values: list(map(str.strip, map(str, values))),
+}
+
+
+class ConvertedColumn(NamedTuple):
+    """
+    Столбец значений атрибута, преобразованных к типу данных атрибута.
+    """
+
+    # преобразованные значения (некорректные значения заменяются на `None`)
+    values: list
+    # маска ошибок: 1 – значение не преобразуется к типу данных атрибута
+    mask: bytearray
+    # описания ошибок по индексам некорректных значений
+    messages: dict[int, str]
+
+    def select(self, flags: Sequence) -> "ConvertedColumn":
+        """
+        Отбор значений столбца.
+
+        :param flags: Признаки отбора значений (по одному на значение).
+        :return: Столбец отобранных значений.
+        """
+
+        messages = {}
+        if self.messages:
+            indexes = compress(range(len(self.values)), flags)
+            messages = {new: self.messages[old] for new, old in enumerate(indexes) if self.mask[old]}
+
+        return ConvertedColumn(list(compress(self.values, flags)), bytearray(compress(self.mask, flags)), messages)
+
+
+def convert_column(values: Sequence, data_type: type) -> ConvertedColumn:
+    """
+    Преобразование столбца значений атрибута (по аналогии с `ExtractionPlan.extract`: пустые значения не изменяются).
+
+    Способ преобразования выбирается по типам значений столбца: столбец, значения которого уже имеют тип атрибута,
+    не преобразуется, остальные столбцы преобразуются целиком цепочкой `map`. Если столбец содержит некорректные
+    значения, значения преобразуются по одному, а некорректные значения отмечаются в маске ошибок
+    (без прерывания преобразования).
+
+    :param values: Значения ячеек столбца.
+    :param data_type: Тип данных атрибута.
+    :return: Преобразованные значения и маска ошибок.
+    """
+
+    # типы значений столбца определяются один раз: значения, уже имеющие тип атрибута, не преобразуются
+    kinds = set(map(type, values)) - {type(None)}
+    if data_type is int and kinds <= {int} or data_type is date and not any(issubclass(kind, date) for kind in kinds):
+        return ConvertedColumn(list(values), bytearray(len(values)), {})
+
+    convert = CONVERTERS[data_type]
+    try:
+        if data_type is str and kinds == {str} and all(values):
+            converted = list(map(str.strip, values))
+        elif data_type is int and kinds == {str} and all(values):
+            # строковые значения преобразуются без промежуточного вызова `str()`
+            converted = list(map(int, values))
+        elif data_type is date:
+            # даты обычно повторяются: каждое уникальное значение форматируется один раз (словарное кодирование)
+            formatted = {value: convert(value) if value else value for value in set(values)}
+            converted = list(map(formatted.__getitem__, values))
+        elif all(values):
+            converted = COLUMN_CONVERTERS[data_type](values)
+        else:
+            converted = [convert(value) if value else value for value in values]
+        return ConvertedColumn(converted, bytearray(len(values)), {})
+    except (TypeError, ValueError):
+        pass
+
+    converted, mask, messages = [], bytearray(len(values)), {}
+    for index, value in enumerate(values):
+        try:
+            converted.append(convert(value) if value else value)
+        except (TypeError, ValueError) as ex:
+            converted.append(None)
+            mask[index] = 1
+            messages[index] = str(ex)
+
+    return ConvertedColumn(converted, mask, messages)
+
+
+def row_fingerprint(row: Sequence) -> str:
+    """
+    Получение отпечатка строки листа рабочей книги.
+
+    :param row: Значения ячеек строки.
+    :return: Отпечаток строки (шестнадцатеричная строка).
+    """
+
+    return hashlib.blake2b(repr(tuple(row)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ColumnarSheet(ABC):
+    """
+    Лист табличного источника (CSV, Parquet, Arrow), значения которого доступны по столбцам.
+
+    Пустой ячейке соответствует отсутствующее значение или пустая строка, такие значения заменяются на `None`
+    при чтении таблицы. Строки из пробелов не считаются пустыми и преобразуются так же, как значения рабочей книги
+    (`convert_column`). Лист также поддерживает построчное чтение (как лист openpyxl).
+    """
+
+    @property
+    @abstractmethod
+    def rows(self) -> int:
+        """
+        Получение количества строк.
+
+        :return: Количество строк (без строки заголовка).
+        """
+
+    @property
+    @abstractmethod
+    def width(self) -> int:
+        """
+        Получение количества столбцов.
+
+        :return: Количество столбцов.
+        """
+
+    @abstractmethod
+    def column(self, index: int) -> list:
+        """
+        Получение значений столбца (пустые значения – `None`).
+
+        :param index: Индекс столбца.
+        :return: Значения столбца (для отсутствующего столбца – `None` в каждой строке).
+        """
+
+    def convert(self, index: int, data_type: type) -> ConvertedColumn:
+        """
+        Получение значений столбца, преобразованных к типу данных атрибута.
+
+        :param index: Индекс столбца.
+        :param data_type: Тип данных атрибута.
+        :return: Преобразованные значения и маска ошибок.
+        """
+
+        return convert_column(self.column(index), data_type)
+
+    def iter_rows(self, min_row: int = 2, values_only: bool = True) -> Iterator[tuple]:
+        """
+        Получение значений ячеек строк (параметры – как у `Worksheet.iter_rows`, строка заголовка имеет номер 1).
+
+        :param min_row: Номер первой строки.
+        :param values_only: Получение значений ячеек (поддерживается только этот режим).
+        :return: Кортежи значений ячеек строк.
+        """
+
+        # pylint: disable=unused-argument
+        start = max(min_row - 2, 0)
+
+        return zip(*(self.column(index)[start:] for index in range(self.width)))
+
+
+class ExtractionPlan(NamedTuple):
+    """
+    План извлечения значений атрибутов из строки рабочей книги.
+    """
+
+    # наименования атрибутов
+    fields: tuple[str, ...]
+    # индексы столбцов и типы данных атрибутов
+    indexes: tuple[int, ...]
+    types: tuple[type, ...]
+    # функция получения значений столбцов атрибутов из строки
+    getter: Callable[[Sequence], tuple]
+    # функции преобразования значений атрибутов
+    converters: tuple[Callable[[Any], Any], ...]
+    # минимальная длина строки, содержащей все столбцы атрибутов
+    width: int
+
+    @classmethod
+    def compile(cls, attributes: dict) -> "ExtractionPlan":
+        """
+        Построение плана по описанию атрибутов читателя.
+
+        :param attributes: Атрибуты с информацией об индексе столбца и типе данных.
+        :return: План извлечения значений атрибутов.
+        """
+
+        fields, indexes, types = [], [], []
+        for attr, params in attributes.items():
+            ((index, data_type),) = params.items()
+            fields.append(attr)
+            indexes.append(index)
+            types.append(data_type)
+
+        # `itemgetter` с одним индексом возвращает значение, а не кортеж
+        getter = itemgetter(*indexes) if len(indexes) > 1 else lambda row: (row[indexes[0]],)
+        converters = tuple(CONVERTERS[data_type] for data_type in types)
+
+        return cls(tuple(fields), tuple(indexes), tuple(types), getter, converters, max(indexes) + 1)
+
+    def extract(self, row: Sequence) -> dict:
+        """
+        Извлечение и преобразование значений атрибутов из строки.
+
+        :param row: Значения ячеек строки.
+        :return: Значения атрибутов модели.
+        """
+
+        # в режиме только для чтения пустые ячейки в конце строки могут отсутствовать
+        if len(row) < self.width:
+            row = tuple(row) + (None,) * (self.width - len(row))
+
+        return {
+            field: convert(value) if value else value
+            for field, convert, value in zip(self.fields, self.converters, self.getter(row))
+        }
+
 
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    def __init__(self, workbook: Union[Workbook, "TableWorkbook"], bulk: bool = False, records: bool = False) -> None:
         """
         Конструктор.
 
-        :param workbook: Рабочая книга Excel.
+        :param workbook: Рабочая книга Excel или директория с таблицами листов.
+        :param bulk: Пакетная проверка значений по столбцам и создание моделей без валидации pydantic.
+        :param records: Создание компактных записей со слотами вместо моделей pydantic
+            (значения проверяются пакетно).
         """
 
         self.workbook = workbook
+        self.bulk = bulk or records
+        self.records = records
 
     @property
     @abstractmethod
@@ -67,40 +339,203 @@ class BaseReader(ABC):
         :return: Атрибуты с информацией об индексе столбца и типе данных
         """
 
-    def read(self) -> list[BaseModel]:
+    def iter_rows(self) -> Iterator[tuple]:
         """
-        Чтение исходного файла.
+        Получение значений ячеек строк листа рабочей книги.
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        Значения считываются без создания объектов ячеек, поэтому рабочая книга,
+        открытая в режиме только для чтения, обрабатывается потоково.
+
+        :return: Кортежи значений ячеек строк (без строки заголовка).
         """
 
-        models = []
         # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
+        yield from self.workbook[self.sheet].iter_rows(min_row=2, values_only=True)
+
+    @cached_property
+    def plan(self) -> ExtractionPlan:
+        """
+        Получение плана извлечения значений атрибутов из строки (строится один раз для читателя).
+
+        :return: План извлечения значений атрибутов.
+        """
+
+        return ExtractionPlan.compile(self.attributes)
+
+    def iter_columns(self) -> Iterator[tuple[list[int], list[ConvertedColumn]]]:
+        """
+        Получение пакетов столбцов значений атрибутов заполненных строк, преобразованных к типам данных атрибутов.
+
+        Лист табличного источника преобразуется по столбцам целиком, строки листа рабочей книги транспонируются
+        в столбцы пакетами по `BATCH_SIZE` строк (при потоковом чтении лист не загружается в память полностью).
+
+        :return: Итератор номеров строк на листе и столбцов атрибутов (в порядке `plan.fields`).
+        """
+
+        plan = self.plan
+        # листы табличного источника (в отличие от листов рабочей книги) хранят значения по столбцам
+        if getattr(self.workbook, "columnar", False):
+            sheet: ColumnarSheet = self.workbook[self.sheet]
             # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+            flags = list(map(bool, sheet.column(0)))
+            columns = [sheet.convert(index, data_type) for index, data_type in zip(plan.indexes, plan.types)]
+            if all(flags):
+                yield list(range(2, sheet.rows + 2)), columns
+            else:
+                yield list(compress(range(2, sheet.rows + 2), flags)), [column.select(flags) for column in columns]
+            return
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+        rows = self.iter_rows()
+        # нумерация строк со второй строки листа (первая строка содержит заголовок)
+        start = 2
+        while batch := list(islice(rows, BATCH_SIZE)):
+            # обработка строки идет только, если заполнены обязательные столбцы
+            flags = [bool(row and row[0]) for row in batch]
+            numbers = list(compress(range(start, start + len(batch)), flags))
+            start += len(batch)
+            if len(numbers) == len(batch):
+                yield numbers, self.convert_rows(batch)
+            elif numbers:
+                yield numbers, self.convert_rows(list(compress(batch, flags)))
 
-                    if not attrs[attr]:
-                        continue
+    def convert_rows(self, rows: list[Sequence]) -> list[ConvertedColumn]:
+        """
+        Транспонирование строк в столбцы и преобразование столбцов атрибутов.
+
+        :param rows: Значения ячеек строк.
+        :return: Столбцы атрибутов (в порядке `plan.fields`).
+        """
+
+        plan = self.plan
+        if min(map(len, rows)) >= plan.width:
+            # столбцы выбираются из строк по индексу: `zip(*rows)` создает итератор для каждой строки,
+            # и частые сборки мусора замедляют транспонирование
+            return [
+                convert_column(list(map(itemgetter(index), rows)), data_type)
+                for index, data_type in zip(plan.indexes, plan.types)
+            ]
+
+        # в режиме только для чтения пустые ячейки в конце строки могут отсутствовать (дополняются `None`)
+        columns = list(zip_longest(*rows))
+        missing = (None,) * len(rows)
+
+        return [
+            convert_column(columns[index] if index < len(columns) else missing, data_type)
+            for index, data_type in zip(plan.indexes, plan.types)
+        ]
+
+    def iter_extract(self) -> Iterator[tuple[int, Union[dict, CellError]]]:
+        """
+        Извлечение значений атрибутов из заполненных строк листа (значения преобразуются по столбцам).
+
+        :return: Итератор номеров строк на листе и значений атрибутов (или ошибок преобразования значений).
+        """
+
+        fields = self.plan.fields
+        for numbers, columns in self.iter_columns():
+            # ошибка строки – ошибка первого столбца с некорректным значением
+            errors: dict[int, CellError] = {}
+            for field, column in reversed(list(zip(fields, columns))):
+                errors.update((index, CellError(field, message)) for index, message in column.messages.items())
+
+            # словари значений атрибутов строятся из столбцов без обращения к отдельным значениям из Python
+            rows = map(dict, map(zip, repeat(fields), zip(*(column.values for column in columns))))
+            if not errors:
+                yield from zip(numbers, rows)
+                continue
+
+            for index, (number, attrs) in enumerate(zip(numbers, rows)):
+                yield number, errors.get(index, attrs)
+
+    def iter_read(self) -> Iterator[BaseModel]:
+        """
+        Ленивое чтение исходного файла.
+
+        :raises CellError: Если значение ячейки не преобразуется к типу данных атрибута.
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        if self.bulk:
+            yield from self.iter_read_bulk()
+            return
+
+        for _, attrs in self.iter_extract():
+            if isinstance(attrs, CellError):
+                raise attrs
+            yield self.model(**attrs)
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+    def iter_read_bulk(self) -> Iterator[BaseModel]:
+        """
+        Ленивое чтение исходного файла с пакетной проверкой значений.
+
+        Строки обрабатываются пакетами: значения атрибутов проверяются по столбцам
+        (обязательность, тип, ограничения полей модели), после чего модели создаются без
+        повторной валидации. Ошибки всех строк листа собираются и передаются в исключении
+        с указанием листа и номера строки.
+
+        :raises SheetValidationError: Если на листе есть строки с ошибками.
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        rules = ColumnRule.compile(self.model, self.plan.fields)
+        errors: list[RowError] = []
+        numbers: list[int] = []
+        records: list[dict] = []
+        for number, attrs in self.iter_extract():
+            if isinstance(attrs, CellError):
+                errors.append(RowError(self.sheet, number, attrs.field, str(attrs)))
+            else:
+                records.append(attrs)
+                numbers.append(number)
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+            if len(records) >= BATCH_SIZE:
+                yield from self.build_batch(rules, records, numbers, errors)
+                numbers, records = [], []
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+        yield from self.build_batch(rules, records, numbers, errors)
+
+        if errors:
+            errors.sort(key=lambda error: error.row)
+            raise SheetValidationError(errors)
+
+    def build_batch(
+        self, rules: tuple[ColumnRule, ...], records: list[dict], numbers: list[int], errors: list[RowError]
+    ) -> Iterator[BaseModel]:
+        """
+        Проверка пакета значений атрибутов и создание моделей.
+
+        :param rules: Правила проверки столбцов.
+        :param records: Значения атрибутов моделей.
+        :param numbers: Номера строк на листе.
+        :param errors: Список для добавления найденных ошибок.
+        :return: Итератор моделей корректных строк.
+        """
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+        invalid, batch_errors = validate_batch(rules, records, numbers, self.sheet)
+        errors.extend(batch_errors)
+
+        if self.records:
+            record = RECORDS[self.model]
+            for index, attrs in enumerate(records):
+                if index not in invalid:
+                    yield record(**attrs)
+            return
+
+        model = self.model
+        fields_set = frozenset(self.plan.fields)
+        for index, attrs in enumerate(records):
+            if index not in invalid:
+                # создание модели без валидации (аналог `BaseModel.construct()` без обработки значений по умолчанию)
+                instance = model.__new__(model)
+                object.__setattr__(instance, "__dict__", attrs)
+                object.__setattr__(instance, "__fields_set__", set(fields_set))
+                yield instance
+
+    def read(self) -> list[BaseModel]:
+        """
+        Чтение исходного файла.
+
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-        return models
+        return list(self.iter_read())
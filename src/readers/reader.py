@@ -1,11 +1,19 @@
 """
 Чтение исходного файла.
 """
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Type
+from functools import cached_property
+from itertools import repeat
+from operator import attrgetter
+from time import perf_counter
+from typing import BinaryIO, Iterator, Optional, Type, Union
 
 import openpyxl
+from openpyxl.reader.workbook import WorkbookParser
 from openpyxl.workbook import Workbook
+from pydantic import BaseModel
 
 from formatters.models import (
     BookModel,
@@ -14,8 +22,11 @@ from formatters.models import (
     JournalArticleModel,
     NewspaperModel,
 )
+from formatters.records import RECORDS
 from logger import get_logger
 from readers.base import BaseReader
+from readers.snapshot import Snapshot, open_snapshot, write_snapshot
+from readers.tables import TableWorkbook, is_table_source
 
 logger = get_logger(__name__)
 
@@ -161,31 +172,257 @@ class SourcesReader:
 
     nlm_readers = [JournalArticleReader, NewspaperReader]
 
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: Union[str, BinaryIO],
+        read_only: bool = False,
+        bulk: bool = False,
+        records: bool = False,
+        snapshot: Optional[str] = None,
+    ) -> None:
         """
         Конструктор.
 
-        :param path: Путь к исходному файлу для чтения.
+        :param path: Путь к исходному файлу для чтения (рабочей книге Excel, директории с таблицами листов
+            в форматах CSV, Parquet и Arrow или отдельной таблице) или открытый файловый объект.
+        :param read_only: Потоковое чтение рабочей книги в режиме только для чтения
+            (объекты ячеек не создаются, расход памяти не зависит от количества строк).
+        :param bulk: Пакетная проверка значений по столбцам и создание моделей без валидации pydantic.
+        :param records: Создание компактных записей со слотами вместо моделей pydantic.
+        :param snapshot: Путь к файлу снимка источников: источники всех стилей цитирования читаются из снимка
+            (в виде представлений компактных записей), а рабочая книга – только при создании снимка.
+        """
+
+        self.path = path
+        self.read_only = read_only
+        self.bulk = bulk
+        self.records = records
+        self.snapshot_path = snapshot
+
+    @cached_property
+    def workbook(self) -> Union[Workbook, TableWorkbook]:
+        """
+        Получение рабочей книги (загружается при первом обращении).
+
+        :raises ValueError: Если имя файла отдельной таблицы не совпадает ни с одним наименованием листа.
+        :return: Рабочая книга Excel или табличный источник.
         """
 
         logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
 
-    def read(self, citation_style: str = "gost") -> list:
+        workbook = open_workbook(self.path, self.read_only)
+        # отдельная таблица с другим именем файла дала бы пустой список источников
+        if isinstance(workbook, TableWorkbook) and workbook.single:
+            readers = dict.fromkeys([*self.gost_readers, *self.nlm_readers])
+            sheets = [reader(None).sheet for reader in readers]  # type: ignore
+            if not set(workbook.files) & set(sheets):
+                raise ValueError(
+                    f"Имя файла таблицы {self.path} не совпадает ни с одним наименованием листа: {', '.join(sheets)}"
+                )
+
+        return workbook
+
+    @cached_property
+    def snapshot(self) -> Snapshot:
         """
-        Чтение исходного файла.
+        Получение снимка источников (создается заново, если отсутствует или изменились листы входного файла).
 
-        :return: Список прочитанных моделей (строк).
+        :raises ValueError: Если путь к файлу снимка не задан.
+        :return: Снимок, отображенный в память.
+        """
+
+        if self.snapshot_path is None:
+            raise ValueError("Путь к файлу снимка источников не задан")
+
+        snapshot = open_snapshot(self.snapshot_path, self.checksums)
+        if snapshot is not None:
+            logger.info("Загружен снимок источников %s.", self.snapshot_path)
+            return snapshot
+
+        logger.info("Создание снимка источников %s ...", self.snapshot_path)
+        # в снимок попадают листы всех стилей цитирования, чтобы смена стиля не требовала чтения рабочей книги
+        readers = [
+            reader(self.workbook, self.bulk, self.records)  # type: ignore
+            for reader in dict.fromkeys([*self.gost_readers, *self.nlm_readers])
+        ]
+        write_snapshot(self.snapshot_path, self.checksums, ((reader.model, timed(reader)) for reader in readers))
+
+        return Snapshot(self.snapshot_path)
+
+    @cached_property
+    def checksums(self) -> dict[str, str]:
+        """
+        Получение контрольных сумм листов рабочей книги без чтения их содержимого.
+
+        Контрольная сумма листа составляется из CRC-32 и размеров частей архива .xlsx: листа,
+        таблицы общих строк и стилей (от стилей зависит распознавание дат). Для директории с таблицами листов
+        и отдельной таблицы используются CRC-32 и размеры файлов таблиц.
+
+        :return: Контрольные суммы по наименованиям листов.
+        """
+
+        if is_table_source(self.path):
+            return TableWorkbook(str(self.path)).checksums()
+
+        with zipfile.ZipFile(self.path) as archive:
+            parts = {info.filename: f"{info.CRC:08x}{info.file_size:x}" for info in archive.infolist()}
+            parser = WorkbookParser(archive, "xl/workbook.xml")
+            parser.parse()
+            shared = "".join(parts.get(name, "") for name in ("xl/sharedStrings.xml", "xl/styles.xml"))
+
+            return {sheet.name: f"{parts[rel.target]}:{shared}" for sheet, rel in parser.find_sheets()}
+
+    def sheet_fingerprint(self, sheet: str) -> str:
+        """
+        Получение отпечатка листа рабочей книги (изменяется при изменении значений на листе).
+
+        :param sheet: Наименование листа.
+        :return: Отпечаток листа (пустой для листа, отсутствующего в источнике из одной таблицы).
+        """
+
+        return self.checksums.get(sheet, "")
+
+    def get_readers(self, citation_style: str = "gost") -> list[Type[BaseReader]]:
+        """
+        Получение зарегистрированных читателей для стиля цитирования.
+
+        :param citation_style: Стиль цитирования.
+        :return: Классы читателей в порядке регистрации.
         """
 
-        items = []
         match citation_style:
             case "gost":
-                readers = self.gost_readers
+                return self.gost_readers
             case "nlm":
-                readers = self.nlm_readers
-        for reader in readers:
+                return self.nlm_readers
+
+        raise ValueError(f"Неизвестный стиль цитирования: {citation_style}")
+
+    def iter_read(self, citation_style: str = "gost") -> Iterator[BaseModel]:
+        """
+        Ленивое чтение исходного файла: модели создаются по мере обхода итератора.
+
+        :param citation_style: Стиль цитирования, определяющий набор читателей.
+        :return: Итератор прочитанных моделей (строк).
+        """
+
+        if self.snapshot_path is not None:
+            # читатели создаются без рабочей книги: из них используются только модели листов
+            models = [reader(None).model for reader in self.get_readers(citation_style)]  # type: ignore
+            yield from self.snapshot.iter_items(models)
+            return
+
+        for reader in self.get_readers(citation_style):
             logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+            yield from timed(reader(self.workbook, self.bulk, self.records))  # type: ignore
+
+    def read(self, citation_style: str = "gost") -> list:
+        """
+        Чтение исходного файла.
+
+        :param citation_style: Стиль цитирования, определяющий набор читателей.
+        :return: Список прочитанных моделей (строк).
+        """
+
+        return list(self.iter_read(citation_style))
+
+    def read_parallel(self, citation_style: str = "gost", workers: Optional[int] = None) -> list:
+        """
+        Параллельное чтение листов исходного файла в пуле процессов.
+
+        Каждый процесс открывает рабочую книгу в режиме только для чтения и читает один лист.
+        Результаты объединяются в порядке регистрации читателей.
+
+        :param citation_style: Стиль цитирования, определяющий набор читателей.
+        :param workers: Количество процессов (по умолчанию – по количеству листов).
+        :return: Список прочитанных моделей (строк).
+        """
+
+        readers = self.get_readers(citation_style)
+        items = []
+        with ProcessPoolExecutor(max_workers=min(workers or len(readers), len(readers))) as executor:
+            for model, payloads in executor.map(
+                read_sheet, repeat(self.path), readers, repeat(self.bulk), repeat(self.records)
+            ):
+                fields = tuple(model.__fields__)
+                item_type = RECORDS[model] if self.records else model
+                # модели проверены в дочернем процессе, повторная валидация не требуется
+                items.extend(item_type.construct(**dict(zip(fields, payload))) for payload in payloads)
 
         return items
+
+    def close(self) -> None:
+        """
+        Закрытие исходного файла (в режиме только для чтения файл остается открытым до вызова метода).
+        """
+
+        if "workbook" in self.__dict__:
+            self.workbook.close()
+        if "snapshot" in self.__dict__:
+            self.snapshot.close()
+
+
+def open_workbook(path: Union[str, BinaryIO], read_only: bool = False) -> Union[Workbook, TableWorkbook]:
+    """
+    Открытие исходного файла: способ чтения выбирается по типу источника.
+
+    :param path: Путь к рабочей книге Excel, директории с таблицами листов или отдельной таблице,
+        или открытый файловый объект.
+    :param read_only: Потоковое чтение рабочей книги в режиме только для чтения.
+    :return: Рабочая книга Excel или табличный источник.
+    """
+
+    if is_table_source(path):
+        return TableWorkbook(str(path))
+
+    return openpyxl.load_workbook(path, read_only=read_only)
+
+
+def timed(reader: BaseReader) -> Iterator[BaseModel]:
+    """
+    Чтение листа с выводом в лог количества прочитанных строк и времени чтения.
+
+    Учитывается только время чтения: время обработки строк на следующих этапах не включается.
+
+    :param reader: Читатель листа.
+    :return: Итератор прочитанных моделей (строк).
+    """
+
+    count = 0
+    elapsed = 0.0
+    items = reader.iter_read()
+    while True:
+        started = perf_counter()
+        try:
+            item = next(items)
+        except StopIteration:
+            break
+        finally:
+            elapsed += perf_counter() - started
+        count += 1
+        yield item
+
+    logger.info("Прочитан лист «%s»: строк – %s, время – %.3f с.", reader.sheet, count, elapsed)
+
+
+def read_sheet(
+    path: str, reader: Type[BaseReader], bulk: bool = False, records: bool = False
+) -> tuple[Type[BaseModel], list[tuple]]:
+    """
+    Чтение листа рабочей книги в дочернем процессе.
+
+    :param path: Путь к исходному файлу для чтения.
+    :param reader: Класс читателя листа.
+    :param bulk: Пакетная проверка значений по столбцам.
+    :param records: Создание компактных записей вместо моделей pydantic.
+    :return: Модель листа и компактное представление прочитанных объектов – кортежи значений полей.
+    """
+
+    logger.info("Чтение %s ...", reader)
+    workbook = open_workbook(path, read_only=True)
+    try:
+        sheet_reader = reader(workbook, bulk, records)  # type: ignore
+        values = attrgetter(*sheet_reader.model.__fields__)
+        return sheet_reader.model, [values(item) for item in timed(sheet_reader)]
+    finally:
+        workbook.close()
@@ -0,0 +1,390 @@
+"""
+Снимок источников: компактный двоичный формат между чтением и оформлением.
+
+Снимок создается по прочитанным источникам всех листов и используется повторно, пока не изменились
+контрольные суммы листов входного файла, поэтому смена стиля цитирования не требует повторного чтения рабочей книги.
+
+Структура файла (порядок байтов – little-endian):
+
+- заголовок: сигнатура, версия формата и длина описания;
+- описание в формате JSON: контрольные суммы листов, расположение таблицы строк и разделов;
+- таблица строк: смещения (8 байт) и значения в UTF-8, каждая строка хранится один раз;
+- разделы по типам источников: записи фиксированной длины, строковые поля хранят номер строки в таблице (4 байта),
+  целочисленные – значение (8 байт).
+
+Файл отображается в память (`mmap`), источники возвращаются в виде представлений компактных записей:
+значения полей читаются из отображенного файла при обращении к ним.
+"""
+import json
+import mmap
+import os
+import struct
+from typing import Any, ClassVar, Iterable, Iterator, Optional, Type
+
+from pydantic import BaseModel
+
+from formatters.records import RECORDS, BaseRecord
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# сигнатура и версия формата снимка
+MAGIC = b"BIBSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+# заголовок: сигнатура, версия формата, длина описания
+HEADER = struct.Struct("<8sIQ")
+# смещение строки в таблице строк
+OFFSET = struct.Struct("<Q")
+# границы строки в таблице строк (смещения строки и следующей за ней)
+BOUNDS = struct.Struct("<QQ")
+# выравнивание таблицы строк и разделов
+ALIGNMENT = 8
+# количество записей раздела, копируемых из отображенного файла за один раз при обходе раздела
+CHUNK_ROWS = 4096
+
+# форматы полей записи: номер строки в таблице строк и целое число
+STRING_FORMAT = "I"
+INTEGER_FORMAT = "q"
+# значения, обозначающие отсутствие значения поля
+NULL_STRING = 0xFFFFFFFF
+NULL_INTEGER = -(1 << 63)
+
+# компактные записи по наименованиям моделей
+RECORDS_BY_NAME: dict[str, Type[BaseRecord]] = {model.__name__: record for model, record in RECORDS.items()}
+
+
+def record_format(model: Type[BaseModel]) -> str:
+    """
+    Получение формата записи раздела для модели (без указания порядка байтов).
+
+    :param model: Модель источника.
+    :return: Форматы полей в порядке полей модели.
+    """
+
+    # ограниченные целые числа (`Field(..., gt=0)`) – подклассы int
+    return "".join(
+        INTEGER_FORMAT if isinstance(field.type_, type) and issubclass(field.type_, int) else STRING_FORMAT
+        for field in model.__fields__.values()
+    )
+
+
+def align(size: int) -> int:
+    """
+    Выравнивание смещения в файле снимка.
+
+    :param size: Смещение.
+    :return: Ближайшее не меньшее смещение, кратное `ALIGNMENT`.
+    """
+
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+class StringTable:
+    """
+    Таблица строк отображенного файла снимка.
+    """
+
+    __slots__ = ("buffer", "offsets", "values")
+
+    def __init__(self, buffer: mmap.mmap, offsets: int, values: int) -> None:
+        """
+        Конструктор.
+
+        :param buffer: Отображенный файл снимка.
+        :param offsets: Смещение массива смещений строк.
+        :param values: Смещение значений строк.
+        """
+
+        self.buffer = buffer
+        self.offsets = offsets
+        self.values = values
+
+    def __getitem__(self, index: int) -> str:
+        start, end = BOUNDS.unpack_from(self.buffer, self.offsets + index * OFFSET.size)
+
+        return self.buffer[self.values + start : self.values + end].decode("utf-8")
+
+
+class SnapshotField:
+    """
+    Поле представления записи: значение читается из записи раздела при обращении.
+    """
+
+    __slots__ = ("position", "string")
+
+    def __init__(self, position: int, string: bool) -> None:
+        """
+        Конструктор.
+
+        :param position: Номер поля в записи раздела.
+        :param string: Значение поля хранится в таблице строк.
+        """
+
+        self.position = position
+        self.string = string
+
+    def __get__(self, view: Optional["SnapshotView"], owner: type) -> Any:
+        if view is None:
+            return self
+
+        value = view._values[self.position]  # pylint: disable=protected-access
+        if self.string:
+            return None if value == NULL_STRING else view._strings[value]  # pylint: disable=protected-access
+
+        return None if value == NULL_INTEGER else value
+
+
+class SnapshotView(BaseRecord):
+    """
+    Базовый класс представления компактной записи в снимке источников.
+
+    Классы представлений наследуют классы записей, поэтому стили оформления и другие этапы обработки
+    используют их так же, как записи (см. `BaseCitationFormatter.get_style`). При сериализации pickle
+    (например, во временные файлы внешней сортировки) представление сохраняется как запись со значениями полей.
+    """
+
+    __slots__ = ()
+
+    # класс компактной записи представления
+    record: ClassVar[Type[BaseRecord]]
+
+    _strings: StringTable
+    _values: tuple
+
+    def __init__(self, strings: StringTable, values: tuple) -> None:  # pylint: disable=super-init-not-called
+        """
+        Конструктор.
+
+        :param strings: Таблица строк снимка.
+        :param values: Значения полей записи раздела (номера строк и целые числа).
+        """
+
+        self._strings = strings
+        self._values = values
+
+    def __reduce__(self) -> tuple:
+        # запись создается без значений полей, затем значения устанавливаются в слоты
+        return self.record, (), (None, self.dict())
+
+
+def make_view(record: Type[BaseRecord], formats: str) -> Type[SnapshotView]:
+    """
+    Создание класса представления записи.
+
+    :param record: Класс компактной записи.
+    :param formats: Форматы полей записи раздела.
+    :return: Класс представления.
+    """
+
+    fields = {
+        field: SnapshotField(position, value_format == STRING_FORMAT)
+        for position, (field, value_format) in enumerate(zip(record.fields, formats))
+    }
+
+    return type(
+        f"{record.__name__}View",
+        (SnapshotView, record),
+        {"__slots__": ("_strings", "_values"), "record": record, **fields},
+    )
+
+
+class Section:
+    """
+    Раздел снимка: записи источников одного типа.
+    """
+
+    def __init__(self, buffer: mmap.mmap, strings: StringTable, offset: int, description: dict) -> None:
+        """
+        Конструктор.
+
+        :param buffer: Отображенный файл снимка.
+        :param strings: Таблица строк снимка.
+        :param offset: Смещение записей раздела в файле.
+        :param description: Описание раздела.
+        """
+
+        self.buffer = buffer
+        self.strings = strings
+        self.record = struct.Struct(f"<{description['format']}")
+        self.offset = offset
+        self.rows: int = description["rows"]
+        self.view = make_view(RECORDS_BY_NAME[description["model"]], description["format"])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self) -> Iterator[SnapshotView]:
+        if not self.rows:
+            return
+
+        # записи копируются частями: срез отображенного файла не удерживает его от закрытия,
+        # даже если обход раздела не завершен
+        view, strings, size = self.view, self.strings, self.record.size
+        for start in range(0, self.rows, CHUNK_ROWS):
+            end = min(start + CHUNK_ROWS, self.rows)
+            for values in self.record.iter_unpack(self.buffer[self.offset + start * size : self.offset + end * size]):
+                yield view(strings, values)
+
+
+class Snapshot:
+    """
+    Снимок источников, отображенный в память.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу снимка.
+        :raises ValueError: Если файл не является снимком источников текущей версии
+            или создан для других полей моделей.
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, length = HEADER.unpack_from(self.buffer)
+            if (magic, version) != (MAGIC, SNAPSHOT_VERSION):
+                raise ValueError(f"Файл {path} не является снимком источников версии {SNAPSHOT_VERSION}")
+            description = json.loads(self.buffer[HEADER.size : HEADER.size + length].decode("utf-8"))
+            # разделы, созданные для других полей моделей, не используются
+            for section in description["sections"]:
+                record = RECORDS_BY_NAME.get(section["model"])
+                if record is None or list(record.fields) != section["fields"]:
+                    raise ValueError(f"Снимок {path} создан для других полей модели {section['model']}")
+        except (struct.error, KeyError, ValueError):
+            self.buffer.close()
+            raise
+
+        start = align(HEADER.size + length)
+        self.checksums: dict[str, str] = description["checksums"]
+        self.strings = StringTable(self.buffer, *(start + offset for offset in description["strings"]))
+        self.sections = {
+            section["model"]: Section(self.buffer, self.strings, start + section["offset"], section)
+            for section in description["sections"]
+        }
+
+    def is_current(self, checksums: dict[str, str]) -> bool:
+        """
+        Проверка соответствия снимка входному файлу.
+
+        :param checksums: Контрольные суммы листов входного файла.
+        :return: Снимок создан по входному файлу с теми же контрольными суммами листов.
+        """
+
+        return self.checksums == checksums
+
+    def iter_items(self, models: Iterable[Type[BaseModel]]) -> Iterator[SnapshotView]:
+        """
+        Получение источников из разделов снимка.
+
+        :param models: Модели источников в порядке чтения.
+        :raises KeyError: Если в снимке нет раздела для модели.
+        :return: Итератор представлений записей.
+        """
+
+        for model in models:
+            yield from self.sections[model.__name__]
+
+    def close(self) -> None:
+        """
+        Закрытие отображенного файла (представления записей после закрытия использовать нельзя).
+        """
+
+        self.buffer.close()
+
+
+def write_snapshot(
+    path: str, checksums: dict[str, str], sections: Iterable[tuple[Type[BaseModel], Iterable[Any]]]
+) -> int:
+    """
+    Создание снимка источников (запись выполняется через временный файл).
+
+    :param path: Путь к файлу снимка.
+    :param checksums: Контрольные суммы листов входного файла.
+    :param sections: Модели и прочитанные источники (модели или компактные записи) по типам источников.
+    :return: Количество записанных источников.
+    """
+
+    strings: dict[str, int] = {}
+    descriptions: list[dict[str, Any]] = []
+    packed: list[bytearray] = []
+    for model, items in sections:
+        formats = record_format(model)
+        record = struct.Struct(f"<{formats}")
+        fields = [(field, value_format == STRING_FORMAT) for field, value_format in zip(model.__fields__, formats)]
+        data = bytearray()
+        rows = 0
+        for item in items:
+            values = []
+            for field, string in fields:
+                value = getattr(item, field)
+                if value is None:
+                    values.append(NULL_STRING if string else NULL_INTEGER)
+                elif string:
+                    values.append(strings.setdefault(str(value), len(strings)))
+                else:
+                    values.append(value)
+            data += record.pack(*values)
+            rows += 1
+        descriptions.append(
+            {"model": model.__name__, "fields": list(model.__fields__), "format": formats, "rows": rows}
+        )
+        packed.append(data)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    # смещения частей отсчитываются от начала данных (после описания), поэтому длина описания от них не зависит
+    position = OFFSET.size * len(offsets)
+    strings_position = [0, position]
+    position = align(position + offsets[-1])
+    for description, data in zip(descriptions, packed):
+        description["offset"] = position
+        position = align(position + len(data))
+
+    header = json.dumps(
+        {"checksums": checksums, "strings": strings_position, "sections": descriptions}, ensure_ascii=False
+    ).encode("utf-8")
+    start = align(HEADER.size + len(header))
+    with open(f"{path}.tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, SNAPSHOT_VERSION, len(header)))
+        file.write(header)
+        file.seek(start)
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        file.writelines(encoded)
+        for description, data in zip(descriptions, packed):
+            file.seek(start + description["offset"])
+            file.write(data)
+    os.replace(f"{path}.tmp", path)
+
+    count = sum(description["rows"] for description in descriptions)
+    logger.info("Снимок источников сохранен: %s (источников – %s, строк – %s).", path, count, len(strings))
+
+    return count
+
+
+def open_snapshot(path: str, checksums: dict[str, str]) -> Optional[Snapshot]:
+    """
+    Открытие снимка источников, если он соответствует входному файлу.
+
+    :param path: Путь к файлу снимка.
+    :param checksums: Контрольные суммы листов входного файла.
+    :return: Снимок или `None`, если файл отсутствует, поврежден или создан по другому входному файлу.
+    """
+
+    try:
+        snapshot = Snapshot(path)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+    if not snapshot.is_current(checksums):
+        snapshot.close()
+        return None
+
+    return snapshot
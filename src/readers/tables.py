@@ -0,0 +1,327 @@
+"""
+Чтение табличных источников: директории с таблицами листов в форматах CSV, Parquet и Arrow или отдельной таблицы.
+
+Таблица листа хранится в файле `<наименование листа>.<расширение>`, способ чтения выбирается по расширению.
+Отдельная таблица содержит один лист, остальные листы такого источника пусты.
+Первая строка CSV-файла содержит заголовок, столбцы таблиц Parquet и Arrow сопоставляются атрибутам
+по порядку (как столбцы листа рабочей книги). Значения таблицы читаются и преобразуются по столбцам.
+
+Для чтения Parquet и Arrow необходима библиотека pyarrow (см. requirements.txt, импортируется при чтении
+первой такой таблицы).
+"""
+import csv
+import os
+import zlib
+from datetime import date
+from functools import cached_property
+from typing import Any, Optional, Type
+
+from readers.base import ColumnarSheet, ConvertedColumn, convert_column
+
+# размер блока при вычислении контрольной суммы файла таблицы
+CHUNK_SIZE = 1024 * 1024
+
+
+def to_iso_date(value: Any) -> Any:
+    """
+    Преобразование строки с датой в формате ISO 8601 («ГГГГ-ММ-ДД») в дату.
+
+    :param value: Значение ячейки.
+    :return: Дата (значения в другом формате возвращаются без изменений).
+    """
+
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class CSVSheet(ColumnarSheet):
+    """
+    Лист в формате CSV (UTF-8, первая строка – заголовок).
+
+    Пустые значения соответствуют пустым ячейкам (заменяются на `None` при чтении), даты в формате ISO 8601
+    в столбцах дат преобразуются так же, как даты рабочей книги.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу таблицы.
+        """
+
+        # значения строк добавляются в списки столбцов по мере чтения, без загрузки всех строк таблицы
+        self._columns: list[list[Optional[str]]] = []
+        self._rows = 0
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            rows = csv.reader(file)
+            # первая строка содержит заголовок
+            next(rows, None)
+            for row in rows:
+                if len(row) > len(self._columns):
+                    self._columns.extend([None] * self._rows for _ in range(len(row) - len(self._columns)))
+                for column, value in zip(self._columns, row):
+                    column.append(value or None)
+                # строки разной длины дополняются пустыми значениями
+                for column in self._columns[len(row) :]:
+                    column.append(None)
+                self._rows += 1
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def width(self) -> int:
+        return len(self._columns)
+
+    def column(self, index: int) -> list:
+        if index >= len(self._columns):
+            return [None] * self._rows
+
+        return self._columns[index]
+
+    def convert(self, index: int, data_type: type) -> ConvertedColumn:
+        if data_type is date:
+            return convert_column(list(map(to_iso_date, self.column(index))), data_type)
+
+        return super().convert(index, data_type)
+
+
+class EmptySheet(ColumnarSheet):
+    """
+    Пустой лист (лист, отсутствующий в источнике из одной таблицы).
+    """
+
+    @property
+    def rows(self) -> int:
+        return 0
+
+    @property
+    def width(self) -> int:
+        return 0
+
+    def column(self, index: int) -> list:
+        return []
+
+
+class ArrowSheet(ColumnarSheet):
+    """
+    Лист в формате Arrow IPC (Feather).
+
+    Строковые, целочисленные столбцы и столбцы дат преобразуются функциями `pyarrow.compute`,
+    столбцы других типов и столбцы с некорректными значениями – как значения рабочей книги (с маской ошибок).
+    Пустые строки заменяются на `None` до преобразования (см. `ColumnarSheet`).
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу таблицы.
+        """
+
+        self.table = self.load(path)
+
+    @staticmethod
+    def load(path: str) -> Any:
+        """
+        Загрузка таблицы.
+
+        :param path: Путь к файлу таблицы.
+        :return: Таблица pyarrow.
+        """
+
+        from pyarrow import feather  # pylint: disable=import-outside-toplevel
+
+        return feather.read_table(path)
+
+    @property
+    def rows(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def width(self) -> int:
+        return self.table.num_columns
+
+    def column(self, index: int) -> list:
+        if index >= self.table.num_columns:
+            return [None] * self.table.num_rows
+
+        return self.nullify(self.table.column(index)).to_pylist()
+
+    def convert(self, index: int, data_type: type) -> ConvertedColumn:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if index >= self.table.num_columns:
+            return super().convert(index, data_type)
+
+        array = self.nullify(self.table.column(index))
+        try:
+            if data_type is str and pa.types.is_string(array.type):
+                array = pc.utf8_trim_whitespace(array)
+            elif data_type is int and pa.types.is_string(array.type):
+                array = pc.cast(pc.utf8_trim_whitespace(array), pa.int64())
+            elif data_type is date and pa.types.is_date(array.type):
+                array = pc.strftime(pc.cast(array, pa.timestamp("s")), format="%d.%m.%Y")
+            elif data_type is date and pa.types.is_timestamp(array.type):
+                array = pc.strftime(array, format="%d.%m.%Y")
+            elif not (data_type is int and pa.types.is_integer(array.type)):
+                return super().convert(index, data_type)
+        except pa.ArrowInvalid:
+            # некорректные значения отмечаются в маске ошибок при преобразовании по одному
+            return super().convert(index, data_type)
+
+        return ConvertedColumn(array.to_pylist(), bytearray(self.table.num_rows), {})
+
+    @staticmethod
+    def nullify(array: Any) -> Any:
+        """
+        Замена пустых строк отсутствующими значениями (пустые строки соответствуют пустым ячейкам).
+
+        :param array: Столбец таблицы.
+        :return: Столбец таблицы.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not pa.types.is_string(array.type):
+            return array
+
+        return pc.if_else(pc.equal(array, ""), pa.scalar(None, array.type), array)
+
+
+class ParquetSheet(ArrowSheet):
+    """
+    Лист в формате Parquet.
+    """
+
+    @staticmethod
+    def load(path: str) -> Any:
+        from pyarrow import parquet  # pylint: disable=import-outside-toplevel
+
+        return parquet.read_table(path)
+
+
+# классы листов по расширениям файлов таблиц (в порядке выбора, если для листа есть несколько файлов)
+TABLE_FORMATS: dict[str, Type[ColumnarSheet]] = {
+    ".parquet": ParquetSheet,
+    ".arrow": ArrowSheet,
+    ".feather": ArrowSheet,
+    ".csv": CSVSheet,
+}
+
+
+class TableWorkbook:
+    """
+    Директория с таблицами листов или отдельная таблица (по аналогии с рабочей книгой openpyxl: листы доступны
+    по наименованию).
+    """
+
+    # листы хранят значения по столбцам (см. `BaseReader.iter_extract`)
+    columnar = True
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к директории с таблицами листов или к файлу таблицы.
+        """
+
+        self.path = path
+        # источник из одной таблицы (наименование листа – имя файла без расширения)
+        self.single = not os.path.isdir(path)
+        self._sheets: dict[str, ColumnarSheet] = {}
+
+    @cached_property
+    def files(self) -> dict[str, str]:
+        """
+        Получение путей к файлам таблиц листов.
+
+        :return: Пути к файлам по наименованиям листов.
+        """
+
+        if self.single:
+            return {os.path.splitext(os.path.basename(self.path))[0]: self.path}
+
+        files: dict[str, str] = {}
+        names = sorted(os.listdir(self.path))
+        for extension in TABLE_FORMATS:
+            for name in names:
+                sheet, suffix = os.path.splitext(name)
+                if suffix.lower() == extension:
+                    files.setdefault(sheet, os.path.join(self.path, name))
+
+        return files
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """
+        Получение наименований листов.
+
+        :return: Наименования листов.
+        """
+
+        return list(self.files)
+
+    def __getitem__(self, sheet: str) -> ColumnarSheet:
+        """
+        Получение листа (таблица загружается при первом обращении).
+
+        :param sheet: Наименование листа.
+        :raises KeyError: Если таблица листа не найдена в директории.
+        :return: Лист (для источника из одной таблицы другие листы пусты).
+        """
+
+        if sheet not in self._sheets:
+            if sheet not in self.files and self.single:
+                return EmptySheet()
+            if sheet not in self.files:
+                raise KeyError(f"Таблица листа «{sheet}» не найдена в директории {self.path}")
+            path = self.files[sheet]
+            self._sheets[sheet] = TABLE_FORMATS[os.path.splitext(path)[1].lower()](path)
+
+        return self._sheets[sheet]
+
+    def checksums(self) -> dict[str, str]:
+        """
+        Получение контрольных сумм таблиц листов (CRC-32 и размер файла).
+
+        :return: Контрольные суммы по наименованиям листов.
+        """
+
+        checksums = {}
+        for sheet, path in self.files.items():
+            checksum = 0
+            with open(path, "rb") as file:
+                while chunk := file.read(CHUNK_SIZE):
+                    checksum = zlib.crc32(chunk, checksum)
+            checksums[sheet] = f"{checksum:08x}{os.path.getsize(path):x}"
+
+        return checksums
+
+    def close(self) -> None:
+        """
+        Освобождение загруженных таблиц.
+        """
+
+        self._sheets.clear()
+
+
+def is_table_source(path: Any) -> bool:
+    """
+    Проверка, является ли источник директорией с таблицами листов или файлом таблицы.
+
+    :param path: Путь к исходному файлу или открытый файловый объект.
+    :return: Источник является директорией или файлом с расширением из `TABLE_FORMATS`.
+    """
+
+    if not isinstance(path, (str, os.PathLike)):
+        return False
+
+    return os.path.isdir(path) or os.path.splitext(path)[1].lower() in TABLE_FORMATS
@@ -0,0 +1,176 @@
+"""
+Пакетная (по столбцам) проверка значений атрибутов моделей.
+"""
+from typing import Any, NamedTuple, Optional, Type
+
+from pydantic import BaseModel
+
+
+class RowError(NamedTuple):
+    """
+    Ошибка в строке исходного файла.
+    """
+
+    # наименование листа рабочей книги
+    sheet: str
+    # номер строки на листе
+    row: int
+    # наименование атрибута (не задано для ошибок разбора строки)
+    field: Optional[str]
+    # описание ошибки
+    message: str
+
+    def __str__(self) -> str:
+        field = f", поле {self.field}" if self.field else ""
+
+        return f"лист «{self.sheet}», строка {self.row}{field}: {self.message}"
+
+
+class CellError(ValueError):
+    """
+    Ошибка преобразования значения ячейки к типу данных атрибута.
+    """
+
+    def __init__(self, field: str, message: str) -> None:
+        """
+        Конструктор.
+
+        :param field: Наименование атрибута.
+        :param message: Описание ошибки.
+        """
+
+        self.field = field
+        super().__init__(message)
+
+
+class SheetValidationError(ValueError):
+    """
+    Ошибка проверки строк листа рабочей книги.
+    """
+
+    def __init__(self, errors: list[RowError]) -> None:
+        """
+        Конструктор.
+
+        :param errors: Ошибки в строках исходного файла.
+        """
+
+        self.errors = errors
+        super().__init__("Ошибки в строках исходного файла:\n" + "\n".join(f"- {error}" for error in errors))
+
+
+class ColumnRule(NamedTuple):
+    """
+    Правило проверки столбца значений атрибута модели.
+    """
+
+    # наименование атрибута
+    field: str
+    # тип значения атрибута
+    type: Type
+    # обязательность заполнения
+    required: bool
+    # нижняя граница значения (не включительно)
+    gt: Optional[Any]
+
+    @classmethod
+    def compile(cls, model: Type[BaseModel], fields: tuple[str, ...]) -> tuple["ColumnRule", ...]:
+        """
+        Построение правил проверки по описанию полей модели.
+
+        :param model: Модель объекта (строки).
+        :param fields: Наименования атрибутов.
+        :return: Правила проверки столбцов.
+        """
+
+        rules = []
+        for field in fields:
+            model_field = model.__fields__[field]
+            # ограниченные типы (например, `Field(..., gt=0)`) приводятся к базовому типу
+            field_type = next(
+                (
+                    base
+                    for base in (int, str)
+                    if isinstance(model_field.type_, type) and issubclass(model_field.type_, base)
+                ),
+                model_field.type_,
+            )
+            rules.append(
+                cls(
+                    field,
+                    field_type,
+                    model_field.required is True and not model_field.allow_none,
+                    model_field.field_info.gt,
+                )
+            )
+
+        return tuple(rules)
+
+    def check(self, column: list) -> tuple[dict[int, str], list[int]]:
+        """
+        Проверка столбца значений атрибута.
+
+        Числа, заданные для строковых атрибутов, приводятся к строкам (как при валидации модели).
+
+        :param column: Значения атрибута (приведенные значения записываются на место).
+        :return: Описания ошибок по индексам значений и индексы приведенных значений.
+        """
+
+        errors = {}
+        coerced = []
+        if self.required:
+            errors.update(
+                (index, "обязательное значение не заполнено")
+                for index, value in enumerate(column)
+                if value is None or value == ""
+            )
+
+        if self.type is str:
+            for index in [i for i, value in enumerate(column) if value is not None and type(value) is not str]:
+                if isinstance(column[index], (int, float)):
+                    column[index] = str(column[index])
+                    coerced.append(index)
+                elif index not in errors:
+                    errors[index] = "значение должно быть строкой"
+        elif self.type is int:
+            errors.update(
+                (index, "значение должно быть целым числом")
+                for index, value in enumerate(column)
+                if value is not None and type(value) is not int and index not in errors
+            )
+
+        if self.gt is not None:
+            errors.update(
+                (index, f"значение должно быть больше {self.gt}")
+                for index, value in enumerate(column)
+                if type(value) is int and value <= self.gt
+            )
+
+        return errors, coerced
+
+
+def validate_batch(
+    rules: tuple[ColumnRule, ...], records: list[dict], numbers: list[int], sheet: str
+) -> tuple[set[int], list[RowError]]:
+    """
+    Проверка пакета значений атрибутов по столбцам.
+
+    :param rules: Правила проверки столбцов.
+    :param records: Значения атрибутов моделей (приведенные значения записываются на место).
+    :param numbers: Номера строк на листе.
+    :param sheet: Наименование листа рабочей книги.
+    :return: Индексы строк с ошибками и описания ошибок.
+    """
+
+    invalid: set[int] = set()
+    errors = []
+    for rule in rules:
+        column = [attrs[rule.field] for attrs in records]
+        column_errors, coerced = rule.check(column)
+        for index in coerced:
+            records[index][rule.field] = column[index]
+        for index, message in column_errors.items():
+            invalid.add(index)
+            errors.append(RowError(sheet, numbers[index], rule.field, message))
+
+    return invalid, errors
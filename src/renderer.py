@@ -3,11 +3,73 @@
 """
 from __future__ import annotations
 
+import html
+import io
+import json
+import re
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, BinaryIO, ClassVar, Iterable, Iterator, Optional, TextIO, Type, Union
+from xml.sax.saxutils import escape
 
 from docx import Document
+from docx.document import Document as DocumentObject
 from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
 from docx.shared import Pt
+from pydantic import BaseModel
+
+from formatters.models import (
+    BookModel,
+    InternetResourceModel,
+    ArticlesCollectionModel,
+    JournalArticleModel,
+    NewspaperModel,
+)
+from formatters.records import BaseRecord
+from formatters.styles.base import BaseCitationStyle
+from outputs import FORMAT_CLASSES, RENDERER_CLASSES
+
+# количество абзацев, разбираемых или записываемых в XML за одну операцию
+CHUNK_SIZE = 10000
+
+# часть пакета Word с телом документа
+DOCUMENT_PART = "word/document.xml"
+
+# символы, недопустимые в XML (табуляция и переводы строк заменяются элементами абзаца)
+ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def paragraph_xml(text: str, style_id: str) -> str:
+    """
+    Получение XML абзаца Word с заданным стилем.
+
+    Результат совпадает с абзацем, создаваемым `Document.add_paragraph(text, style)`:
+    табуляция заменяется на `<w:tab/>`, переводы строк – на `<w:br/>`.
+
+    :param text: Текст абзаца.
+    :param style_id: Идентификатор стиля абзаца.
+    :raises ValueError: Если текст содержит управляющие символы, недопустимые в XML (как в python-docx).
+    :return: XML абзаца.
+    """
+
+    if ILLEGAL_XML_CHARS.search(text):
+        raise ValueError("All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters")
+
+    content = []
+    for part in re.split(r"([\t\r\n])", text):
+        if part == "\t":
+            content.append("<w:tab/>")
+        elif part in ("\r", "\n"):
+            content.append("<w:br/>")
+        elif part:
+            space = ' xml:space="preserve"' if len(part.strip()) < len(part) else ""
+            content.append(f"<w:t{space}>{escape(part)}</w:t>")
+
+    run = f"<w:r>{''.join(content)}</w:r>" if text else ""
+
+    return f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>{run}</w:p>'
 
 
 class Renderer:
@@ -15,14 +77,26 @@ class Renderer:
     Создание выходного файла – Word.
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    # требуются ли оформленные источники с моделями (иначе достаточно оформленных строк)
+    structured: ClassVar[bool] = False
+    # расширение и MIME-тип выходного файла
+    extension: ClassVar[str] = "docx"
+    media_type: ClassVar[str] = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+    def __init__(self, rows: Iterable[str]):
+        """
+        Конструктор.
+
+        :param rows: Оформленные строки источников (кортеж или итератор).
+        """
+
         self.rows = rows
 
-    def render(self, path: Path | str) -> None:
+    def create_document(self) -> DocumentObject:
         """
-        Метод генерации Word-файла со списком использованных источников.
+        Создание документа Word с заголовком и стилями списка использованных источников.
 
-        :param Path | str path: Путь для сохранения выходного файла.
+        :return: Документ Word.
         """
 
         document = Document()
@@ -40,9 +114,345 @@ class Renderer:
         style_normal.paragraph_format.line_spacing = 1.5
         style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
+        return document
+
+    def render(self, path: Path | str | BinaryIO) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str | BinaryIO path: Путь или файловый объект для сохранения выходного файла.
+        """
+
+        document = self.create_document()
+
         for row in self.rows:
             # добавление источника
             document.add_paragraph(row, style="List Number")
 
         # сохранение файла Word
         document.save(path)
+
+
+class BulkRenderer(Renderer):
+    """
+    Создание выходного файла – Word с пакетной записью абзацев.
+
+    Части пакета Word, кроме тела документа, берутся из пустого документа с заголовком и стилями.
+    Абзацы источников формируются в виде XML и записываются в тело документа пакетами по мере получения строк,
+    без создания объектов абзацев python-docx и элементов lxml, поэтому объем памяти не зависит
+    от количества источников. Запись возможна и в файловый объект без поддержки перемещения (например,
+    стандартный вывод или канал): размеры частей архива записываются после их данных.
+    """
+
+    def iter_paragraphs(self, style_id: str) -> Iterator[bytes]:
+        """
+        Получение пакетов XML абзацев источников.
+
+        :param style_id: Идентификатор стиля абзацев.
+        :return: Итератор пакетов XML абзацев в кодировке UTF-8.
+        """
+
+        chunk: list[str] = []
+        for row in self.rows:
+            chunk.append(paragraph_xml(row, style_id))
+            if len(chunk) >= CHUNK_SIZE:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
+
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
+
+    def render(self, path: Path | str | BinaryIO) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str | BinaryIO path: Путь или файловый объект для сохранения выходного файла.
+        """
+
+        document = self.create_document()
+        style_id = document.styles["List Number"].style_id
+
+        template = io.BytesIO()
+        document.save(template)
+
+        with zipfile.ZipFile(template) as source, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename != DOCUMENT_PART:
+                    target.writestr(info, source.read(info))
+                    continue
+
+                # абзацы записываются перед параметрами раздела документа
+                xml = source.read(info)
+                position = xml.rindex(b"<w:sectPr")
+                # размер тела документа заранее неизвестен и может превысить 2 ГиБ
+                with target.open(info, "w", force_zip64=True) as stream:
+                    stream.write(xml[:position])
+                    for chunk in self.iter_paragraphs(style_id):
+                        stream.write(chunk)
+                    stream.write(xml[position:])
+
+
+# соответствие моделей типам записей и полям BibTeX
+BIBTEX_ENTRIES: dict[Type[BaseModel], tuple[str, dict[str, str]]] = {
+    BookModel: (
+        "book",
+        {
+            "authors": "author",
+            "title": "title",
+            "edition": "edition",
+            "city": "address",
+            "publishing_house": "publisher",
+            "year": "year",
+            "pages": "pagetotal",
+        },
+    ),
+    InternetResourceModel: (
+        "online",
+        {
+            "article": "title",
+            "website": "organization",
+            "link": "url",
+            "access_date": "urldate",
+        },
+    ),
+    ArticlesCollectionModel: (
+        "incollection",
+        {
+            "authors": "author",
+            "article_title": "title",
+            "collection_title": "booktitle",
+            "city": "address",
+            "publishing_house": "publisher",
+            "year": "year",
+            "pages": "pages",
+        },
+    ),
+    JournalArticleModel: (
+        "article",
+        {
+            "authors": "author",
+            "article_title": "title",
+            "journal_title": "journal",
+            "year": "year",
+            "issue": "number",
+            "pages": "pages",
+        },
+    ),
+    NewspaperModel: (
+        "article",
+        {
+            "authors": "author",
+            "article_title": "title",
+            "newspaper_title": "journal",
+            "year": "year",
+            "issue": "number",
+            "date": "date",
+        },
+    ),
+}
+
+# экранирование специальных символов BibTeX
+BIBTEX_ESCAPES = str.maketrans({char: f"\\{char}" for char in "&%$#_{}"})
+
+
+def model_type(data: Union[BaseModel, BaseRecord]) -> Type[BaseModel]:
+    """
+    Получение модели источника (для компактных записей – модели, поля которой повторяет запись).
+
+    :param data: Модель или компактная запись источника.
+    :return: Класс модели.
+    """
+
+    return data.model if isinstance(data, BaseRecord) else type(data)
+
+
+def bibtex_value(field: str, value: Any, data: Union[BaseModel, BaseRecord]) -> str:
+    """
+    Приведение значения атрибута источника к значению поля BibTeX.
+
+    :param field: Наименование поля BibTeX.
+    :param value: Значение атрибута источника.
+    :param data: Модель или компактная запись источника.
+    :return: Значение поля BibTeX.
+    """
+
+    value = str(value)
+    if field == "url":
+        return value
+    if field == "author":
+        return " and ".join(author.strip() for author in value.split(",")).translate(BIBTEX_ESCAPES)
+    if field == "pages":
+        return re.sub(r"\s*[-–]\s*", "--", value)
+    if field in ("urldate", "date"):
+        # даты вида «дд.мм.гггг» и «дд.мм» (с годом издания) приводятся к формату ISO 8601
+        if match := re.fullmatch(r"(\d{2})\.(\d{2})(?:\.(\d{4}))?", value):
+            day, month, year = match.groups()
+            return f"{year or data.year}-{month}-{day}"
+
+    return value.translate(BIBTEX_ESCAPES)
+
+
+@contextmanager
+def open_text(path: Path | str | BinaryIO) -> Iterator[TextIO]:
+    """
+    Открытие выходного файла для записи текста в кодировке UTF-8.
+
+    Переданный файловый объект не закрывается после записи.
+
+    :param Path | str | BinaryIO path: Путь или файловый объект для сохранения выходного файла.
+    :return: Текстовый поток.
+    """
+
+    if isinstance(path, (str, Path)):
+        with open(path, "w", encoding="utf-8", newline="\n") as stream:
+            yield stream
+        return
+
+    stream = io.TextIOWrapper(path, encoding="utf-8", newline="\n")
+    try:
+        yield stream
+    finally:
+        stream.flush()
+        stream.detach()
+
+
+class TextRenderer(ABC):
+    """
+    Базовый класс создания текстового выходного файла.
+
+    Источники записываются в файл по мере обхода, без накопления документа в памяти.
+    """
+
+    structured: ClassVar[bool] = False
+    extension: ClassVar[str] = "txt"
+    media_type: ClassVar[str] = "text/plain; charset=utf-8"
+
+    def __init__(self, rows: Iterable[Union[str, BaseCitationStyle]]):
+        """
+        Конструктор.
+
+        :param rows: Оформленные строки или оформленные источники (кортеж или итератор).
+        """
+
+        self.rows = rows
+
+    def header(self) -> str:
+        """
+        Получение начала файла.
+
+        :return:
+        """
+
+        return ""
+
+    @abstractmethod
+    def format_row(self, number: int, row: Any) -> str:
+        """
+        Получение записи источника.
+
+        :param number: Порядковый номер источника в списке.
+        :param row: Оформленная строка или оформленный источник.
+        :return:
+        """
+
+    def footer(self) -> str:
+        """
+        Получение окончания файла.
+
+        :return:
+        """
+
+        return ""
+
+    def render(self, path: Path | str | BinaryIO) -> None:
+        """
+        Метод генерации файла со списком использованных источников.
+
+        :param Path | str | BinaryIO path: Путь или файловый объект для сохранения выходного файла.
+        """
+
+        with open_text(path) as stream:
+            stream.write(self.header())
+            stream.writelines(self.format_row(number, row) for number, row in enumerate(self.rows, start=1))
+            stream.write(self.footer())
+
+
+class PlainTextRenderer(TextRenderer):
+    """
+    Создание выходного файла – нумерованный список в виде простого текста.
+    """
+
+    def format_row(self, number: int, row: Any) -> str:
+        return f"{number}. {row}\n"
+
+
+class HTMLRenderer(TextRenderer):
+    """
+    Создание выходного файла – HTML-страница с нумерованным списком.
+    """
+
+    extension = "html"
+    media_type = "text/html; charset=utf-8"
+
+    def header(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html lang="ru">\n<head>\n<meta charset="utf-8">\n'
+            "<title>Список использованной литературы</title>\n</head>\n<body>\n"
+            "<h1>Список использованной литературы</h1>\n<ol>\n"
+        )
+
+    def format_row(self, number: int, row: Any) -> str:
+        return f"<li>{html.escape(str(row))}</li>\n"
+
+    def footer(self) -> str:
+        return "</ol>\n</body>\n</html>\n"
+
+
+class JSONLinesRenderer(TextRenderer):
+    """
+    Создание выходного файла – JSON Lines: тип и атрибуты источника вместе с оформленной строкой.
+    """
+
+    structured = True
+    extension = "jsonl"
+    media_type = "application/x-ndjson; charset=utf-8"
+
+    def format_row(self, number: int, row: BaseCitationStyle) -> str:
+        record = {
+            "number": number,
+            "type": model_type(row.data).__name__,
+            "style": type(row).__name__,
+            "fields": row.data.dict(),
+            "formatted": row.formatted,
+        }
+
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class BibTeXRenderer(TextRenderer):
+    """
+    Создание выходного файла – BibTeX (поля записей в формате biblatex).
+    """
+
+    structured = True
+    extension = "bib"
+    media_type = "application/x-bibtex; charset=utf-8"
+
+    def format_row(self, number: int, row: BaseCitationStyle) -> str:
+        entry_type, fields = BIBTEX_ENTRIES[model_type(row.data)]
+
+        lines = [f"@{entry_type}{{{entry_type}{number},"]
+        for attribute, field in fields.items():
+            value: Optional[Any] = getattr(row.data, attribute)
+            if value is not None and value != "":
+                lines.append(f"  {field} = {{{bibtex_value(field, value, row.data)}}},")
+        lines.append("}\n\n")
+
+        return "\n".join(lines)
+
+
+# способы генерации Word-файла
+RENDERERS: dict[str, type[Renderer]] = {name: globals()[class_name] for name, class_name in RENDERER_CLASSES.items()}
+
+# форматы выходного файла (кроме Word)
+FORMATS: dict[str, Type[TextRenderer]] = {name: globals()[class_name] for name, class_name in FORMAT_CLASSES.items()}
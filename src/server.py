@@ -0,0 +1,498 @@
+"""
+HTTP-сервис генерации библиографических списков.
+
+Сервис принимает входной файл .xlsx или JSON-список источников и возвращает выходной файл.
+Оформление источников выполняется в пуле процессов, запущенных и загруженных заранее (при старте сервиса),
+количество одновременно обрабатываемых запросов ограничено, а при переполнении очереди ожидания
+запросы сразу отклоняются с кодом 503. При аварийном завершении рабочего процесса пул создается заново.
+
+.. code-block::
+
+    POST /render?citation=gost&format=docx
+    Content-Type: application/json
+
+    [{"type": "BookModel", "fields": {"authors": "Иванов И.М.", "title": "Наука", ...}}, ...]
+"""
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from http import HTTPStatus
+from multiprocessing.synchronize import Barrier
+from time import perf_counter
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from formatters.models import MODELS
+from logger import get_logger
+from main import CitationEnum, get_formatter, get_renderer
+from readers.reader import SourcesReader
+from settings import (
+    SERVER_CONCURRENCY,
+    SERVER_HOST,
+    SERVER_MAX_BODY_SIZE,
+    SERVER_PORT,
+    SERVER_QUEUE_LIMIT,
+    SERVER_WORKERS,
+)
+
+logger = get_logger(__name__)
+
+# время ожидания заголовков и тела запроса (в секундах)
+REQUEST_TIMEOUT = 30
+
+# способ запуска рабочих процессов: при пересоздании пула процессы не должны наследовать
+# открытые соединения основного процесса (иначе соединения не закрываются после ответа)
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+# время ожидания загрузки всех рабочих процессов пула (в секундах)
+WARM_UP_TIMEOUT = 60
+
+# источники для предварительной загрузки рабочих процессов
+WARM_UP_SOURCES = [
+    {
+        "type": "JournalArticleModel",
+        "fields": {
+            "authors": "Иванов И.М.",
+            "article_title": "Наука как искусство",
+            "journal_title": "Образование и наука",
+            "year": 2020,
+            "issue": 10,
+            "pages": "25-30",
+        },
+    }
+]
+
+
+class RequestError(Exception):
+    """
+    Ошибка в данных запроса (передается из рабочего процесса, поэтому содержит только описание).
+    """
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки HTTP-запроса с кодом ответа.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str = "") -> None:
+        """
+        Конструктор.
+
+        :param status: Код ответа.
+        :param message: Описание ошибки.
+        """
+
+        self.status = status
+        super().__init__(message or status.phrase)
+
+
+def render_sources(body: bytes, content_type: str, citation: str, output_format: str, engine: str) -> bytes:
+    """
+    Генерация выходного файла по телу запроса (выполняется в рабочем процессе).
+
+    :param body: Входной файл .xlsx или JSON-список источников вида `{"type": "BookModel", "fields": {...}}`.
+    :param content_type: Тип содержимого тела запроса.
+    :param citation: Стиль цитирования.
+    :param output_format: Формат выходного файла.
+    :param engine: Способ генерации Word-файла.
+    :raises RequestError: Если данные запроса некорректны.
+    :return: Содержимое выходного файла.
+    """
+
+    try:
+        citation_style, formatter = get_formatter(citation)
+        renderer = get_renderer(output_format, engine)
+        if content_type.startswith("application/json"):
+            sources = json.loads(body)
+            models = [MODELS[source["type"]](**source["fields"]) for source in sources]
+        else:
+            reader = SourcesReader(io.BytesIO(body), read_only=True, bulk=True)
+            # рабочая книга закрывается и при ошибке чтения, чтобы не удерживать ее в рабочем процессе
+            try:
+                models = reader.read(citation_style)
+            finally:
+                reader.close()
+
+        items = formatter(models).format()
+        output = io.BytesIO()
+        renderer(items if renderer.structured else [str(item) for item in items]).render(output)
+    except Exception as ex:  # pylint: disable=broad-except
+        # исключения pydantic и openpyxl не всегда передаются между процессами, поэтому передается описание
+        raise RequestError(f"{type(ex).__name__}: {ex}") from None
+
+    return output.getvalue()
+
+
+def warm_up() -> None:
+    """
+    Предварительная загрузка рабочего процесса (шаблоны стилей цитирования и шаблон документа Word).
+    """
+
+    body = json.dumps(WARM_UP_SOURCES).encode("utf-8")
+    for citation in (CitationEnum.GOST.name, CitationEnum.NLM.name):
+        render_sources(body, "application/json", citation, "docx", "bulk")
+
+
+def start_worker(barrier: Barrier, prepare: Callable[[], None]) -> None:
+    """
+    Инициализация рабочего процесса (выполняется при запуске процесса, до получения первой задачи).
+
+    Процесс загружается и ожидает загрузки остальных процессов пула, поэтому ни один процесс не получает
+    задачу запуска, пока загружены не все процессы.
+
+    :param barrier: Барьер на количество рабочих процессов пула.
+    :param prepare: Функция загрузки рабочего процесса.
+    """
+
+    prepare()
+    barrier.wait(WARM_UP_TIMEOUT)
+
+
+def response(status: HTTPStatus, body: bytes, content_type: str, headers: Optional[dict[str, str]] = None) -> bytes:
+    """
+    Формирование HTTP-ответа.
+
+    :param status: Код ответа.
+    :param body: Тело ответа.
+    :param content_type: Тип содержимого тела ответа.
+    :param headers: Дополнительные заголовки.
+    :return: HTTP-ответ.
+    """
+
+    lines = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+        *(f"{name}: {value}" for name, value in (headers or {}).items()),
+    ]
+
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class BibliographyServer:
+    """
+    HTTP-сервис генерации библиографических списков.
+    """
+
+    def __init__(
+        self,
+        workers: int = SERVER_WORKERS,
+        concurrency: int = SERVER_CONCURRENCY,
+        queue_limit: int = SERVER_QUEUE_LIMIT,
+        max_body_size: int = SERVER_MAX_BODY_SIZE * 1024 * 1024,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param workers: Количество рабочих процессов (0 – по количеству процессоров).
+        :param concurrency: Количество одновременно обрабатываемых запросов (0 – по количеству процессов).
+        :param queue_limit: Количество ожидающих запросов, при превышении которого запросы отклоняются.
+        :param max_body_size: Максимальный размер тела запроса (в байтах).
+        """
+
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency or self.workers
+        self.queue_limit = queue_limit
+        self.max_body_size = max_body_size
+
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        # количество ожидающих, обрабатываемых, обработанных и отклоненных запросов
+        self.waiting = 0
+        self.active = 0
+        self.served = 0
+        self.rejected = 0
+        # количество пересозданий пула после аварийного завершения рабочего процесса
+        self.restarts = 0
+
+    async def start_executor(self) -> None:
+        """
+        Создание пула рабочих процессов и ожидание их запуска.
+
+        Каждый рабочий процесс загружается инициализатором пула (см. `start_worker`), поэтому после выполнения
+        задач запуска загружены все процессы пула.
+        """
+
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context(START_METHOD)
+        if START_METHOD == "forkserver":
+            # модули приложения импортируются один раз в процессе, из которого запускаются рабочие процессы
+            context.set_forkserver_preload([__name__])
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=start_worker,
+            initargs=(context.Barrier(self.workers), warm_up),
+        )
+
+        # одновременно отправленные задачи запускают все рабочие процессы пула
+        pids = await asyncio.gather(*(loop.run_in_executor(self.executor, os.getpid) for _ in range(self.workers)))
+        logger.info("Запущено рабочих процессов: %s.", len(set(pids)))
+
+    async def start(self, host: str = SERVER_HOST, port: int = SERVER_PORT) -> asyncio.AbstractServer:
+        """
+        Запуск рабочих процессов и прием соединений.
+
+        :param host: Адрес сервиса.
+        :param port: Порт сервиса (0 – свободный порт).
+        :return: Сервер asyncio.
+        """
+
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+
+        # рабочие процессы запускаются и загружаются до приема первого запроса
+        await self.start_executor()
+
+        server = await asyncio.start_server(self.handle, host, port)
+        logger.info("HTTP-сервис запущен: %s.", ", ".join(str(sock.getsockname()) for sock in server.sockets))
+
+        return server
+
+    def close(self) -> None:
+        """
+        Остановка рабочих процессов.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    async def submit(self, body: bytes, content_type: str, citation: str, output_format: str, engine: str) -> bytes:
+        """
+        Генерация выходного файла в рабочем процессе с ограничением количества одновременных запросов.
+
+        :param body: Тело запроса.
+        :param content_type: Тип содержимого тела запроса.
+        :param citation: Стиль цитирования.
+        :param output_format: Формат выходного файла.
+        :param engine: Способ генерации Word-файла.
+        :raises HTTPError: Если сервис не запущен, очередь ожидания переполнена или рабочий процесс
+            завершился аварийно.
+        :return: Содержимое выходного файла.
+        """
+
+        if self.semaphore is None or self.executor is None:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Сервис не запущен")
+
+        if self.semaphore.locked() and self.waiting >= self.queue_limit:
+            self.rejected += 1
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Сервис перегружен, повторите запрос позже")
+
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        executor = self.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, partial(render_sources, body, content_type, citation, output_format, engine)
+            )
+        except BrokenProcessPool as ex:
+            # пул пересоздается один раз для всех запросов, выполнявшихся в нем
+            if self.executor is executor:
+                logger.error("Рабочий процесс завершился аварийно, пул процессов создается заново: %s", ex)
+                executor.shutdown(cancel_futures=True)
+                self.restarts += 1
+                await self.start_executor()
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, "Рабочий процесс завершился аварийно") from ex
+        finally:
+            self.active -= 1
+            self.semaphore.release()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str], bytes]:
+        """
+        Чтение HTTP-запроса.
+
+        :param reader: Поток чтения соединения.
+        :raises HTTPError: Если запрос некорректен или превышает допустимый размер.
+        :return: Метод, адрес, заголовки (с наименованиями в нижнем регистре) и тело запроса.
+        """
+
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST) from ex
+
+        request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        try:
+            method, target, _ = request_line.split(" ")
+            pairs = (line.split(":", 1) for line in header_lines)
+            headers = {name.strip().lower(): value.strip() for name, value in pairs}
+            length = int(headers.get("content-length", "0"))
+        except ValueError as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST) from ex
+
+        if length > self.max_body_size:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), REQUEST_TIMEOUT)
+        except asyncio.IncompleteReadError as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST) from ex
+
+        return method, target, headers, body
+
+    async def dispatch(self, method: str, target: str, headers: dict[str, str], body: bytes) -> bytes:
+        """
+        Обработка HTTP-запроса.
+
+        :param method: Метод запроса.
+        :param target: Адрес запроса.
+        :param headers: Заголовки запроса.
+        :param body: Тело запроса.
+        :raises HTTPError: Если запрос не может быть обработан.
+        :return: HTTP-ответ.
+        """
+
+        url = urlsplit(target)
+        if url.path == "/health":
+            stats = {
+                "workers": self.workers,
+                "concurrency": self.concurrency,
+                "active": self.active,
+                "waiting": self.waiting,
+                "served": self.served,
+                "rejected": self.rejected,
+                "restarts": self.restarts,
+            }
+            return response(HTTPStatus.OK, json.dumps(stats).encode("utf-8"), "application/json")
+
+        if url.path != "/render":
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        citation = query.get("citation", CitationEnum.GOST.name)
+        output_format = query.get("format", "docx")
+        engine = query.get("engine", "bulk")
+        try:
+            renderer = get_renderer(output_format, engine)
+        except KeyError as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Формат {output_format} ({engine}) не поддерживается") from ex
+
+        try:
+            content = await self.submit(body, headers.get("content-type", ""), citation, output_format, engine)
+        except RequestError as ex:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(ex)) from ex
+
+        self.served += 1
+
+        return response(
+            HTTPStatus.OK,
+            content,
+            renderer.media_type,
+            {"Content-Disposition": f'attachment; filename="bibliography.{renderer.extension}"'},
+        )
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обработка соединения (один запрос на соединение).
+
+        :param reader: Поток чтения соединения.
+        :param writer: Поток записи соединения.
+        """
+
+        started = perf_counter()
+        method, target = "-", "-"
+        try:
+            method, target, headers, body = await self.read_request(reader)
+            data = await self.dispatch(method, target, headers, body)
+            status = HTTPStatus.OK
+        except HTTPError as ex:
+            status = ex.status
+            extra = {"Retry-After": "1"} if status is HTTPStatus.SERVICE_UNAVAILABLE else None
+            data = response(status, str(ex).encode("utf-8"), "text/plain; charset=utf-8", extra)
+        except asyncio.TimeoutError:
+            status = HTTPStatus.REQUEST_TIMEOUT
+            data = response(status, status.phrase.encode("utf-8"), "text/plain; charset=utf-8")
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.error("При обработке запроса возникла ошибка: %s", ex)
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            data = response(status, status.phrase.encode("utf-8"), "text/plain; charset=utf-8")
+
+        try:
+            writer.write(data)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+        logger.info("%s %s – %s, время – %.3f с.", method, target, status.value, perf_counter() - started)
+
+
+async def serve(server: BibliographyServer, host: str, port: int) -> None:
+    """
+    Запуск HTTP-сервиса до остановки процесса.
+
+    :param server: HTTP-сервис.
+    :param host: Адрес сервиса.
+    :param port: Порт сервиса.
+    """
+
+    try:
+        async with await server.start(host, port) as listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+@click.command()
+@click.option("--host", "host", type=str, default=SERVER_HOST, show_default=True, help="Адрес сервиса")
+@click.option("--port", "-p", "port", type=int, default=SERVER_PORT, show_default=True, help="Порт сервиса")
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=0),
+    default=SERVER_WORKERS,
+    show_default=True,
+    help="Количество рабочих процессов (0 – по количеству процессоров)",
+)
+@click.option(
+    "--concurrency",
+    "concurrency",
+    type=click.IntRange(min=0),
+    default=SERVER_CONCURRENCY,
+    show_default=True,
+    help="Количество одновременно обрабатываемых запросов (0 – по количеству процессов)",
+)
+@click.option(
+    "--queue_limit",
+    "queue_limit",
+    type=click.IntRange(min=0),
+    default=SERVER_QUEUE_LIMIT,
+    show_default=True,
+    help="Количество ожидающих запросов, при превышении которого запросы отклоняются с кодом 503",
+)
+def run_server(host: str, port: int, workers: int, concurrency: int, queue_limit: int) -> None:
+    """
+    Запуск HTTP-сервиса генерации библиографических списков.
+
+    :param str host: Адрес сервиса
+    :param int port: Порт сервиса
+    :param int workers: Количество рабочих процессов
+    :param int concurrency: Количество одновременно обрабатываемых запросов
+    :param int queue_limit: Количество ожидающих запросов, при превышении которого запросы отклоняются
+    """
+
+    try:
+        asyncio.run(serve(BibliographyServer(workers, concurrency, queue_limit), host, port))
+    except KeyboardInterrupt:
+        logger.info("HTTP-сервис остановлен.")
+
+
+if __name__ == "__main__":
+    # запуск HTTP-сервиса
+    run_server()
@@ -12,6 +12,33 @@ INPUT_FILE_PATH: str = os.getenv("INPUT_FILE_PATH", "../media/input.xlsx")
 # путь к выходному файлу
 OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 
+# объем памяти для сортировки списка источников (в мегабайтах),
+# при превышении которого используется внешняя сортировка (0 – сортировка в памяти)
+SORT_MEMORY_LIMIT: int = int(os.getenv("SORT_MEMORY_LIMIT", "0"))
+
+# путь к файлу кэша оформленных источников (пустое значение – без кэша)
+CITATION_CACHE_PATH: str = os.getenv("CITATION_CACHE_PATH", "")
+# максимальное количество записей в кэше оформленных источников
+CITATION_CACHE_SIZE: int = int(os.getenv("CITATION_CACHE_SIZE", "1000000"))
+
+# путь к файлу снимка прочитанных источников (пустое значение – без снимка)
+SNAPSHOT_PATH: str = os.getenv("SNAPSHOT_PATH", "")
+
+# минимальная оценка коэффициента Жаккара для похожих источников при поиске повторов (режим fuzzy)
+DEDUPLICATION_THRESHOLD: float = float(os.getenv("DEDUPLICATION_THRESHOLD", "0.8"))
+
+# адрес и порт HTTP-сервиса
+SERVER_HOST: str = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8080"))
+# количество процессов оформления источников HTTP-сервиса (0 – по количеству процессоров)
+SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", "0"))
+# количество одновременно обрабатываемых запросов (0 – по количеству процессов)
+SERVER_CONCURRENCY: int = int(os.getenv("SERVER_CONCURRENCY", "0"))
+# количество запросов, ожидающих обработки, при превышении которого запросы отклоняются (503)
+SERVER_QUEUE_LIMIT: int = int(os.getenv("SERVER_QUEUE_LIMIT", "16"))
+# максимальный размер тела запроса (в мегабайтах)
+SERVER_MAX_BODY_SIZE: int = int(os.getenv("SERVER_MAX_BODY_SIZE", "32"))
+
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
 # формат для записей логов
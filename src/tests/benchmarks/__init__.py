@@ -0,0 +1,25 @@
+"""
+Тесты производительности (бенчмарки).
+
+Бенчмарки сравнивают время выполнения и поэтому не запускаются вместе с остальными тестами: они отмечаются
+маркером `benchmark` и пропускаются, если не задана переменная окружения `BENCHMARKS=1`.
+
+.. code-block::
+
+    cd src
+    BENCHMARKS=1 BENCHMARK_ROWS=100000 python -m pytest tests/benchmarks
+
+Количество строк синтетических данных задается переменной окружения `BENCHMARK_ROWS`,
+допустимое время импорта модуля запуска приложения – переменной окружения `IMPORT_TIME_BUDGET`.
+"""
+
+import os
+
+# запуск бенчмарков (по умолчанию пропускаются)
+BENCHMARKS_ENABLED: bool = os.getenv("BENCHMARKS", "") == "1"
+
+# количество строк синтетических данных для бенчмарков
+BENCHMARK_ROWS: int = int(os.getenv("BENCHMARK_ROWS", "10000"))
+
+# допустимое время импорта модуля запуска приложения (в миллисекундах, по данным `python -X importtime`)
+IMPORT_TIME_BUDGET: int = int(os.getenv("IMPORT_TIME_BUDGET", "250"))
@@ -0,0 +1,36 @@
+"""
+Настройка запуска бенчмарков.
+"""
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks import BENCHMARKS_ENABLED
+
+BENCHMARKS_PATH = Path(__file__).parent
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Регистрация маркера бенчмарков.
+
+    :param config: Конфигурация pytest.
+    """
+
+    config.addinivalue_line("markers", "benchmark: тест производительности (запускается при BENCHMARKS=1)")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    Отметка бенчмарков маркером и их пропуск, если запуск бенчмарков не включен.
+
+    :param config: Конфигурация pytest.
+    :param items: Собранные тесты.
+    """
+
+    skip = pytest.mark.skip(reason="бенчмарки запускаются при BENCHMARKS=1")
+    for item in items:
+        if BENCHMARKS_PATH in Path(str(item.path)).parents:
+            item.add_marker(pytest.mark.benchmark)
+            if not BENCHMARKS_ENABLED:
+                item.add_marker(skip)
@@ -0,0 +1,363 @@
+"""
+Набор бенчмарков этапов обработки: чтение входного файла, оформление источников и генерация выходного файла.
+
+Для каждого размера входного файла и стиля цитирования измеряются скорость этапа (строк в секунду)
+и пиковый объем резидентной памяти процесса во время этапа. Результаты сохраняются в JSON
+и сравниваются с базовыми результатами предыдущего запуска.
+
+По умолчанию выходной файл создается потоковой записью архива: время построчной генерации средствами
+python-docx растет быстрее количества строк, поэтому для больших файлов она измеряется отдельно (`--engine docx`).
+
+.. code-block::
+
+    cd src
+    python -m tests.benchmarks.suite --rows 1000 --rows 100000 --save
+    python -m tests.benchmarks.suite --rows 1000000 --mix book=1,journal=1 --baseline /tmp/baseline.json
+"""
+import gc
+import json
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, NamedTuple, Optional
+
+import click
+
+from main import ENGINES, CitationEnum, get_formatter, get_renderer
+from profiler import current_rss
+from readers.reader import SourcesReader
+from tests.benchmarks.workbook import DEFAULT_MIX, parse_mix, write_workbook
+
+# путь к файлу базовых результатов
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# размеры входных файлов по умолчанию (количество строк)
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+# допустимое ухудшение результатов относительно базовых (доля)
+DEFAULT_TOLERANCE = 0.25
+
+# интервал измерения объема памяти (в секундах)
+RSS_INTERVAL = 0.005
+
+
+class StageResult(NamedTuple):
+    """
+    Результат измерения этапа обработки.
+    """
+
+    # стиль цитирования
+    style: str
+    # количество строк входного файла
+    rows: int
+    # этап обработки
+    stage: str
+    # количество обработанных источников
+    items: int
+    # время выполнения этапа в секундах
+    seconds: float
+    # скорость этапа (источников в секунду)
+    rows_per_second: float
+    # пиковый объем резидентной памяти процесса во время этапа (в мегабайтах)
+    peak_rss_mb: float
+
+
+class PeakRSS:
+    """
+    Измерение пикового объема резидентной памяти процесса в фоновом потоке.
+    """
+
+    def __init__(self, interval: float = RSS_INTERVAL) -> None:
+        """
+        Конструктор.
+
+        :param interval: Интервал измерения в секундах.
+        """
+
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        """
+        Измерение объема памяти до остановки.
+        """
+
+        while True:
+            self.peak = max(self.peak, current_rss())
+            if self._stopped.wait(self.interval):
+                break
+
+    def __enter__(self) -> "PeakRSS":
+        self.peak = current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def measure(
+    style: str, rows: int, stage: str, function: Callable[[], Any], items: Optional[int] = None
+) -> tuple[Any, StageResult]:
+    """
+    Измерение времени и памяти этапа обработки.
+
+    :param style: Стиль цитирования.
+    :param rows: Количество строк входного файла.
+    :param stage: Этап обработки.
+    :param function: Функция этапа.
+    :param items: Количество обрабатываемых источников (по умолчанию – длина результата функции).
+    :return: Результат функции и результат измерения.
+    """
+
+    gc.collect()
+    with PeakRSS() as rss:
+        started = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - started
+
+    items = len(result) if items is None else items
+    stage_result = StageResult(
+        style, rows, stage, items, round(seconds, 4), round(items / seconds, 1), round(rss.peak / 1024 / 1024, 1)
+    )
+
+    return result, stage_result
+
+
+def run_suite(
+    sizes: list[int],
+    styles: list[str],
+    workdir: Path,
+    mix: str = DEFAULT_MIX,
+    engine: str = "bulk",
+    streaming: bool = False,
+    echo: Callable[[str], Any] = lambda message: None,
+) -> list[StageResult]:
+    """
+    Запуск бенчмарков этапов обработки.
+
+    Входные файлы создаются в рабочей директории и используются повторно при следующих запусках.
+
+    :param sizes: Размеры входных файлов (количество строк).
+    :param styles: Стили цитирования.
+    :param workdir: Рабочая директория для входных и выходных файлов.
+    :param mix: Распределение строк по листам (см. `workbook.parse_mix`).
+    :param engine: Способ генерации Word-файла.
+    :param streaming: Потоковое чтение входного файла.
+    :param echo: Функция вывода результатов этапов.
+    :return: Результаты измерения этапов.
+    """
+
+    workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for rows in sizes:
+        path = workdir / f"input_{rows}_{mix.replace(',', '_').replace('=', '')}.xlsx"
+        if not path.exists():
+            echo(f"Создание входного файла: строк – {rows} ...")
+            write_workbook(path, rows, mix)
+
+        for style in styles:
+            citation_style, formatter = get_formatter(style)
+            reader = SourcesReader(str(path), read_only=streaming)
+            models, read_result = measure(citation_style, rows, "read", lambda: reader.read(citation_style))
+            reader.close()
+            formatted, format_result = measure(
+                citation_style, rows, "format", lambda: [str(item) for item in formatter(models).format()]
+            )
+            del models
+            renderer = get_renderer("docx", engine)
+            output = workdir / f"output_{rows}_{citation_style}.{renderer.extension}"
+            _, render_result = measure(
+                citation_style, rows, "render", lambda: renderer(formatted).render(str(output)), len(formatted)
+            )
+            del formatted
+
+            for result in (read_result, format_result, render_result):
+                echo(
+                    f"{result.style:5} {result.rows:>8} {result.stage:7} {result.rows_per_second:>12.1f} строк/с "
+                    f"{result.peak_rss_mb:>9.1f} МБ"
+                )
+                results.append(result)
+
+    return results
+
+
+def compare(
+    results: list[StageResult], baseline: list[StageResult], tolerance: float = DEFAULT_TOLERANCE
+) -> list[str]:
+    """
+    Сравнение результатов с базовыми.
+
+    :param results: Результаты текущего запуска.
+    :param baseline: Базовые результаты.
+    :param tolerance: Допустимое ухудшение скорости и памяти (доля).
+    :return: Описания ухудшений (пустой список, если ухудшений нет).
+    """
+
+    previous = {(result.style, result.rows, result.stage): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get((result.style, result.rows, result.stage))
+        if base is None:
+            continue
+        name = f"{result.style}/{result.rows}/{result.stage}"
+        if result.rows_per_second < base.rows_per_second * (1 - tolerance):
+            regressions.append(f"{name}: скорость {result.rows_per_second} строк/с (базовая – {base.rows_per_second})")
+        if result.peak_rss_mb > base.peak_rss_mb * (1 + tolerance):
+            regressions.append(f"{name}: память {result.peak_rss_mb} МБ (базовая – {base.peak_rss_mb})")
+
+    return regressions
+
+
+def load_results(path: Path, parameters: dict[str, Any]) -> Optional[list[StageResult]]:
+    """
+    Загрузка сохраненных результатов.
+
+    :param path: Путь к файлу результатов.
+    :param parameters: Параметры текущего запуска.
+    :return: Результаты (не заданы, если файл отсутствует или получен с другими параметрами).
+    """
+
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if data["parameters"] != parameters:
+        return None
+
+    return [StageResult(**result) for result in data["results"]]
+
+
+def save_results(path: Path, parameters: dict[str, Any], results: list[StageResult]) -> None:
+    """
+    Сохранение результатов (вместе с параметрами запуска и описанием окружения).
+
+    :param path: Путь к файлу результатов.
+    :param parameters: Параметры запуска.
+    :param results: Результаты измерения этапов.
+    """
+
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": [result._asdict() for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+
+
+@click.command()
+@click.option(
+    "--rows",
+    "-r",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=DEFAULT_SIZES,
+    show_default=True,
+    help="Размер входного файла (количество строк), можно указать несколько раз",
+)
+@click.option(
+    "--citation",
+    "-c",
+    "styles",
+    type=click.Choice([CitationEnum.GOST.name, CitationEnum.NLM.name], case_sensitive=False),
+    multiple=True,
+    default=(CitationEnum.GOST.name, CitationEnum.NLM.name),
+    show_default=True,
+    help="Стиль цитирования, можно указать несколько раз",
+)
+@click.option("--mix", "mix", type=str, default=DEFAULT_MIX, show_default=True, help="Распределение строк по листам")
+@click.option(
+    "--engine",
+    "-e",
+    "engine",
+    type=click.Choice(ENGINES, case_sensitive=False),
+    default="bulk",
+    show_default=True,
+    help="Способ генерации Word-файла",
+)
+@click.option("--streaming", "streaming", is_flag=True, default=False, help="Потоковое чтение входного файла")
+@click.option(
+    "--workdir",
+    "workdir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Рабочая директория для входных файлов (по умолчанию – временная директория)",
+)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(dir_okay=False),
+    default=str(BASELINE_PATH),
+    show_default=True,
+    help="Путь к файлу базовых результатов",
+)
+@click.option("--save", "save", is_flag=True, default=False, help="Сохранение результатов как базовых")
+@click.option(
+    "--tolerance",
+    "tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Допустимое ухудшение скорости и памяти относительно базовых результатов (доля)",
+)
+def run_benchmarks(
+    sizes: tuple[int, ...],
+    styles: tuple[str, ...],
+    mix: str,
+    engine: str,
+    streaming: bool,
+    workdir: Optional[str],
+    baseline_path: str,
+    save: bool,
+    tolerance: float,
+) -> None:
+    """
+    Запуск набора бенчмарков этапов обработки со сравнением с базовыми результатами.
+
+    :param sizes: Размеры входных файлов
+    :param styles: Стили цитирования
+    :param str mix: Распределение строк по листам
+    :param str engine: Способ генерации Word-файла
+    :param bool streaming: Потоковое чтение входного файла
+    :param workdir: Рабочая директория для входных файлов
+    :param str baseline_path: Путь к файлу базовых результатов
+    :param bool save: Сохранение результатов как базовых
+    :param float tolerance: Допустимое ухудшение результатов
+    """
+
+    parse_mix(mix)
+    parameters = {"mix": mix, "engine": engine.lower(), "streaming": streaming}
+    with TemporaryDirectory() as temporary:
+        results = run_suite(
+            list(sizes), list(styles), Path(workdir or temporary), mix, engine, streaming, echo=click.echo
+        )
+
+    baseline = load_results(Path(baseline_path), parameters)
+    if save:
+        save_results(Path(baseline_path), parameters, results)
+        click.echo(f"Базовые результаты сохранены: {baseline_path}.")
+    if baseline is None:
+        click.echo("Базовые результаты с такими параметрами отсутствуют, сравнение не выполнялось.")
+        return
+
+    regressions = compare(results, baseline, tolerance)
+    for regression in regressions:
+        click.echo(f"Ухудшение: {regression}", err=True)
+    if regressions:
+        sys.exit(1)
+    click.echo("Ухудшений относительно базовых результатов нет.")
+
+
+if __name__ == "__main__":
+    # запуск набора бенчмарков
+    run_benchmarks()
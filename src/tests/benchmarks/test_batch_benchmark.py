@@ -0,0 +1,52 @@
+"""
+Тестирование производительности пакетной обработки входных файлов.
+"""
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from batch import process_files
+from settings import TEMPLATE_FILE_PATH
+
+# количество входных файлов
+FILES_COUNT = 8
+
+
+class TestBatchBenchmark:
+    """
+    Тестирование производительности пакетной обработки входных файлов.
+    """
+
+    def test_batch(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение пакетной обработки файлов с запуском отдельной команды для каждого файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        paths = [tmp_path / f"input_{index}.xlsx" for index in range(FILES_COUNT)]
+        for path in paths:
+            shutil.copy(TEMPLATE_FILE_PATH, path)
+
+        started = time.perf_counter()
+        for path in paths:
+            subprocess.run(
+                [sys.executable, "main.py", "-pi", str(path), "-po", str(path.with_suffix(".docx"))],
+                check=True,
+                capture_output=True,
+            )
+        per_command = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = process_files(paths, tmp_path / "output", 2, {}, "docx")
+        batch = time.perf_counter() - started
+
+        record_property("command_files_per_second", round(FILES_COUNT / per_command, 2))
+        record_property("batch_files_per_second", round(FILES_COUNT / batch, 2))
+
+        assert all(result.error is None for result in results)
+        assert batch < per_command
@@ -0,0 +1,58 @@
+"""
+Тестирование производительности кэша оформленных источников.
+"""
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from formatters.cache import CitationCache
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTCitationFormatter
+from tests.benchmarks import BENCHMARK_ROWS
+
+
+def format_time(models: list[BookModel], cache: Optional[CitationCache]) -> float:
+    """
+    Измерение времени оформления источников.
+
+    :param models: Модели источников.
+    :param cache: Кэш оформленных источников.
+    :return: Время в секундах.
+    """
+
+    started = time.perf_counter()
+    GOSTCitationFormatter(models, cache).format()
+    if cache is not None:
+        cache.close()
+
+    return time.perf_counter() - started
+
+
+class TestCacheBenchmark:
+    """
+    Тестирование производительности кэша оформленных источников.
+    """
+
+    def test_cache(self, tmp_path: Path, book_model_fixture: BookModel, record_property: Callable) -> None:
+        """
+        Измерение скорости оформления без кэша, с пустым и с заполненным кэшем.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        models = [book_model_fixture.copy(update={"pages": i + 1}) for i in range(BENCHMARK_ROWS)]
+        path = str(tmp_path / "cache.db")
+
+        uncached = format_time(models, None)
+        cold = format_time(models, CitationCache(path))
+        cache = CitationCache(path)
+        hot = format_time(models, cache)
+
+        record_property("uncached_rows_per_second", round(BENCHMARK_ROWS / uncached))
+        record_property("cold_cache_rows_per_second", round(BENCHMARK_ROWS / cold))
+        record_property("hot_cache_rows_per_second", round(BENCHMARK_ROWS / hot))
+
+        # при повторном запуске оформление не выполняется
+        assert (cache.hits, cache.misses) == (BENCHMARK_ROWS, 0)
@@ -0,0 +1,56 @@
+"""
+Тестирование производительности сортировки с ключами сопоставления.
+"""
+import time
+from functools import cmp_to_key
+from typing import Callable
+
+from formatters.collation import collation_key
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import SURNAMES
+
+
+def compare(first: str, second: str) -> int:
+    """
+    Сравнение строк с преобразованием при каждом сравнении (без предварительно вычисленных ключей).
+
+    :param first: Первая строка.
+    :param second: Вторая строка.
+    :return: Отрицательное число, ноль или положительное число.
+    """
+
+    first_key, second_key = collation_key(first), collation_key(second)
+
+    return (first_key > second_key) - (first_key < second_key)
+
+
+class TestCollationBenchmark:
+    """
+    Тестирование производительности сортировки с ключами сопоставления.
+    """
+
+    def test_sort(self, record_property: Callable) -> None:
+        """
+        Сравнение сортировки по предварительно вычисленным ключам и с преобразованием строк при каждом сравнении.
+
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        rows = [
+            f"{SURNAMES[index * 7 % len(SURNAMES)]} И.М. Наука как искусство. Часть {index * 7919 % BENCHMARK_ROWS}"
+            for index in range(BENCHMARK_ROWS)
+        ]
+
+        started = time.perf_counter()
+        with_keys = sorted(rows, key=lambda row: (collation_key(row), row))
+        precomputed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        per_comparison = sorted(rows, key=cmp_to_key(compare))
+        comparisons = time.perf_counter() - started
+
+        record_property("precomputed_rows_per_second", round(BENCHMARK_ROWS / precomputed))
+        record_property("per_comparison_rows_per_second", round(BENCHMARK_ROWS / comparisons))
+
+        assert [collation_key(row) for row in with_keys] == [collation_key(row) for row in per_comparison]
+        assert precomputed < comparisons
@@ -0,0 +1,110 @@
+"""
+Тестирование производительности поиска повторяющихся источников.
+"""
+import time
+from typing import Callable
+
+from formatters.deduplication import AUTHOR_FIELDS, Deduplicator, key_fields, normalize
+from formatters.records import BaseRecord, BookRecord
+from readers.reader import BookReader
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import ROWS, SURNAMES
+
+# количество строк для попарного сравнения (квадратичная сложность)
+PAIRWISE_ROWS = 5000
+
+
+def make_records(rows: int) -> list[BaseRecord]:
+    """
+    Создание записей книг, половина которых – повторы с другой записью пробелов, регистра и инициалов.
+
+    :param rows: Количество записей.
+    :return: Записи книг.
+    """
+
+    authors, title, edition, city, publishing_house, year, pages = ROWS[BookReader]
+    records = []
+    for index in range(rows):
+        number = index // 2
+        surname = SURNAMES[number % len(SURNAMES)]
+        if index % 2:
+            values = (f"{surname}  И. М.", f"{title.upper()}. Часть {number}")
+        else:
+            values = (f"{surname} И.М.", f"{title} Часть {number}")
+        records.append(
+            BookRecord(
+                authors=values[0],
+                title=values[1],
+                edition=edition,
+                city=city,
+                publishing_house=publishing_house,
+                year=year,
+                pages=pages,
+            )
+        )
+
+    return records
+
+
+def pairwise(records: list[BaseRecord]) -> list[BaseRecord]:
+    """
+    Исключение повторов попарным сравнением нормализованных ключевых полей с оставленными записями.
+
+    :param records: Записи источников.
+    :return: Записи без повторов.
+    """
+
+    unique: list[tuple[tuple[str, ...], BaseRecord]] = []
+    for record in records:
+        _, fields = key_fields(record)
+        key = tuple(normalize(getattr(record, field), field not in AUTHOR_FIELDS) for field in fields)
+        if all(key != other for other, _ in unique):
+            unique.append((key, record))
+
+    return [record for _, record in unique]
+
+
+class TestDeduplicationBenchmark:
+    """
+    Тестирование производительности поиска повторяющихся источников.
+    """
+
+    def test_index(self, record_property: Callable) -> None:
+        """
+        Сравнение индекса хэшей с попарным сравнением источников.
+
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        records = make_records(PAIRWISE_ROWS)
+
+        started = time.perf_counter()
+        expected = pairwise(records)
+        pairwise_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        unique = Deduplicator().unique(records)
+        index_seconds = time.perf_counter() - started
+
+        record_property("pairwise_rows_per_second", round(PAIRWISE_ROWS / pairwise_seconds))
+        record_property("index_rows_per_second", round(PAIRWISE_ROWS / index_seconds))
+
+        assert unique == expected and len(unique) == PAIRWISE_ROWS // 2
+        assert index_seconds < pairwise_seconds
+
+    def test_scale(self, record_property: Callable) -> None:
+        """
+        Измерение производительности поиска точных и похожих повторов на большом количестве строк.
+
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        records = make_records(BENCHMARK_ROWS)
+        for mode in ("exact", "fuzzy"):
+            deduplicator = Deduplicator(mode)
+            started = time.perf_counter()
+            unique = deduplicator.unique(records)
+            seconds = time.perf_counter() - started
+
+            record_property(f"{mode}_rows_per_second", round(BENCHMARK_ROWS / seconds))
+            assert len(unique) <= BENCHMARK_ROWS // 2 + 1
@@ -0,0 +1,110 @@
+"""
+Тестирование производительности инкрементальной сборки списка источников.
+"""
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from openpyxl import Workbook
+
+from formatters.styles.gost import GOSTCitationFormatter
+from incremental import IncrementalBuild
+from readers.reader import BookReader, NewspaperReader, SourcesReader
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import ROWS
+
+# минимальное количество строк, при котором сравнивается время сборки (на малых файлах преобладают
+# постоянные затраты на открытие рабочей книги)
+TIMING_ROWS = 10000
+
+
+def write_workbook(path: Path, count: int, issue: int) -> None:
+    """
+    Создание входного файла с синтетическими строками.
+
+    :param path: Путь к входному файлу.
+    :param count: Количество строк на листе книг.
+    :param issue: Номер газеты (единственное изменяемое значение).
+    """
+
+    workbook = Workbook(write_only=True)
+    for reader, row in ROWS.items():
+        sheet_reader = reader(None)
+        sheet = workbook.create_sheet(sheet_reader.sheet)
+        sheet.append(tuple(sheet_reader.attributes))
+        if isinstance(sheet_reader, BookReader):
+            for index in range(count):
+                sheet.append(row[:-1] + (index + 1,))
+        elif isinstance(sheet_reader, NewspaperReader):
+            sheet.append(row[:-1] + (issue,))
+        else:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def build_time(path: Path, manifest: Path) -> tuple[float, int]:
+    """
+    Измерение времени инкрементальной сборки.
+
+    :param path: Путь к входному файлу.
+    :param manifest: Путь к файлу манифеста.
+    :return: Время в секундах и количество оформленных заново строк.
+    """
+
+    formatted = []
+
+    class CountingFormatter(GOSTCitationFormatter):
+        """
+        Итоговое форматирование с подсчетом оформляемых строк.
+        """
+
+        def __init__(self, models: list, *args: Any) -> None:
+            formatted.append(len(models))
+            super().__init__(models, *args)
+
+    started = time.perf_counter()
+    reader = SourcesReader(str(path), read_only=True)
+    build = IncrementalBuild(reader, "gost", "docx", str(manifest))
+    build.format(CountingFormatter)
+    build.save()
+    reader.close()
+
+    return time.perf_counter() - started, sum(formatted)
+
+
+class TestIncrementalBenchmark:
+    """
+    Тестирование производительности инкрементальной сборки списка источников.
+    """
+
+    def test_incremental(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение времени полной сборки и повторной сборки после изменения одного листа.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        # создание и чтение файла .xlsx занимают основное время теста
+        count = min(BENCHMARK_ROWS, 20000)
+        path, manifest = tmp_path / "input.xlsx", tmp_path / "output.docx.manifest.json"
+        write_workbook(path, count, 1)
+
+        started = time.perf_counter()
+        reader = SourcesReader(str(path), read_only=True)
+        GOSTCitationFormatter(reader.read()).format()
+        reader.close()
+        full = time.perf_counter() - started
+
+        _, formatted = build_time(path, manifest)
+        assert formatted == count + len(ROWS) - 1
+        write_workbook(path, count, 2)
+        incremental, formatted = build_time(path, manifest)
+
+        record_property("full_build_seconds", round(full, 3))
+        record_property("incremental_build_seconds", round(incremental, 3))
+
+        # оформляется заново только измененная строка листа газет
+        assert formatted == 1
+        if count >= TIMING_ROWS:
+            assert incremental * 2 < full
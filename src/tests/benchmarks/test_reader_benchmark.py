@@ -0,0 +1,173 @@
+"""
+Тестирование производительности чтения строк исходного файла.
+"""
+import time
+from datetime import date
+from typing import Any, Callable, Iterable
+
+import pytest
+
+from readers.base import BaseReader
+from readers.reader import BookReader, InternetResourceReader, JournalArticleReader
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import ROWS, make_row
+
+
+def extract_per_cell(reader: BaseReader, rows: Iterable[tuple]) -> list[dict]:
+    """
+    Извлечение значений атрибутов с разбором описания атрибутов для каждой ячейки (исходная реализация).
+
+    :param reader: Читатель.
+    :param rows: Значения ячеек строк.
+    :return: Значения атрибутов моделей.
+    """
+
+    result = []
+    for row in rows:
+        attrs = {}
+        for attr, params in reader.attributes.items():
+            index, data_type = list(params.items())[0]
+            attrs[attr] = row[index]
+
+            if not attrs[attr]:
+                continue
+
+            if data_type is int:
+                attrs[attr] = int(str(attrs.get(attr)))
+
+            if data_type is str:
+                attrs[attr] = str(attrs.get(attr)).strip()
+
+            if data_type is date:
+                value = attrs.get(attr)
+                if isinstance(value, date):
+                    attrs[attr] = value.strftime("%d.%m.%Y")
+
+        result.append(attrs)
+
+    return result
+
+
+def extract_with_plan(reader: BaseReader, rows: Iterable[tuple]) -> list[dict]:
+    """
+    Извлечение значений атрибутов по плану извлечения читателя.
+
+    :param reader: Читатель.
+    :param rows: Значения ячеек строк.
+    :return: Значения атрибутов моделей.
+    """
+
+    extract = reader.plan.extract
+
+    return [extract(row) for row in rows]
+
+
+def extract_columns(reader: BaseReader, rows: list) -> list[dict]:
+    """
+    Извлечение значений атрибутов с преобразованием по столбцам.
+
+    :param reader: Читатель.
+    :param rows: Значения ячеек строк.
+    :return: Значения атрибутов моделей.
+    """
+
+    # строки передаются читателю без рабочей книги
+    reader.iter_rows = lambda: iter(rows)  # type: ignore
+
+    return [attrs for _, attrs in reader.iter_extract()]
+
+
+def measure(function: Callable[[BaseReader, list], Any], reader: BaseReader, rows: list, repeat: int = 3) -> float:
+    """
+    Измерение лучшего времени выполнения функции.
+
+    :param function: Функция извлечения значений.
+    :param reader: Читатель.
+    :param rows: Значения ячеек строк.
+    :param repeat: Количество повторов.
+    :return: Время в секундах.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(reader, rows)
+        timings.append(time.perf_counter() - started)
+
+    return min(timings)
+
+
+class TestReaderBenchmark:
+    """
+    Тестирование производительности чтения строк исходного файла.
+    """
+
+    @pytest.mark.parametrize("reader_class", [BookReader, InternetResourceReader, JournalArticleReader])
+    def test_extraction_plan(self, reader_class: type[BaseReader], record_property: Callable) -> None:
+        """
+        Сравнение скорости извлечения значений по плану и с разбором атрибутов для каждой ячейки.
+
+        :param reader_class: Класс читателя.
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        reader = reader_class(None)  # type: ignore
+        rows = [ROWS[reader_class]] * BENCHMARK_ROWS
+
+        # результаты извлечения совпадают
+        assert extract_with_plan(reader, rows[:10]) == extract_per_cell(reader, rows[:10])
+
+        per_cell = measure(extract_per_cell, reader, rows)
+        with_plan = measure(extract_with_plan, reader, rows)
+
+        record_property("per_cell_rows_per_second", round(BENCHMARK_ROWS / per_cell))
+        record_property("plan_rows_per_second", round(BENCHMARK_ROWS / with_plan))
+
+        assert with_plan < per_cell
+
+    @pytest.mark.parametrize("reader_class", [BookReader, InternetResourceReader, JournalArticleReader])
+    def test_column_conversion(self, reader_class: type[BaseReader], record_property: Callable) -> None:
+        """
+        Сравнение скорости преобразования значений по столбцам и построчного извлечения по плану.
+
+        :param reader_class: Класс читателя.
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        reader = reader_class(None)  # type: ignore
+        rows = [make_row(reader_class, index) for index in range(BENCHMARK_ROWS)]
+
+        assert extract_columns(reader, rows[:100]) == extract_with_plan(reader, rows[:100])
+
+        # преимущество в десятки процентов сопоставимо с разбросом времени, поэтому число повторов увеличено
+        with_plan = measure(extract_with_plan, reader, rows, repeat=5)
+        columns = measure(extract_columns, reader, rows, repeat=5)
+
+        record_property("plan_rows_per_second", round(BENCHMARK_ROWS / with_plan))
+        record_property("columns_rows_per_second", round(BENCHMARK_ROWS / columns))
+
+        assert columns < with_plan
+
+    @pytest.mark.parametrize("reader_class", [BookReader, JournalArticleReader])
+    def test_bulk_validation(self, reader_class: type[BaseReader], record_property: Callable) -> None:
+        """
+        Сравнение скорости создания моделей с пакетной проверкой значений и с валидацией pydantic.
+
+        :param reader_class: Класс читателя.
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        rows = [ROWS[reader_class]] * BENCHMARK_ROWS
+
+        def read(reader: BaseReader, rows: list) -> list:
+            # строки передаются читателю без рабочей книги
+            reader.iter_rows = lambda: iter(rows)  # type: ignore
+            return reader.read()
+
+        per_row = measure(read, reader_class(None), rows, repeat=1)  # type: ignore
+        bulk = measure(read, reader_class(None, bulk=True), rows, repeat=1)  # type: ignore
+
+        record_property("model_rows_per_second", round(BENCHMARK_ROWS / per_row))
+        record_property("bulk_rows_per_second", round(BENCHMARK_ROWS / bulk))
+
+        assert bulk < per_row
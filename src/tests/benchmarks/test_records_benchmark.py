@@ -0,0 +1,66 @@
+"""
+Тестирование расхода памяти на модели pydantic и компактные записи.
+"""
+import tracemalloc
+from typing import Any, Callable
+
+from formatters.models import BookModel
+from formatters.records import BookRecord
+from tests.benchmarks import BENCHMARK_ROWS
+
+# значения полей книги
+BOOK = {
+    "authors": "Иванов И.М., Петров С.Н.",
+    "title": "Наука как искусство",
+    "edition": "3-е",
+    "city": "СПб.",
+    "publishing_house": "Просвещение",
+    "year": 2020,
+    "pages": 999,
+}
+
+
+def bytes_per_item(factory: Callable[[], Any], count: int) -> float:
+    """
+    Измерение объема памяти на один объект.
+
+    Значения полей общие для всех объектов, поэтому учитываются только накладные расходы представления.
+
+    :param factory: Функция создания объекта.
+    :param count: Количество объектов.
+    :return: Объем памяти в байтах на один объект.
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert len(items) == count
+
+    return (after - before) / count
+
+
+class TestRecordsBenchmark:
+    """
+    Тестирование расхода памяти на модели pydantic и компактные записи.
+    """
+
+    def test_bytes_per_record(self, record_property: Callable) -> None:
+        """
+        Сравнение объема памяти на модель pydantic и компактную запись.
+
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        count = min(BENCHMARK_ROWS, 20000)
+        model_bytes = bytes_per_item(lambda: BookModel.construct(**BOOK), count)
+        record_bytes = bytes_per_item(lambda: BookRecord(**BOOK), count)
+
+        record_property("model_bytes_per_record", round(model_bytes))
+        record_property("record_bytes_per_record", round(record_bytes))
+
+        assert record_bytes * 2 < model_bytes
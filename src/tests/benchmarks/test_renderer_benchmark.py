@@ -0,0 +1,69 @@
+"""
+Тестирование производительности генерации выходного файла.
+"""
+import time
+from pathlib import Path
+from typing import Callable, Type, Union
+
+from renderer import BulkRenderer, PlainTextRenderer, Renderer, TextRenderer
+from tests.benchmarks import BENCHMARK_ROWS
+
+
+def render_time(renderer: Union[Type[Renderer], Type[TextRenderer]], rows: list[str], path: Path) -> float:
+    """
+    Измерение времени генерации выходного файла.
+
+    :param renderer: Класс генерации выходного файла.
+    :param rows: Оформленные строки источников.
+    :param path: Путь для сохранения выходного файла.
+    :return: Время в секундах.
+    """
+
+    started = time.perf_counter()
+    renderer(rows).render(path)
+
+    return time.perf_counter() - started
+
+
+class TestRendererBenchmark:
+    """
+    Тестирование производительности генерации выходного файла.
+    """
+
+    def test_bulk_render(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение скорости генерации Word-файла с пакетным и построчным добавлением абзацев.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        # время построчного добавления абзацев python-docx растет нелинейно
+        count = min(BENCHMARK_ROWS, 2000)
+        rows = [f"Иванов И.М. Наука как искусство. – СПб.: Просвещение, 2020. – {i} с." for i in range(count)]
+
+        per_paragraph = render_time(Renderer, rows, tmp_path / "output.docx")
+        bulk = render_time(BulkRenderer, rows, tmp_path / "output_bulk.docx")
+
+        record_property("docx_rows_per_second", round(count / per_paragraph))
+        record_property("bulk_rows_per_second", round(count / bulk))
+
+        assert bulk < per_paragraph
+
+    def test_text_render(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение скорости генерации простого текста и Word-файла с пакетным добавлением абзацев.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        rows = [f"Иванов И.М. Наука как искусство. – СПб.: Просвещение, 2020. – {i} с." for i in range(BENCHMARK_ROWS)]
+
+        bulk = render_time(BulkRenderer, rows, tmp_path / "output.docx")
+        text = render_time(PlainTextRenderer, rows, tmp_path / "output.txt")
+
+        record_property("bulk_rows_per_second", round(BENCHMARK_ROWS / bulk))
+        record_property("txt_rows_per_second", round(BENCHMARK_ROWS / text))
+
+        assert text < bulk
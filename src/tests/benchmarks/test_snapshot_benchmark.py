@@ -0,0 +1,48 @@
+"""
+Тестирование производительности загрузки снимка источников.
+"""
+import time
+from pathlib import Path
+from typing import Callable
+
+from formatters.styles.gost import GOSTCitationFormatter
+from formatters.styles.nlm import NLMCitationFormatter
+from readers.reader import SourcesReader
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import write_workbook
+
+
+class TestSnapshotBenchmark:
+    """
+    Тестирование производительности загрузки снимка источников.
+    """
+
+    def test_switch_style(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение повторного чтения рабочей книги и загрузки снимка при смене стиля цитирования.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        path = str(tmp_path / "input.xlsx")
+        path_snapshot = str(tmp_path / "input.snapshot")
+        write_workbook(Path(path), BENCHMARK_ROWS)
+
+        # снимок создается при оформлении по ГОСТ
+        reader = SourcesReader(path, read_only=True, records=True, snapshot=path_snapshot)
+        GOSTCitationFormatter(reader.iter_read("gost")).format()
+        reader.close()
+
+        timings = {}
+        results = {}
+        for name, snapshot in (("openpyxl", None), ("snapshot", path_snapshot)):
+            started = time.perf_counter()
+            reader = SourcesReader(path, read_only=True, records=True, snapshot=snapshot)
+            results[name] = [str(item) for item in NLMCitationFormatter(reader.iter_read("nlm")).format()]
+            reader.close()
+            timings[name] = time.perf_counter() - started
+            record_property(f"{name}_rows_per_second", round(len(results[name]) / timings[name]))
+
+        assert results["snapshot"] == results["openpyxl"]
+        assert timings["snapshot"] < timings["openpyxl"]
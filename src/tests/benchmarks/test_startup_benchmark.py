@@ -0,0 +1,72 @@
+"""
+Тестирование производительности запуска приложения.
+"""
+import subprocess
+import sys
+import time
+from typing import Callable
+
+import pytest
+
+from tests.benchmarks import IMPORT_TIME_BUDGET
+
+# зависимости, которые не должны импортироваться при загрузке модулей команд
+HEAVY_MODULES = ("openpyxl", "docx", "lxml", "pydantic")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """
+    Получение времени импорта модулей по данным `python -X importtime`.
+
+    :param module: Импортируемый модуль.
+    :return: Общее время импорта (в микросекундах, с учетом вложенных импортов) по наименованиям модулей.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], check=True, capture_output=True, text=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        # строка вида «import time:   self [us] | cumulative | imported package»
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            _, cumulative, name = line.removeprefix("import time:").split("|")
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestStartupBenchmark:
+    """
+    Тестирование производительности запуска приложения.
+    """
+
+    @pytest.mark.parametrize("module", ["main", "batch"])
+    def test_import_time(self, module: str, record_property: Callable) -> None:
+        """
+        Тестирование времени импорта модуля команды и отсутствия импорта тяжелых зависимостей.
+
+        :param str module: Модуль команды.
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        # первый запуск компилирует модули, измеряется повторный
+        import_times(module)
+        times = import_times(module)
+
+        record_property("import_time_ms", round(times[module] / 1000, 1))
+
+        assert not [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+        assert times[module] / 1000 < IMPORT_TIME_BUDGET
+
+    def test_help(self, record_property: Callable) -> None:
+        """
+        Тестирование времени вывода справки команды.
+
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        started = time.perf_counter()
+        process = subprocess.run([sys.executable, "main.py", "--help"], check=True, capture_output=True, text=True)
+        record_property("help_seconds", round(time.perf_counter() - started, 3))
+
+        assert "--path_input" in process.stdout
@@ -0,0 +1,87 @@
+"""
+Тестирование производительности оформления источников стилями цитирования.
+"""
+import time
+from typing import Any, Callable, Type
+
+import pytest
+
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import (
+    GOSTBook,
+    GOSTInternetResource,
+    GOSTCollectionArticle,
+    GOSTJournalArticle,
+    GOSTNewspaper,
+)
+from formatters.styles.nlm import NLMJournalArticle, NLMNewspaper
+from tests.benchmarks import BENCHMARK_ROWS
+
+# стили цитирования и фикстуры оформляемых моделей
+STYLES = [
+    (GOSTBook, "book_model_fixture"),
+    (GOSTInternetResource, "internet_resource_model_fixture"),
+    (GOSTCollectionArticle, "articles_collection_model_fixture"),
+    (GOSTJournalArticle, "journal_article_model_fixture"),
+    (GOSTNewspaper, "newspaper_model_fixture"),
+    (NLMJournalArticle, "journal_article_model_fixture"),
+    (NLMNewspaper, "newspaper_model_fixture"),
+]
+
+
+def citations_per_second(style: Type[BaseCitationStyle], model: Any, count: int) -> float:
+    """
+    Измерение количества оформленных источников в секунду.
+
+    :param style: Класс стиля цитирования.
+    :param model: Модель источника.
+    :param count: Количество оформлений.
+    :return: Количество оформленных источников в секунду.
+    """
+
+    started = time.perf_counter()
+    for _ in range(count):
+        style(model)
+
+    return count / (time.perf_counter() - started)
+
+
+class TestStylesBenchmark:
+    """
+    Тестирование производительности оформления источников стилями цитирования.
+    """
+
+    @pytest.mark.parametrize("style, fixture", STYLES, ids=[style.__name__ for style, _ in STYLES])
+    def test_citations_per_second(
+        self,
+        style: Type[BaseCitationStyle],
+        fixture: str,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+        record_property: Callable,
+    ) -> None:
+        """
+        Сравнение скорости оформления по скомпилированному шаблону и через `Template.substitute()`.
+
+        :param style: Класс стиля цитирования.
+        :param fixture: Наименование фикстуры модели источника.
+        :param request: Запрос фикстуры pytest.
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        model = request.getfixturevalue(fixture)
+        count = min(BENCHMARK_ROWS, 20000)
+
+        compiled = citations_per_second(style, model, count)
+        formatted = style(model).formatted
+
+        # заполнение шаблона, создаваемого при каждом оформлении
+        monkeypatch.setattr(BaseCitationStyle, "fill", lambda self, **values: self.template.substitute(**values))
+        substituted = citations_per_second(style, model, count)
+
+        record_property("compiled_citations_per_second", round(compiled))
+        record_property("template_citations_per_second", round(substituted))
+
+        assert style(model).formatted == formatted
+        assert compiled > substituted
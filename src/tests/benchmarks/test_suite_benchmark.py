@@ -0,0 +1,70 @@
+"""
+Тестирование набора бенчмарков этапов обработки.
+"""
+from pathlib import Path
+from typing import Callable
+
+import openpyxl
+import pytest
+
+from tests.benchmarks.suite import StageResult, compare, load_results, run_suite, save_results
+from tests.benchmarks.workbook import parse_mix, split_rows, write_workbook
+
+
+class TestSuiteBenchmark:
+    """
+    Тестирование набора бенчмарков этапов обработки.
+    """
+
+    def test_write_workbook(self, tmp_path: Path) -> None:
+        """
+        Тестирование создания входного файла с распределением строк по листам.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        assert split_rows(10, parse_mix("book=1,journal=2")) == {"book": 3, "journal": 7}
+        with pytest.raises(ValueError):
+            parse_mix("books=1")
+
+        counts = write_workbook(tmp_path / "input.xlsx", 100, "book=3,newspaper=1")
+        workbook = openpyxl.load_workbook(tmp_path / "input.xlsx", read_only=True)
+
+        assert counts == {"book": 75, "newspaper": 25}
+        # строка заголовков и строки источников, пустые листы создаются
+        sheets = ("Книга", "Статья из газеты", "Статья из журнала")
+        assert [len(list(workbook[name].values)) for name in sheets] == [76, 26, 1]
+        workbook.close()
+
+    def test_suite(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Тестирование запуска набора бенчмарков и сравнения с базовыми результатами.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        results = run_suite([100], ["gost", "nlm"], tmp_path, "book=1,journal=1", engine="bulk")
+        for result in results:
+            record_property(f"{result.style}_{result.stage}_rows_per_second", result.rows_per_second)
+
+        assert [(result.style, result.stage, result.items) for result in results] == [
+            ("gost", "read", 100),
+            ("gost", "format", 100),
+            ("gost", "render", 100),
+            ("nlm", "read", 50),
+            ("nlm", "format", 50),
+            ("nlm", "render", 50),
+        ]
+        assert all(result.peak_rss_mb > 0 for result in results)
+
+        parameters = {"mix": "book=1,journal=1", "engine": "bulk", "streaming": False}
+        save_results(tmp_path / "baseline.json", parameters, results)
+        baseline = load_results(tmp_path / "baseline.json", parameters)
+        assert baseline == results
+        assert load_results(tmp_path / "baseline.json", {**parameters, "streaming": True}) is None
+
+        # ухудшение скорости и памяти относительно базовых результатов
+        slower = StageResult(*results[0][:5], results[0].rows_per_second / 2, results[0].peak_rss_mb * 2)
+        assert not compare(results, baseline)
+        assert len(compare([slower], baseline)) == 2
@@ -0,0 +1,40 @@
+"""
+Тестирование производительности чтения табличных источников.
+"""
+import time
+from pathlib import Path
+from typing import Callable
+
+from readers.reader import SourcesReader
+from tests.benchmarks import BENCHMARK_ROWS
+from tests.benchmarks.workbook import write_tables, write_workbook
+
+
+class TestTablesBenchmark:
+    """
+    Тестирование производительности чтения табличных источников.
+    """
+
+    def test_csv(self, tmp_path: Path, record_property: Callable) -> None:
+        """
+        Сравнение чтения таблиц CSV с преобразованием по столбцам и потокового чтения рабочей книги openpyxl.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param record_property: Фикстура сохранения результатов в отчете pytest.
+        """
+
+        write_workbook(tmp_path / "input.xlsx", BENCHMARK_ROWS)
+        write_tables(tmp_path / "tables", BENCHMARK_ROWS)
+
+        timings = {}
+        results = {}
+        for name, path in (("openpyxl", tmp_path / "input.xlsx"), ("csv", tmp_path / "tables")):
+            started = time.perf_counter()
+            reader = SourcesReader(str(path), read_only=True, records=True)
+            results[name] = reader.read()
+            reader.close()
+            timings[name] = time.perf_counter() - started
+            record_property(f"{name}_rows_per_second", round(BENCHMARK_ROWS / timings[name]))
+
+        assert results["csv"] == results["openpyxl"] and len(results["csv"]) == BENCHMARK_ROWS
+        assert timings["csv"] < timings["openpyxl"]
@@ -0,0 +1,151 @@
+"""
+Генерация входных файлов с синтетическими строками для бенчмарков.
+"""
+import csv
+from datetime import date
+from pathlib import Path
+from typing import Type
+
+from openpyxl import Workbook
+
+from readers.base import BaseReader
+from readers.reader import (
+    ArticlesCollectionReader,
+    BookReader,
+    InternetResourceReader,
+    JournalArticleReader,
+    NewspaperReader,
+)
+
+# синтетические строки листов рабочей книги
+ROWS = {
+    BookReader: ("Иванов И.М., Петров С.Н. ", "Наука как искусство", "3-е", "СПб.", "Просвещение", 2020, 999),
+    InternetResourceReader: ("Наука как искусство", "Ведомости", "https://www.vedomosti.ru", date(2021, 1, 1)),
+    JournalArticleReader: ("Иванов И.М.", "Наука как искусство", "Образование и наука", 2020, "10", "25-30"),
+    ArticlesCollectionReader: ("Иванов И.М.", "Наука", "Сборник научных трудов", "СПб.", "АСТ", 2020, "25-30"),
+    NewspaperReader: ("Иванов И.М.", "Наука как искусство", "Южный Урал", 1980, "01.10", 5),
+}
+
+# наименования листов в описании распределения строк
+SHEETS: dict[str, Type[BaseReader]] = {
+    "book": BookReader,
+    "internet": InternetResourceReader,
+    "collection": ArticlesCollectionReader,
+    "journal": JournalArticleReader,
+    "newspaper": NewspaperReader,
+}
+
+# распределение строк по листам по умолчанию (доли строк)
+DEFAULT_MIX = "book=4,internet=1,collection=1,journal=2,newspaper=2"
+
+# фамилии авторов синтетических строк (для разнообразия ключей сортировки)
+SURNAMES = ("Иванов", "Петров", "Смирнов", "Кузнецов", "Попов", "Evans", "Green", "Smith", "Ёлкин", "Яковлев")
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """
+    Разбор распределения строк по листам.
+
+    :param mix: Доли строк листов вида «book=4,journal=2» (не указанные листы не заполняются).
+    :raises ValueError: Если наименование листа или доля некорректны.
+    :return: Доли строк по наименованиям листов.
+    """
+
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SHEETS:
+            raise ValueError(f"Неизвестный лист «{name}», допустимые значения: {', '.join(SHEETS)}")
+        weights[name.strip()] = int(weight)
+    if any(weight < 0 for weight in weights.values()) or not sum(weights.values()):
+        raise ValueError(f"Некорректное распределение строк: {mix}")
+
+    return weights
+
+
+def split_rows(rows: int, weights: dict[str, int]) -> dict[str, int]:
+    """
+    Распределение количества строк по листам пропорционально долям (методом наибольших остатков).
+
+    :param rows: Общее количество строк.
+    :param weights: Доли строк по наименованиям листов.
+    :return: Количество строк по наименованиям листов (в сумме равно `rows`).
+    """
+
+    total = sum(weights.values())
+    counts = {name: rows * weight // total for name, weight in weights.items()}
+    remainders = sorted(weights, key=lambda name: rows * weights[name] % total, reverse=True)
+    for name in remainders[: rows - sum(counts.values())]:
+        counts[name] += 1
+
+    return counts
+
+
+def make_row(reader: Type[BaseReader], index: int) -> tuple:
+    """
+    Получение синтетической строки листа с изменяемыми автором, наименованием и числовыми значениями.
+
+    :param reader: Класс читателя листа.
+    :param index: Номер строки.
+    :return: Значения ячеек строки.
+    """
+
+    row = list(ROWS[reader])
+    author = f"{SURNAMES[index * 7 % len(SURNAMES)]} {chr(0x410 + index % 32)}.М."
+    number = index % 900 + 1
+    if reader is InternetResourceReader:
+        row[0] = f"{row[0]}. Выпуск {number}"
+    else:
+        row[0], row[1] = author, f"{row[1]}. Часть {index}"
+    if reader is BookReader:
+        row[6] = number
+    elif reader is NewspaperReader:
+        row[5] = number
+
+    return tuple(row)
+
+
+def write_workbook(path: Path, rows: int, mix: str = DEFAULT_MIX) -> dict[str, int]:
+    """
+    Создание входного файла с синтетическими строками (запись в потоковом режиме openpyxl).
+
+    :param path: Путь к входному файлу.
+    :param rows: Общее количество строк.
+    :param mix: Распределение строк по листам (см. `parse_mix`).
+    :return: Количество строк по наименованиям листов.
+    """
+
+    counts = split_rows(rows, parse_mix(mix))
+    workbook = Workbook(write_only=True)
+    # листы создаются все, в том числе пустые: читатели ожидают наличие листов
+    for name, reader in SHEETS.items():
+        sheet_reader = reader(None)  # type: ignore
+        sheet = workbook.create_sheet(sheet_reader.sheet)
+        sheet.append(tuple(sheet_reader.attributes))
+        for index in range(counts.get(name, 0)):
+            sheet.append(make_row(reader, index))
+    workbook.save(path)
+
+    return counts
+
+
+def write_tables(path: Path, rows: int, mix: str = DEFAULT_MIX) -> dict[str, int]:
+    """
+    Создание директории с таблицами листов CSV с синтетическими строками (как у `write_workbook`).
+
+    :param path: Путь к директории для таблиц.
+    :param rows: Общее количество строк.
+    :param mix: Распределение строк по листам (см. `parse_mix`).
+    :return: Количество строк по наименованиям листов.
+    """
+
+    counts = split_rows(rows, parse_mix(mix))
+    path.mkdir(parents=True, exist_ok=True)
+    for name, reader in SHEETS.items():
+        sheet_reader = reader(None)  # type: ignore
+        with open(path / f"{sheet_reader.sheet}.csv", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(sheet_reader.attributes)
+            writer.writerows(make_row(reader, index) for index in range(counts.get(name, 0)))
+
+    return counts
@@ -0,0 +1,141 @@
+"""
+Тестирование кэша оформленных источников.
+"""
+from pathlib import Path
+from string import Template
+
+import pytest
+
+from formatters.cache import CitationCache, citation_key
+from formatters.models import BookModel, JournalArticleModel, NewspaperModel
+from formatters.records import RECORDS
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+from formatters.styles.nlm import NLMJournalArticle
+
+
+class TestCache:
+    """
+    Тестирование кэша оформленных источников.
+    """
+
+    def test_citation_key(
+        self, book_model_fixture: BookModel, journal_article_model_fixture: JournalArticleModel
+    ) -> None:
+        """
+        Тестирование ключей кэша.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        """
+
+        key = citation_key(GOSTBook, book_model_fixture)
+        record = RECORDS[BookModel].from_model(book_model_fixture)
+
+        # ключ зависит от значений атрибутов и стиля, но не от типа объекта (модель или запись)
+        assert citation_key(GOSTBook, record) == key
+        assert citation_key(GOSTBook, book_model_fixture.copy(update={"pages": 1})) != key
+        assert citation_key(NLMJournalArticle, journal_article_model_fixture) != citation_key(
+            GOSTBook, journal_article_model_fixture
+        )
+
+    def test_citation_key_template(self, monkeypatch: pytest.MonkeyPatch, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование изменения ключа кэша при изменении шаблона стиля.
+
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        key = citation_key(GOSTBook, book_model_fixture)
+
+        monkeypatch.setattr(GOSTBook, "template", property(lambda self: Template("$authors $title ($year)")))
+        monkeypatch.setattr(BaseCitationStyle, "formats", {})
+        assert citation_key(GOSTBook, book_model_fixture) != key
+
+    def test_citation_formatter_cache(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        book_model_fixture: BookModel,
+        journal_article_model_fixture: JournalArticleModel,
+        newspaper_model_fixture: NewspaperModel,
+    ) -> None:
+        """
+        Тестирование оформления источников с использованием кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        :param NewspaperModel newspaper_model_fixture: Фикстура модели газетной статьи
+        """
+
+        models = [book_model_fixture, journal_article_model_fixture, newspaper_model_fixture, book_model_fixture]
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        cache = CitationCache(str(tmp_path / "cache.db"))
+        assert [str(item) for item in GOSTCitationFormatter(models, cache).format()] == expected
+        assert (cache.hits, cache.misses) == (0, 4)
+        cache.close()
+
+        def substitute(self: BaseCitationStyle) -> str:
+            raise AssertionError("Источник оформлен повторно")
+
+        # при повторном запуске все строки берутся из кэша
+        monkeypatch.setattr(GOSTBook, "substitute", substitute)
+        cache = CitationCache(str(tmp_path / "cache.db"))
+        records = [RECORDS[type(model)].from_model(model) for model in models]
+        assert [str(item) for item in GOSTCitationFormatter(iter(records), cache).iter_format()] == expected
+        assert (cache.hits, cache.misses) == (4, 0)
+        cache.close()
+
+    def test_flush_batches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, book_model_fixture: BookModel
+    ) -> None:
+        """
+        Тестирование записи новых строк в базу после каждого пакета оформленных источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        monkeypatch.setattr("formatters.base.BATCH_SIZE", 2)
+        models = [book_model_fixture.copy(update={"pages": pages}) for pages in range(1, 8)]
+
+        cache = CitationCache(str(tmp_path / "cache.db"))
+        pending = []
+        for _ in GOSTCitationFormatter(models, cache).iter_build(models):
+            pending.append(len(cache.pending))
+        (count,) = cache.connection.execute("SELECT COUNT(*) FROM citations").fetchone()
+        cache.close()
+
+        assert max(pending) <= 2 and count == len(models)
+
+    def test_eviction(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование вытеснения давно не использованных записей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        # отметка использования обновляется при каждом запуске
+        monkeypatch.setattr("formatters.cache.TOUCH_INTERVAL", 0)
+
+        models = [book_model_fixture.copy(update={"pages": pages}) for pages in (1, 2, 3)]
+        path = str(tmp_path / "cache.db")
+
+        for model in models:
+            cache = CitationCache(path, max_entries=2)
+            GOSTCitationFormatter([model, models[0]], cache).format()
+            cache.close()
+
+        # первая запись используется в каждом запуске, вытесняется вторая
+        cache = CitationCache(path, max_entries=2)
+        found = cache.lookup([citation_key(GOSTBook, model) for model in models])
+        cache.close()
+
+        assert set(found) == {citation_key(GOSTBook, models[0]), citation_key(GOSTBook, models[2])}
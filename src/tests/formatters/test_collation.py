@@ -0,0 +1,50 @@
+"""
+Тестирование сопоставления оформленных строк.
+"""
+import pytest
+
+from formatters.collation import collation_key
+
+
+class TestCollation:
+    """
+    Тестирование сопоставления оформленных строк.
+    """
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            # русский язык перед иностранными
+            ("Яковлев А.А. Наука", "Abel A. Science"),
+            # регистр не учитывается
+            ("абрамов А.А.", "Борисов Б.Б."),
+            ("Smith J.", "taylor J."),
+            # буква «й» располагается после «и»
+            ("Иванов И.И.", "Йодов И.И."),
+            # пробел перед буквами
+            ("Иванов И.М.", "Иванова А.А."),
+            # цифры перед буквами
+            ("1984 / Оруэлл Дж.", "Азбука"),
+            # латинские буквы с диакритическими знаками – как базовые
+            ("Édouard J.", "Frank J."),
+            # прочие алфавиты – после латиницы
+            ("Zeno Z.", "Ωmega"),
+        ],
+    )
+    def test_order(self, first: str, second: str) -> None:
+        """
+        Тестирование порядка ключей сопоставления.
+
+        :param str first: Строка, располагаемая первой.
+        :param str second: Строка, располагаемая второй.
+        """
+
+        assert collation_key(first) < collation_key(second)
+
+    def test_equivalence(self) -> None:
+        """
+        Тестирование совпадения ключей строк, различающихся регистром и буквами «ё» и «е».
+        """
+
+        assert collation_key("Ёлкин А.А. – М.: Наука") == collation_key("елкин а.а. - м.: наука")
+        assert collation_key("«Наука»") == collation_key('"НАУКА"')
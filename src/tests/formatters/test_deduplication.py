@@ -0,0 +1,198 @@
+"""
+Тестирование поиска повторяющихся источников.
+"""
+import json
+from array import array
+from pathlib import Path
+from typing import Any
+
+import openpyxl
+import pytest
+
+from formatters.deduplication import DUPLICATES_SUFFIX, Deduplicator, normalize
+from formatters.models import BookModel
+from formatters.records import BookRecord, JournalArticleRecord
+from main import generate
+from settings import TEMPLATE_FILE_PATH
+
+BOOK = {
+    "authors": "Иванов И.М., Петров С.Н.",
+    "title": "Наука как искусство",
+    "edition": "3-е",
+    "city": "СПб.",
+    "publishing_house": "Просвещение",
+    "year": 2020,
+    "pages": 999,
+}
+
+
+def book(**values: Any) -> BookRecord:
+    """
+    Создание записи книги.
+
+    :param values: Значения полей, отличающиеся от значений `BOOK`.
+    :return: Запись книги.
+    """
+
+    return BookRecord(**{**BOOK, **values})
+
+
+class TestDeduplication:
+    """
+    Тестирование поиска повторяющихся источников.
+    """
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ("Иванов И.М.", "иванов  И. М."),
+            ("Иванов И.М., Петров С.Н.", "Иванов ИМ Петров СН"),
+            ("Наука как искусство", "Наука как искусство."),
+            ("Ёлкин – «Жизнь»", "елкин жизнь"),
+        ],
+    )
+    def test_normalize(self, first: str, second: str) -> None:
+        """
+        Тестирование совпадения нормализованных значений.
+
+        :param str first: Первое значение.
+        :param str second: Второе значение.
+        """
+
+        assert normalize(first) == normalize(second)
+
+    def test_exact(self) -> None:
+        """
+        Тестирование исключения источников с совпадающими нормализованными ключевыми полями.
+        """
+
+        items = [
+            book(),
+            # модель и запись с одинаковыми значениями совпадают
+            BookModel(**{**BOOK, "authors": "Иванов И. М.,  Петров С. Н."}),
+            book(title="НАУКА КАК ИСКУССТВО!", edition=None),
+            book(authors="Петров С.Н., Иванов И.М."),
+            book(year=2021),
+            book(title="Наука как искуство"),
+            JournalArticleRecord(authors=BOOK["authors"], article_title=BOOK["title"], year=2020),
+        ]
+
+        deduplicator = Deduplicator()
+        unique = deduplicator.unique(items)
+
+        assert unique == [items[0], items[4], items[5], items[6]]
+        assert deduplicator.rows == 7 and deduplicator.duplicates == 3
+        assert [item["index"] for item in deduplicator.groups[0]] == [1, 2, 3]
+        assert deduplicator.types[0] == "BookModel"
+
+    def test_fuzzy(self) -> None:
+        """
+        Тестирование исключения похожих источников.
+        """
+
+        items = [
+            book(),
+            book(title="Наука как искуство"),
+            book(publishing_house="Просвещенiе"),
+            # год издания должен совпадать
+            book(year=2021),
+            book(title="Введение в прикладную лингвистику"),
+        ]
+
+        deduplicator = Deduplicator("fuzzy", threshold=0.7)
+        unique = list(deduplicator.iter_unique(items))
+
+        assert unique == [items[0], items[3], items[4]]
+        assert [item["index"] for item in deduplicator.groups[0]] == [1, 2]
+        assert all(0.7 <= item["similarity"] < 1 for item in deduplicator.groups[0])
+
+    def test_bucket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование сравнения со всеми оставленными источниками, у которых совпадает полоса сигнатуры.
+
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        first = array("I", [1] * 4 + [5] * 28)
+        second = array("I", [1] * 4 + [2] * 28)
+        # с второй сигнатурой совпадает только первая полоса (остальные отличаются одним значением)
+        third = array("I", [1] * 4 + [3 if index % 4 == 0 else 2 for index in range(28)])
+        signatures = {"наука": first, "введение": second, "словарь": third}
+        # сигнатура выбирается по названию книги (предпоследнее слово ключевых полей)
+        monkeypatch.setattr("formatters.deduplication.signature", lambda text: signatures[text.split()[-2]])
+
+        items = [book(title="Наука"), book(title="Введение"), book(title="Словарь")]
+        deduplicator = Deduplicator("fuzzy", threshold=0.7)
+
+        assert deduplicator.unique(items) == items[:2]
+        assert [item["index"] for item in deduplicator.groups[1]] == [2]
+
+    def test_crowded_bucket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование поиска похожего источника в ячейке полосы с большим количеством оставленных источников.
+
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        # у всех оставленных источников совпадает только первая полоса
+        signatures = {f"том{number}": array("I", [1] * 4 + [100 + number] * 28) for number in range(40)}
+        # повтор последнего оставленного источника совпадает с ним в первой полосе и в 21 из 28 остальных ячеек
+        signatures["повтор"] = array("I", [1] * 4 + [7 if index % 4 == 0 else 139 for index in range(28)])
+        monkeypatch.setattr("formatters.deduplication.signature", lambda text: signatures[text.split()[-2]])
+
+        items = [book(title=f"Том{number}") for number in range(40)] + [book(title="Повтор")]
+        deduplicator = Deduplicator("fuzzy", threshold=0.7)
+
+        assert deduplicator.unique(items) == items[:40]
+        assert [item["index"] for item in deduplicator.groups[39]] == [40]
+
+    def test_mode(self) -> None:
+        """
+        Тестирование отказа от неподдерживаемого режима поиска.
+        """
+
+        with pytest.raises(ValueError):
+            Deduplicator("similar")
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    @pytest.mark.parametrize("dedup, expected", [("exact", 11), ("fuzzy", 10)])
+    def test_generate(self, tmp_path: Path, lazy: bool, dedup: str, expected: int) -> None:
+        """
+        Тестирование исключения повторяющихся источников при обработке входного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param bool lazy: Ленивая обработка
+        :param str dedup: Режим поиска повторяющихся источников
+        :param int expected: Количество источников в выходном файле
+        """
+
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        sheet = workbook["Книга"]
+        # повтор с другой записью инициалов и знаков препинания и похожий источник с опечаткой
+        sheet.append(["Иванов  И. М., Петров С.Н.", "Наука как искусство.", "3-е", "СПб.", "Просвещение", 2020, 999])
+        title = "Введение в прикладную лингвистику: учебное пособе"
+        sheet.append(["Баранов А.Н.", title, None, "М.", "Эдиториал УРСС", 2001, 360])
+        path_input = tmp_path / "input.xlsx"
+        workbook.save(path_input)
+
+        path_output = tmp_path / "output.txt"
+        generate(
+            path_input=str(path_input), path_output=str(path_output), output_format="txt", lazy=lazy, dedup=dedup
+        )
+
+        assert len(path_output.read_text(encoding="utf-8").splitlines()) == expected
+        report = json.loads(Path(f"{path_output}{DUPLICATES_SUFFIX}").read_text(encoding="utf-8"))
+        assert report["rows"] == 12 and report["duplicates"] == 12 - expected
+        assert report["groups"][0]["index"] == 0 and report["groups"][0]["type"] == "BookModel"
+        assert report["groups"][0]["duplicates"][0]["fields"]["authors"] == "Иванов  И. М., Петров С.Н."
+
+    def test_incremental(self, tmp_path: Path) -> None:
+        """
+        Тестирование отказа от исключения повторяющихся источников при инкрементальной сборке.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path_output = str(tmp_path / "output.docx")
+        with pytest.raises(ValueError):
+            generate(path_input=TEMPLATE_FILE_PATH, path_output=path_output, incremental=True, dedup="exact")
@@ -16,6 +16,7 @@ from formatters.styles.gost import (
     GOSTCollectionArticle,
     GOSTJournalArticle,
     GOSTNewspaper,
+    GOSTCitationFormatter,
 )
 
 
@@ -133,3 +134,79 @@ class TestGOST:
         assert result[0] == models[1]
         assert result[1] == models[2]
         assert result[2] == models[0]
+
+    def test_citation_formatter_iter_format(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+        journal_article_model_fixture: JournalArticleModel,
+        newspaper_model_fixture: NewspaperModel,
+    ) -> None:
+        """
+        Тестирование ленивого итогового форматирования списка источников.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        :param NewspaperModel newspaper_model_fixture: Фикстура модели газетной статьи
+        :return:
+        """
+
+        models = [
+            internet_resource_model_fixture,
+            newspaper_model_fixture,
+            articles_collection_model_fixture,
+            journal_article_model_fixture,
+            book_model_fixture,
+        ]
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        # модели передаются итератором, результат – итератор строк в том же порядке
+        result = GOSTCitationFormatter(iter(models)).iter_format()
+
+        assert list(result) == expected
+
+        # оформленные источники (в том числе совпадающие) возвращаются в том же порядке, что и строки
+        for memory_limit in (None, 1):
+            items = list(GOSTCitationFormatter(iter(models + models)).iter_format(memory_limit, items=True))
+            assert [item.formatted for item in items] == [row for row in expected for _ in range(2)]
+            assert {type(item.data) for item in items} == {type(model) for model in models}
+
+        assert expected[0].startswith("Иванов И.М., Петров С.Н. Наука как искусство. – 3-е изд.")
+        assert expected[-1].startswith("Наука как искусство // Ведомости")
+
+    def test_citation_formatter_summary(
+        self,
+        book_model_fixture: BookModel,
+        journal_article_model_fixture: JournalArticleModel,
+    ) -> None:
+        """
+        Тестирование подсчета оформленных источников по стилям.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        :return:
+        """
+
+        formatter = GOSTCitationFormatter([book_model_fixture, book_model_fixture, journal_article_model_fixture])
+        formatter.format()
+
+        assert formatter.counts == {GOSTBook.__name__: 2, GOSTJournalArticle.__name__: 1}
+        assert set(formatter.timings) == set(formatter.counts)
+
+    def test_citation_formatter_collation(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование порядка источников: русский язык перед иностранными, без учета регистра и различия «ё» и «е».
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        authors = ["Smith J.", "Яковлев А.А.", "ёлкин Б.Б.", "Евсеев В.В.", "abel K."]
+        models = [book_model_fixture.copy(update={"authors": author}) for author in authors]
+
+        result = [item.data.authors for item in GOSTCitationFormatter(models).format()]
+
+        assert result == ["Евсеев В.В.", "ёлкин Б.Б.", "Яковлев А.А.", "abel K.", "Smith J."]
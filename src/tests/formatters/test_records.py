@@ -0,0 +1,62 @@
+"""
+Тестирование компактных записей со слотами.
+"""
+import pickle
+
+from formatters.models import BookModel, JournalArticleModel, NewspaperModel
+from formatters.records import RECORDS, BookRecord
+from formatters.styles.gost import GOSTCitationFormatter
+from formatters.styles.nlm import NLMCitationFormatter
+
+
+class TestRecords:
+    """
+    Тестирование компактных записей со слотами.
+    """
+
+    def test_fields(self) -> None:
+        """
+        Тестирование соответствия полей записей полям моделей.
+        """
+
+        for model, record in RECORDS.items():
+            assert record.__slots__ == tuple(model.__fields__)
+            assert not hasattr(record(), "__dict__")
+
+    def test_conversion(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование преобразования модели в запись и обратно.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        record = BookRecord.from_model(book_model_fixture)
+
+        assert record.title == "Наука как искусство"
+        assert record.dict() == book_model_fixture.dict()
+        assert record.to_model() == book_model_fixture
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_citation_formatters(
+        self,
+        book_model_fixture: BookModel,
+        journal_article_model_fixture: JournalArticleModel,
+        newspaper_model_fixture: NewspaperModel,
+    ) -> None:
+        """
+        Тестирование оформления записей стилями цитирования.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        :param NewspaperModel newspaper_model_fixture: Фикстура модели газетной статьи
+        """
+
+        models = [book_model_fixture, journal_article_model_fixture, newspaper_model_fixture]
+        records = [RECORDS[type(model)].from_model(model) for model in models]
+
+        assert [str(item) for item in GOSTCitationFormatter(records).format()] == [
+            str(item) for item in GOSTCitationFormatter(models).format()
+        ]
+        assert [str(item) for item in NLMCitationFormatter(records[1:]).format()] == [
+            str(item) for item in NLMCitationFormatter(models[1:]).format()
+        ]
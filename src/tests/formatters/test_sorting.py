@@ -0,0 +1,91 @@
+"""
+Тестирование внешней сортировки ключей источников.
+"""
+import random
+import sys
+
+import pytest
+
+from formatters import sorting
+from formatters.models import BookModel, JournalArticleModel, NewspaperModel
+from formatters.sorting import external_sort, key_size
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestSorting:
+    """
+    Тестирование внешней сортировки ключей источников.
+    """
+
+    def test_external_sort(self) -> None:
+        """
+        Тестирование совпадения порядка внешней сортировки с сортировкой в памяти.
+        """
+
+        rnd = random.Random(0)
+        keys = [(rnd.randrange(5), f"Источник {rnd.randrange(1000)}") for _ in range(5000)]
+
+        # небольшой объем памяти приводит к сохранению множества серий во временные файлы
+        assert list(external_sort(iter(keys), memory_limit=4096)) == sorted(keys)
+
+    def test_external_sort_fan_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование слияния серий в несколько проходов с ограниченным количеством открытых файлов.
+
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        opened = []
+        temporary_file = sorting.tempfile.TemporaryFile
+        monkeypatch.setattr(sorting, "MERGE_FAN_IN", 3)
+        monkeypatch.setattr(
+            sorting.tempfile, "TemporaryFile", lambda **kwargs: opened.append(temporary_file(**kwargs)) or opened[-1]
+        )
+
+        rnd = random.Random(1)
+        keys = [(rnd.randrange(1000), index) for index in range(500)]
+        result = external_sort(iter(keys), memory_limit=512)
+
+        assert next(result) == min(keys)
+        # после промежуточных проходов открыты только серии последнего слияния
+        assert 3 < len(opened) and sum(not run.closed for run in opened) <= 3
+        assert [min(keys), *result] == sorted(keys)
+
+    def test_key_size(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование учета вложенных объектов в размере ключа.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        key = (b"\x00", "Источник", 0, book_model_fixture)
+
+        assert key_size(key) > sys.getsizeof(key) + sum(map(sys.getsizeof, key)) + len(book_model_fixture.title)
+
+    def test_external_sort_in_memory(self) -> None:
+        """
+        Тестирование сортировки, не превышающей заданный объем памяти.
+        """
+
+        keys = [(1, "б"), (0, "в"), (1, "а")]
+
+        assert list(external_sort(keys, memory_limit=1024 * 1024)) == sorted(keys)
+
+    def test_citation_formatter_external_sort(
+        self,
+        book_model_fixture: BookModel,
+        journal_article_model_fixture: JournalArticleModel,
+        newspaper_model_fixture: NewspaperModel,
+    ) -> None:
+        """
+        Тестирование итогового форматирования с внешней сортировкой.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели журнальной статьи
+        :param NewspaperModel newspaper_model_fixture: Фикстура модели газетной статьи
+        """
+
+        models = [newspaper_model_fixture, journal_article_model_fixture, book_model_fixture] * 50
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        assert list(GOSTCitationFormatter(models).iter_format(memory_limit=1)) == expected
@@ -0,0 +1,50 @@
+"""
+Тестирование базовых функций стилей цитирования.
+"""
+from string import Template
+
+import pytest
+
+from formatters.styles.base import compile_template
+
+
+class TestStyles:
+    """
+    Тестирование базовых функций стилей цитирования.
+    """
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с.",
+            "${authors}s {literal} $$ ${year};$issue:$pages.",
+            "",
+        ],
+    )
+    def test_compile_template(self, template: str) -> None:
+        """
+        Тестирование совпадения заполнения скомпилированного шаблона и `Template.substitute()`.
+
+        :param str template: Шаблон для форматирования строки.
+        """
+
+        values = {
+            "authors": "Иванов И.М.",
+            "title": "Наука {как} искусство",
+            "edition": "",
+            "city": "СПб.",
+            "publishing_house": "$АСТ",
+            "year": 2020,
+            "issue": 10,
+            "pages": 999,
+        }
+
+        assert compile_template(Template(template)).format_map(values) == Template(template).substitute(values)
+
+    def test_compile_template_invalid(self) -> None:
+        """
+        Тестирование некорректного заполнителя в шаблоне.
+        """
+
+        with pytest.raises(ValueError):
+            compile_template(Template("$authors $"))
@@ -1,9 +1,11 @@
 """
 Тестирование функций чтения данных из источника.
 """
+from datetime import date, datetime
 from typing import Any
 
 import pytest
+from openpyxl import Workbook
 
 from formatters.models import (
     BookModel,
@@ -18,6 +20,9 @@ from readers.reader import (
     InternetResourceReader,
     ArticlesCollectionReader,
 )
+from formatters.records import BaseRecord
+from readers.base import convert_column
+from readers.validation import CellError, SheetValidationError
 from settings import TEMPLATE_FILE_PATH
 
 
@@ -128,3 +133,148 @@ class TestReaders:
             JournalArticleModel.__name__,
             NewspaperModel.__name__,
         }
+
+    def test_sources_reader_read_only(self) -> None:
+        """
+        Тестирование потокового чтения рабочей книги в режиме только для чтения.
+        """
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH, read_only=True)
+        models = reader.read()
+        reader.close()
+
+        # результат потокового чтения совпадает с результатом обычного чтения
+        assert models == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_sources_reader_iter_read(self) -> None:
+        """
+        Тестирование ленивого чтения всех моделей из источника.
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH).iter_read()
+
+        assert not isinstance(models, list)
+        assert list(models) == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_sources_reader_read_parallel(self) -> None:
+        """
+        Тестирование параллельного чтения листов исходного файла.
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH).read_parallel(workers=2)
+
+        # порядок моделей совпадает с порядком последовательного чтения
+        assert models == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert [type(model) for model in models] == [
+            type(model) for model in SourcesReader(TEMPLATE_FILE_PATH).read()
+        ]
+
+    def test_sources_reader_bulk(self) -> None:
+        """
+        Тестирование чтения моделей с пакетной проверкой значений.
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH, bulk=True).read()
+
+        assert models == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert [type(model) for model in models] == [
+            type(model) for model in SourcesReader(TEMPLATE_FILE_PATH).read()
+        ]
+
+    def test_book_bulk_errors(self) -> None:
+        """
+        Тестирование сообщений об ошибках пакетной проверки значений.
+        """
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Книга"
+        sheet.append(["Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы"])
+        sheet.append(["Иванов И.М.", "Наука", None, "СПб.", "АСТ", 2020, 999])
+        sheet.append(["Петров С.Н.", "Искусство", None, None, "АСТ", 0, 100])
+        sheet.append(["Сидоров А.А.", "Наука", None, "М.", "АСТ", "две тысячи", 100])
+
+        with pytest.raises(SheetValidationError) as error:
+            BookReader(workbook, bulk=True).read()
+
+        assert [(item.sheet, item.row, item.field) for item in error.value.errors] == [
+            ("Книга", 3, "city"),
+            ("Книга", 3, "year"),
+            ("Книга", 4, "year"),
+        ]
+
+    @pytest.mark.parametrize(
+        "values, data_type, expected",
+        [
+            ([2020, None, 0], int, [2020, None, 0]),
+            (["2020", " 15 ", None], int, [2020, 15, None]),
+            ([" Наука ", 2020, None, ""], str, ["Наука", "2020", None, ""]),
+            (
+                [datetime(2021, 1, 10), datetime(2021, 1, 10), "вчера", None],
+                date,
+                ["10.01.2021", "10.01.2021", "вчера", None],
+            ),
+        ],
+    )
+    def test_convert_column(self, values: list, data_type: type, expected: list) -> None:
+        """
+        Тестирование преобразования столбца значений.
+
+        :param list values: Значения ячеек столбца.
+        :param type data_type: Тип данных атрибута.
+        :param list expected: Преобразованные значения.
+        """
+
+        column = convert_column(values, data_type)
+
+        assert column.values == expected
+        assert not any(column.mask) and not column.messages
+
+    def test_convert_column_mask(self) -> None:
+        """
+        Тестирование маски ошибок преобразования столбца.
+        """
+
+        column = convert_column(["2020", "две тысячи", None, "1999", "19.5"], int)
+
+        assert column.values == [2020, None, None, 1999, None]
+        assert list(column.mask) == [0, 1, 0, 0, 1]
+        assert set(column.messages) == {1, 4}
+
+        selected = column.select([False, True, True, True, True])
+        assert selected.values == [None, None, 1999, None]
+        assert list(selected.mask) == [1, 0, 0, 1] and set(selected.messages) == {0, 3}
+
+    def test_book_column_errors(self) -> None:
+        """
+        Тестирование ошибок преобразования значений нескольких столбцов.
+        """
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Книга"
+        sheet.append(["Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы"])
+        sheet.append(["Иванов И.М.", "Наука", None, "СПб.", "АСТ", "2020", "много"])
+        sheet.append(["Петров С.Н.", "Искусство", None, "М.", "АСТ", "две тысячи", "сто"])
+        sheet.append(["Сидоров А.А.", "Наука", None, "М.", "АСТ", 2020, 100])
+
+        with pytest.raises(SheetValidationError) as error:
+            BookReader(workbook, bulk=True).read()
+
+        # ошибки всех строк собираются без прерывания чтения, для строки указывается первый некорректный столбец
+        assert [(item.row, item.field) for item in error.value.errors] == [(2, "pages"), (3, "year")]
+
+        with pytest.raises(CellError) as cell_error:
+            BookReader(workbook).read()
+        assert cell_error.value.field == "pages"
+
+    def test_sources_reader_records(self) -> None:
+        """
+        Тестирование чтения компактных записей вместо моделей.
+        """
+
+        records = SourcesReader(TEMPLATE_FILE_PATH, records=True).read()
+
+        assert all(isinstance(record, BaseRecord) for record in records)
+        assert [record.to_model() for record in records] == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert SourcesReader(TEMPLATE_FILE_PATH, records=True).read_parallel(workers=2) == records
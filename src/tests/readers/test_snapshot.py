@@ -0,0 +1,173 @@
+"""
+Тестирование снимка источников.
+"""
+import pickle
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from formatters.records import BookRecord, JournalArticleRecord
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+from formatters.styles.nlm import NLMCitationFormatter
+from main import generate
+from readers.reader import SourcesReader
+from readers.snapshot import Snapshot, open_snapshot, write_snapshot
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestSnapshot:
+    """
+    Тестирование снимка источников.
+    """
+
+    @pytest.mark.parametrize(
+        "citation_style, formatter", [("gost", GOSTCitationFormatter), ("nlm", NLMCitationFormatter)]
+    )
+    def test_read(self, tmp_path: Path, citation_style: str, formatter: type) -> None:
+        """
+        Тестирование совпадения источников, загруженных из снимка и прочитанных из рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str citation_style: Стиль цитирования
+        :param type formatter: Класс итогового форматирования
+        """
+
+        expected = SourcesReader(TEMPLATE_FILE_PATH, records=True).read(citation_style)
+        path = str(tmp_path / "sources.snapshot")
+
+        # снимок создается по всем листам при первом чтении
+        reader = SourcesReader(TEMPLATE_FILE_PATH, snapshot=path)
+        assert [item.dict() for item in reader.read(citation_style)] == [item.dict() for item in expected]
+        reader.close()
+
+        # снимок используется для другого стиля цитирования без загрузки рабочей книги
+        for style in ("gost", "nlm"):
+            reader = SourcesReader(TEMPLATE_FILE_PATH, snapshot=path)
+            reader.read(style)
+            assert "workbook" not in reader.__dict__
+            reader.close()
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH, snapshot=path)
+        items = reader.read(citation_style)
+        assert all(isinstance(item, type(record)) for item, record in zip(items, expected))
+        assert [str(item) for item in formatter(items).format()] == [
+            str(item) for item in formatter(expected).format()
+        ]
+        reader.close()
+
+    def test_values(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения значений полей, в том числе отсутствующих и повторяющихся.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        books = [
+            BookRecord(authors="Иванов И.М.", title="Наука", city="СПб.", publishing_house="АСТ", year=2020, pages=9),
+            BookRecord(authors="Ёлкин А.А.", title="Наука", city="СПб.", publishing_house="АСТ", year=1, pages=None),
+        ]
+        articles = [JournalArticleRecord(authors="Петров С.Н.", article_title="Жизнь", year=2021, issue=3)]
+        path = str(tmp_path / "sources.snapshot")
+        count = write_snapshot(
+            path, {"Книга": "1"}, [(BookRecord.model, books), (JournalArticleRecord.model, articles)]
+        )
+
+        snapshot = Snapshot(path)
+        items = list(snapshot.iter_items([JournalArticleRecord.model, BookRecord.model]))
+        assert count == 3 and len(snapshot.sections["BookModel"]) == 2
+        assert [item.dict() for item in items] == [item.dict() for item in [*articles, *books]]
+        assert items[1].edition is None and items[2].pages is None and isinstance(items[1].year, int)
+        # представление оформляется стилем записи
+        assert str(GOSTCitationFormatter(items[1:]).build(items[1])) == str(GOSTBook(books[0]))
+        # представление сериализуется как запись
+        restored = pickle.loads(pickle.dumps(items[1], protocol=pickle.HIGHEST_PROTOCOL))
+        assert type(restored) is BookRecord and restored.dict() == books[0].dict()
+
+        # незавершенный обход раздела не препятствует закрытию снимка
+        section = iter(snapshot.sections["BookModel"])
+        next(section)
+        snapshot.close()
+        section.close()
+
+    @pytest.mark.parametrize(
+        "citation_style, formatter", [("gost", GOSTCitationFormatter), ("nlm", NLMCitationFormatter)]
+    )
+    def test_external_sort(self, tmp_path: Path, citation_style: str, formatter: type) -> None:
+        """
+        Тестирование внешней сортировки оформленных источников, загруженных из снимка.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str citation_style: Стиль цитирования
+        :param type formatter: Класс итогового форматирования
+        """
+
+        expected = [
+            str(item) for item in formatter(SourcesReader(TEMPLATE_FILE_PATH).read(citation_style)).format()
+        ]
+        reader = SourcesReader(TEMPLATE_FILE_PATH, records=True, snapshot=str(tmp_path / "sources.snapshot"))
+        # ключи с представлениями записей сохраняются во временные файлы при превышении объема памяти
+        items = list(formatter(reader.iter_read(citation_style)).iter_format(memory_limit=1, items=True))
+        reader.close()
+
+        assert [str(item) for item in items] == expected
+
+    def test_stale(self, tmp_path: Path) -> None:
+        """
+        Тестирование отказа от устаревшего и поврежденного снимка.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "sources.snapshot"
+        assert open_snapshot(str(path), {}) is None
+
+        write_snapshot(str(path), {"Книга": "1"}, [])
+        assert open_snapshot(str(path), {"Книга": "2"}) is None
+        snapshot = open_snapshot(str(path), {"Книга": "1"})
+        assert snapshot is not None and not snapshot.sections
+        snapshot.close()
+
+        path.write_bytes(b"not a snapshot")
+        assert open_snapshot(str(path), {"Книга": "1"}) is None
+
+        # при изменении листа снимок создается заново
+        path_input = tmp_path / "input.xlsx"
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        workbook.save(path_input)
+        reader = SourcesReader(str(path_input), snapshot=str(path))
+        assert len(reader.read()) == 10
+        reader.close()
+
+        workbook["Книга"].append(["Баранов А.Н.", "Введение", None, "М.", "УРСС", 2001, 360])
+        workbook.save(path_input)
+        reader = SourcesReader(str(path_input), snapshot=str(path))
+        assert len(reader.read()) == 11 and "workbook" in reader.__dict__
+        reader.close()
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_generate(self, tmp_path: Path, lazy: bool) -> None:
+        """
+        Тестирование обработки входного файла с использованием снимка источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param bool lazy: Ленивая обработка
+        """
+
+        path_snapshot = str(tmp_path / "sources.snapshot")
+        for citation in ("gost", "nlm", "gost"):
+            expected = tmp_path / f"{citation}.expected.txt"
+            generate(citation, TEMPLATE_FILE_PATH, str(expected), output_format="txt")
+            path_output = tmp_path / f"{citation}.txt"
+            generate(
+                citation,
+                TEMPLATE_FILE_PATH,
+                str(path_output),
+                lazy=lazy,
+                output_format="txt",
+                snapshot_path=path_snapshot,
+            )
+            assert path_output.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            generate(path_output=str(tmp_path / "output.docx"), incremental=True, snapshot_path=path_snapshot)
@@ -0,0 +1,206 @@
+"""
+Тестирование чтения табличных источников.
+"""
+import csv
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTCitationFormatter
+from incremental import IncrementalBuild
+from readers.reader import BookReader, SourcesReader
+from readers.base import convert_column
+from readers.tables import CSVSheet, ParquetSheet, TableWorkbook
+from readers.validation import SheetValidationError
+from settings import TEMPLATE_FILE_PATH
+
+
+def export_csv(path: Path) -> Path:
+    """
+    Сохранение листов шаблона входного файла в таблицы CSV (даты – в формате ISO 8601).
+
+    :param path: Путь к директории для таблиц.
+    :return: Путь к директории с таблицами.
+    """
+
+    workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+    for sheet in workbook:
+        with open(path / f"{sheet.title}.csv", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            for row in sheet.iter_rows(values_only=True):
+                writer.writerow(
+                    value.date().isoformat() if isinstance(value, datetime) else value for value in row
+                )
+
+    return path
+
+
+class TestTables:
+    """
+    Тестирование чтения табличных источников.
+    """
+
+    @pytest.mark.parametrize("citation_style", ["gost", "nlm"])
+    @pytest.mark.parametrize("bulk, records", [(False, False), (True, False), (False, True)])
+    def test_csv(self, tmp_path: Path, citation_style: str, bulk: bool, records: bool) -> None:
+        """
+        Тестирование совпадения источников, прочитанных из таблиц CSV и рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str citation_style: Стиль цитирования
+        :param bool bulk: Пакетная проверка значений
+        :param bool records: Компактные записи
+        """
+
+        expected = SourcesReader(TEMPLATE_FILE_PATH, bulk=bulk, records=records).read(citation_style)
+        reader = SourcesReader(str(export_csv(tmp_path)), bulk=bulk, records=records)
+
+        assert isinstance(reader.workbook, TableWorkbook)
+        assert reader.read(citation_style) == expected
+        assert reader.read_parallel(citation_style, 2) == expected
+
+    def test_csv_sheet(self, tmp_path: Path) -> None:
+        """
+        Тестирование построчного чтения и столбцов таблицы CSV.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "Книга.csv"
+        path.write_text("authors,title\nИванов И.М.,  Наука \nПетров С.Н.\n", encoding="utf-8")
+        sheet = CSVSheet(str(path))
+
+        assert sheet.rows == 2 and sheet.width == 2
+        assert list(sheet.iter_rows()) == [("Иванов И.М.", "  Наука "), ("Петров С.Н.", None)]
+        assert sheet.convert(1, str).values == ["Наука", None]
+        # отсутствующий столбец
+        assert sheet.column(5) == [None, None]
+
+        # столбцы, появившиеся в следующих строках, дополняются пустыми значениями для предыдущих строк
+        path.write_text("authors\nИванов И.М.\nПетров С.Н.,Жизнь,М.\n\n", encoding="utf-8")
+        sheet = CSVSheet(str(path))
+        assert sheet.rows == 3 and sheet.width == 3
+        assert list(sheet.iter_rows()) == [
+            ("Иванов И.М.", None, None),
+            ("Петров С.Н.", "Жизнь", "М."),
+            (None, None, None),
+        ]
+
+    def test_single_file(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения источника из одной таблицы CSV (остальные листы пусты).
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = export_csv(tmp_path) / "Книга.csv"
+        expected = [
+            item for item in SourcesReader(TEMPLATE_FILE_PATH).read() if isinstance(item, BookModel)
+        ]
+        reader = SourcesReader(str(path))
+
+        assert isinstance(reader.workbook, TableWorkbook) and list(reader.workbook.files) == ["Книга"]
+        assert reader.read() == expected
+        assert list(reader.checksums) == ["Книга"] and reader.sheet_fingerprint("Статья из журнала") == ""
+
+        # таблица, имя которой не совпадает с наименованием листа, не читается как пустой список
+        path = path.rename(tmp_path / "books.csv")
+        with pytest.raises(ValueError):
+            SourcesReader(str(path)).read()
+
+    def test_empty_values(self, tmp_path: Path) -> None:
+        """
+        Тестирование одинаковой обработки пустых значений и строк из пробелов в таблицах и рабочей книге.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        pyarrow = pytest.importorskip("pyarrow")
+        parquet = pytest.importorskip("pyarrow.parquet")
+
+        # значения ячеек рабочей книги: пустая ячейка – `None`, строка из пробелов сохраняется
+        titles, pages = ["Наука", "   ", None], ["12", " ", None]
+        expected = [convert_column(titles, str), convert_column(pages, int)]
+
+        path = tmp_path / "Книга.csv"
+        path.write_text("title,pages\nНаука,12\n   , \n,\n", encoding="utf-8")
+        parquet.write_table(
+            pyarrow.table({"title": ["Наука", "   ", ""], "pages": ["12", " ", None]}),
+            str(tmp_path / "Книга.parquet"),
+        )
+        for sheet in (CSVSheet(str(path)), ParquetSheet(str(tmp_path / "Книга.parquet"))):
+            assert sheet.column(0) == titles
+            assert [sheet.convert(0, str), sheet.convert(1, int)] == expected
+
+    def test_csv_errors(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибок преобразования значений столбца.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "Книга.csv"
+        path.write_text(
+            "authors,title,edition,city,publishing_house,year,pages\n"
+            "Иванов И.М.,Наука,,СПб.,Просвещение,2020,999\n"
+            "Петров С.Н.,Искусство,,М.,Наука,двадцатый,100\n",
+            encoding="utf-8",
+        )
+        workbook = TableWorkbook(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            BookReader(workbook).read()
+
+        with pytest.raises(SheetValidationError) as error:
+            BookReader(workbook, bulk=True).read()
+        ((sheet, row, field, _),) = error.value.errors
+        assert (sheet, row, field) == ("Книга", 3, "year")
+
+        with pytest.raises(KeyError):
+            TableWorkbook(str(tmp_path))["Статья из газеты"]
+
+    def test_incremental(self, tmp_path: Path) -> None:
+        """
+        Тестирование инкрементальной сборки по таблицам CSV.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = export_csv(tmp_path)
+        build = IncrementalBuild(SourcesReader(str(path)), "gost", "txt", str(tmp_path / "manifest.json"))
+        rows = build.format(GOSTCitationFormatter)
+        build.save()
+        assert len(rows) == 10
+
+        (path / "Книга.csv").write_text(
+            (path / "Книга.csv").read_text(encoding="utf-8").replace("Наука как искусство", "Наука"),
+            encoding="utf-8",
+        )
+        build = IncrementalBuild(SourcesReader(str(path)), "gost", "txt", str(tmp_path / "manifest.json"))
+        changed = build.format(GOSTCitationFormatter)
+        assert build.changed and len(changed) == 10 and changed != rows
+
+    def test_parquet(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения источников, прочитанных из таблиц Parquet и рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        pyarrow = pytest.importorskip("pyarrow")
+        parquet = pytest.importorskip("pyarrow.parquet")
+
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        for sheet in workbook:
+            names, *rows = sheet.iter_rows(values_only=True)
+            table = pyarrow.Table.from_arrays(
+                [pyarrow.array(values) for values in zip(*rows)], names=[str(name) for name in names]
+            )
+            parquet.write_table(table, str(tmp_path / f"{sheet.title}.parquet"))
+
+        for bulk in (False, True):
+            expected = SourcesReader(TEMPLATE_FILE_PATH, bulk=bulk).read()
+            assert SourcesReader(str(tmp_path), bulk=bulk).read() == expected
@@ -0,0 +1,174 @@
+"""
+Тестирование пакетной обработки входных файлов.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from batch import REPORT_FILE_NAME, find_inputs, process_batch
+from settings import TEMPLATE_FILE_PATH
+
+
+def run_batch(args: list[str], env: dict[str, str]) -> subprocess.CompletedProcess:
+    """
+    Запуск пакетной обработки в отдельном процессе (переменные окружения читаются при импорте настроек).
+
+    :param args: Аргументы командной строки.
+    :param env: Дополнительные переменные окружения.
+    :return: Результат выполнения команды.
+    """
+
+    return subprocess.run(
+        [sys.executable, "batch.py", *args],
+        cwd=Path(__file__).parents[1],
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+class TestBatch:
+    """
+    Тестирование пакетной обработки входных файлов.
+    """
+
+    @pytest.fixture
+    def inputs(self, tmp_path: Path) -> Path:
+        """
+        Получение директории с входными файлами (два корректных файла и один поврежденный).
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :return: Директория с входными файлами.
+        """
+
+        path = tmp_path / "input"
+        (path / "group").mkdir(parents=True)
+        shutil.copy(TEMPLATE_FILE_PATH, path / "first.xlsx")
+        shutil.copy(TEMPLATE_FILE_PATH, path / "group" / "second.xlsx")
+        (path / "broken.xlsx").write_text("broken")
+        # файл блокировки Excel не обрабатывается
+        (path / "~$first.xlsx").write_text("lock")
+
+        return path
+
+    def test_find_inputs(self, inputs: Path) -> None:
+        """
+        Тестирование получения списка входных файлов по директории и шаблону пути.
+
+        :param Path inputs: Директория с входными файлами
+        """
+
+        assert find_inputs(str(inputs)) == [inputs / "broken.xlsx", inputs / "first.xlsx"]
+        assert find_inputs(f"{inputs}/**/*.xlsx") == [
+            inputs / "broken.xlsx",
+            inputs / "first.xlsx",
+            inputs / "group" / "second.xlsx",
+        ]
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_process_batch(self, tmp_path: Path, inputs: Path, workers: int) -> None:
+        """
+        Тестирование пакетной обработки с отчетом о файлах с ошибками.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param Path inputs: Директория с входными файлами
+        :param int workers: Количество процессов для обработки файлов
+        """
+
+        output = tmp_path / "output"
+        result = CliRunner().invoke(
+            process_batch, ["-pi", f"{inputs}/**/*.xlsx", "-po", str(output), "-w", str(workers), "-f", "txt"]
+        )
+
+        # при наличии файлов с ошибками команда завершается с ненулевым кодом
+        assert result.exit_code == 1
+        assert (output / "first.txt").read_text(encoding="utf-8").startswith("1. ")
+        assert (output / "group" / "second.txt").read_text(encoding="utf-8") == (output / "first.txt").read_text(
+            encoding="utf-8"
+        )
+
+        report = json.loads((output / REPORT_FILE_NAME).read_text(encoding="utf-8"))
+        assert (report["total"], report["succeeded"], report["failed"]) == (3, 2, 1)
+        assert [Path(item["path_input"]).name for item in report["files"]] == [
+            "broken.xlsx",
+            "first.xlsx",
+            "second.xlsx",
+        ]
+        assert report["files"][0]["error"].startswith("BadZipFile")
+        assert report["files"][1]["error"] is None
+
+    def test_broken_pool(self, tmp_path: Path, inputs: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование отчета при аварийном завершении рабочего процесса.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param Path inputs: Директория с входными файлами
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        def generate(path_input: str, **options: Any) -> None:
+            # аварийное завершение рабочего процесса (аналог завершения по нехватке памяти)
+            os._exit(1)  # pylint: disable=protected-access
+
+        monkeypatch.setattr("batch.generate", generate)
+
+        output = tmp_path / "output"
+        result = CliRunner().invoke(process_batch, ["-pi", str(inputs), "-po", str(output), "-w", "2", "-f", "txt"])
+
+        assert result.exit_code == 1
+        report = json.loads((output / REPORT_FILE_NAME).read_text(encoding="utf-8"))
+        assert (report["total"], report["failed"]) == (2, 2)
+        assert all(item["error"].startswith("BrokenProcessPool") for item in report["files"])
+
+    def test_snapshot_env(self, tmp_path: Path, inputs: Path) -> None:
+        """
+        Тестирование пакетной обработки без снимка источников, заданного переменной окружения.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param Path inputs: Директория с входными файлами
+        """
+
+        (inputs / "broken.xlsx").unlink()
+        output = tmp_path / "output"
+        path_snapshot = tmp_path / "shared.snapshot"
+        args = ["-pi", f"{inputs}/**/*.xlsx", "-po", str(output), "-w", "2", "-f", "txt", "--incremental"]
+        process = run_batch(args, {"SNAPSHOT_PATH": str(path_snapshot)})
+
+        assert process.returncode == 0, process.stderr
+        assert not path_snapshot.exists()
+        report = json.loads((output / REPORT_FILE_NAME).read_text(encoding="utf-8"))
+        assert (report["total"], report["succeeded"]) == (2, 2)
+
+    def test_cache(self, tmp_path: Path, inputs: Path) -> None:
+        """
+        Тестирование общего кэша оформленных источников, заданного параметром пакетной обработки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param Path inputs: Директория с входными файлами
+        """
+
+        (inputs / "broken.xlsx").unlink()
+        path_env = tmp_path / "env.sqlite"
+        path_cache = tmp_path / "cache.sqlite"
+        args = ["-pi", f"{inputs}/**/*.xlsx", "-po", str(tmp_path / "output"), "-w", "2", "-f", "txt"]
+
+        # кэш из переменной окружения не используется
+        process = run_batch(args, {"CITATION_CACHE_PATH": str(path_env)})
+        assert process.returncode == 0, process.stderr
+        assert not path_env.exists()
+
+        process = run_batch([*args, "--cache", str(path_cache)], {"CITATION_CACHE_PATH": str(path_env)})
+        assert process.returncode == 0, process.stderr
+        assert not path_env.exists()
+        with sqlite3.connect(path_cache) as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM citations").fetchone()
+        assert count == 10
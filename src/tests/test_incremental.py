@@ -0,0 +1,111 @@
+"""
+Тестирование инкрементальной сборки списка источников.
+"""
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+from incremental import IncrementalBuild
+from readers.base import BaseReader
+from readers.reader import SourcesReader
+from readers.validation import SheetValidationError
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestIncremental:
+    """
+    Тестирование инкрементальной сборки списка источников.
+    """
+
+    @staticmethod
+    def build(path: Path, manifest: Path, **options: bool) -> tuple[IncrementalBuild, list[str]]:
+        """
+        Инкрементальная сборка списка источников.
+
+        :param path: Путь к входному файлу.
+        :param manifest: Путь к файлу манифеста.
+        :param options: Параметры чтения исходного файла (`bulk`, `records`).
+        :return: Объект сборки и оформленные строки.
+        """
+
+        reader = SourcesReader(str(path), read_only=True, **options)
+        build = IncrementalBuild(reader, "gost", "docx", str(manifest))
+        rows = build.format(GOSTCitationFormatter)
+        build.save()
+        reader.close()
+
+        return build, rows
+
+    def test_incremental(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование повторной обработки только измененных листов и строк.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        path = tmp_path / "input.xlsx"
+        manifest = tmp_path / "output.docx.manifest.json"
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        # повторное сохранение исключает изменения разметки листов, вносимые openpyxl при первом сохранении
+        workbook.save(path)
+        workbook.save(path)
+
+        build, rows = self.build(path, manifest)
+        expected = [str(item) for item in GOSTCitationFormatter(SourcesReader(str(path)).read()).format()]
+        assert build.changed
+        assert rows == expected
+
+        # учет прочитанных листов и оформленных источников
+        sheets: list[str] = []
+        substituted: list[BaseCitationStyle] = []
+        iter_rows, substitute = BaseReader.iter_rows, GOSTBook.substitute
+        monkeypatch.setattr(BaseReader, "iter_rows", lambda self: sheets.append(self.sheet) or iter_rows(self))
+        monkeypatch.setattr(GOSTBook, "substitute", lambda self: substituted.append(self) or substitute(self))
+
+        build, rows = self.build(path, manifest)
+        assert not build.changed
+        assert rows == expected
+        assert not sheets and not substituted
+
+        # изменение одной строки листа
+        workbook["Книга"]["G3"] = 1
+        workbook.save(path)
+
+        build, rows = self.build(path, manifest)
+        assert build.changed
+        assert sheets == ["Книга"]
+        assert [item.data.pages for item in substituted] == [1]
+
+        expected = [str(item) for item in GOSTCitationFormatter(SourcesReader(str(path)).read()).format()]
+        assert rows == expected
+
+    @pytest.mark.parametrize("options", [{}, {"bulk": True}, {"records": True}])
+    def test_errors(self, tmp_path: Path, options: dict[str, bool]) -> None:
+        """
+        Тестирование ошибок в строках измененного листа с указанием листа и номера строки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param dict[str, bool] options: Параметры чтения исходного файла
+        """
+
+        path = tmp_path / "input.xlsx"
+        manifest = tmp_path / "output.docx.manifest.json"
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        workbook.save(path)
+
+        _, rows = self.build(path, manifest, **options)
+        assert rows == [str(item) for item in GOSTCitationFormatter(SourcesReader(str(path)).read()).format()]
+
+        # некорректный год издания и отрицательное количество страниц
+        workbook["Книга"]["F2"] = "две тысячи"
+        workbook["Книга"]["G3"] = -1
+        workbook.save(path)
+
+        with pytest.raises(SheetValidationError) as error:
+            self.build(path, manifest, **options)
+
+        assert [(item.sheet, item.row) for item in error.value.errors] == [("Книга", 2), ("Книга", 3)]
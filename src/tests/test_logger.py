@@ -0,0 +1,42 @@
+"""
+Тестирование функций логирования.
+"""
+import logging
+from pathlib import Path
+
+import pytest
+
+import logger as logger_module
+from logger import get_logger
+
+
+class TestLogger:
+    """
+    Тестирование функций логирования.
+    """
+
+    def test_get_logger(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование настройки логгера с фоновой записью логов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        monkeypatch.setattr(logger_module, "LOGGING_PATH", str(tmp_path))
+
+        logger = get_logger("tests.test_logger")
+        # повторный вызов не добавляет обработчики
+        assert get_logger("tests.test_logger") is logger
+        assert len(logger.handlers) == 1
+
+        logging.disable(logging.NOTSET)
+        try:
+            logger.info("Проверка записи лога")
+        finally:
+            logging.disable()
+
+        # остановка фонового обработчика записывает оставшиеся в очереди записи
+        logger_module.shutdown()
+
+        assert "Проверка записи лога" in (tmp_path / "tests.test_logger.log").read_text(encoding="utf-8")
@@ -0,0 +1,50 @@
+"""
+Тестирование команды обработки входного файла.
+"""
+from pathlib import Path
+
+import pytest
+
+from formatters.cache import CitationCache
+from main import generate
+from readers.reader import SourcesReader
+from renderer import TextRenderer
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestGenerate:
+    """
+    Тестирование команды обработки входного файла.
+    """
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_cleanup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, lazy: bool) -> None:
+        """
+        Тестирование закрытия исходного файла и кэша при ошибке генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        :param bool lazy: Ленивая обработка
+        """
+
+        closed = []
+        close_reader, close_cache = SourcesReader.close, CitationCache.close
+        monkeypatch.setattr(SourcesReader, "close", lambda self: closed.append("reader") or close_reader(self))
+        monkeypatch.setattr(CitationCache, "close", lambda self: closed.append("cache") or close_cache(self))
+
+        def render(self: TextRenderer, path: str) -> None:
+            raise OSError("Диск переполнен")
+
+        monkeypatch.setattr(TextRenderer, "render", render)
+
+        with pytest.raises(OSError):
+            generate(
+                path_input=TEMPLATE_FILE_PATH,
+                path_output=str(tmp_path / "output.txt"),
+                output_format="txt",
+                lazy=lazy,
+                cache_path=str(tmp_path / "cache.sqlite"),
+                streaming=True,
+            )
+
+        assert closed == ["reader", "cache"]
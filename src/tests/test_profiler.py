@@ -0,0 +1,113 @@
+"""
+Тестирование инструментирования этапов обработки.
+"""
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from main import generate
+from profiler import CPROFILE_SUFFIX, PROFILE_SUFFIX, Profiler
+from renderer import TextRenderer
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestProfiler:
+    """
+    Тестирование инструментирования этапов обработки.
+    """
+
+    def test_stage(self, tmp_path: Path) -> None:
+        """
+        Тестирование измерения показателей этапа и сохранения отчета.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        profiler = Profiler(enabled=True)
+        profiler.start()
+        with profiler.stage("build") as stats:
+            data = [str(index) for index in range(100000)]
+            stats["rows"] = len(data)
+        profiler.stop(str(tmp_path / "output.txt"), {"rows": len(data)})
+
+        report = json.loads((tmp_path / f"output.txt{PROFILE_SUFFIX}").read_text(encoding="utf-8"))
+        (stage,) = report["stages"]
+        assert report["parameters"] == {"rows": 100000}
+        assert stage["stage"] == "build" and stage["rows"] == 100000
+        assert stage["rows_per_second"] > 0
+        # строки остаются в памяти после завершения этапа
+        assert stage["memory_delta_mb"] > 1
+        assert stage["memory_peak_mb"] >= stage["memory_delta_mb"]
+        assert stage["peak_rss_mb"] >= stage["rss_mb"] > 0
+
+        # выключенный профилировщик не измеряет показатели
+        profiler = Profiler()
+        profiler.start()
+        with profiler.stage("build") as stats:
+            pass
+        profiler.stop(str(tmp_path / "disabled.txt"), {})
+        assert stats == {"stage": "build"}
+        assert not (tmp_path / f"disabled.txt{PROFILE_SUFFIX}").exists()
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_generate(self, tmp_path: Path, lazy: bool) -> None:
+        """
+        Тестирование отчета о производительности команды обработки входного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param bool lazy: Ленивая обработка
+        """
+
+        path_output = str(tmp_path / "output.txt")
+        generate(
+            path_input=TEMPLATE_FILE_PATH, path_output=path_output, output_format="txt", lazy=lazy, profile_cpu=True
+        )
+
+        report = json.loads(Path(f"{path_output}{PROFILE_SUFFIX}").read_text(encoding="utf-8"))
+        stages = {stage["stage"]: stage for stage in report["stages"]}
+        assert report["parameters"]["lazy"] is lazy
+        if lazy:
+            # чтение и оформление выполняются при генерации выходного файла
+            assert list(stages) == ["import", "render"]
+            assert stages["render"]["includes"] == ["read", "format", "sort"]
+            assert stages["render"]["substitute_seconds"] >= 0
+        else:
+            assert list(stages) == ["import", "load_workbook", "read", "format", "render"]
+            assert stages["read"]["rows"] == stages["format"]["rows"] == 10
+            assert stages["format"]["sort_seconds"] >= 0
+        assert stages["render"]["rows"] == 10
+
+        assert report["cprofile"] == f"{path_output}{CPROFILE_SUFFIX}"
+        assert pstats.Stats(report["cprofile"]).total_calls > 0
+
+    def test_standard_output(self) -> None:
+        """
+        Тестирование отказа от отчета о производительности при выводе в стандартный поток.
+        """
+
+        with pytest.raises(ValueError):
+            generate(path_input=TEMPLATE_FILE_PATH, path_output="-", output_format="txt", profile=True)
+
+    def test_stop_on_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование завершения измерений при ошибке генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        def render(self: TextRenderer, path: str) -> None:
+            raise OSError("Диск переполнен")
+
+        monkeypatch.setattr(TextRenderer, "render", render)
+
+        path_output = str(tmp_path / "output.txt")
+        with pytest.raises(OSError):
+            generate(path_input=TEMPLATE_FILE_PATH, path_output=path_output, output_format="txt", profile=True)
+
+        assert not tracemalloc.is_tracing()
+        report = json.loads(Path(f"{path_output}{PROFILE_SUFFIX}").read_text(encoding="utf-8"))
+        assert [stage["stage"] for stage in report["stages"]][-1] == "render"
@@ -1,11 +1,45 @@
 """
 Тестирование функций генерации выходного файла.
 """
+import io
+import json
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from renderer import Renderer
+from formatters.models import BookModel, JournalArticleModel
+from formatters.records import RECORDS
+from formatters.styles.gost import GOSTBook, GOSTJournalArticle
+from outputs import ENGINES, OUTPUT_FORMATS
+from renderer import (
+    FORMATS,
+    RENDERERS,
+    BibTeXRenderer,
+    BulkRenderer,
+    HTMLRenderer,
+    JSONLinesRenderer,
+    PlainTextRenderer,
+    Renderer,
+    TextRenderer,
+)
+
+
+class UnseekableStream(io.RawIOBase):
+    """
+    Файловый объект без поддержки перемещения (аналог канала).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore
+        self.data += data
+        return len(data)
 
 
 class TestRenderer:
@@ -41,3 +75,142 @@ class TestRenderer:
         assert len(list(tmp_path.iterdir())) == 1
         # проверка размера файла в байтах на диске
         assert path.stat().st_size == 36773
+
+    def test_bulk_render(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения документа, созданного пакетным добавлением абзацев.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ("Строка №1", "  Строка <2> & «3»\tс табуляцией\nи переводом строки ", "")
+
+        Renderer(rows).render(tmp_path / "output.docx")
+        BulkRenderer(iter(rows)).render(tmp_path / "output_bulk.docx")
+
+        with zipfile.ZipFile(tmp_path / "output.docx") as expected, zipfile.ZipFile(
+            tmp_path / "output_bulk.docx"
+        ) as result:
+            assert expected.namelist() == result.namelist()
+            for name in expected.namelist():
+                assert expected.read(name) == result.read(name)
+
+    def test_stream_render(self, tmp_path: Path) -> None:
+        """
+        Тестирование потоковой записи документа в файловый объект без поддержки перемещения.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ("Строка №1", "  Строка <2> & «3»\tс табуляцией\nи переводом строки ", "")
+
+        Renderer(rows).render(tmp_path / "output.docx")
+        stream = UnseekableStream()
+        BulkRenderer(iter(rows)).render(stream)
+
+        with zipfile.ZipFile(tmp_path / "output.docx") as expected, zipfile.ZipFile(
+            io.BytesIO(bytes(stream.data))
+        ) as result:
+            assert expected.namelist() == result.namelist()
+            for name in expected.namelist():
+                assert expected.read(name) == result.read(name)
+
+    def test_registry(self) -> None:
+        """
+        Тестирование соответствия классов генерации наименованиям параметров командной строки.
+        """
+
+        assert tuple(RENDERERS) == ENGINES and ("docx", *FORMATS) == OUTPUT_FORMATS
+        assert all(issubclass(renderer, Renderer) for renderer in RENDERERS.values())
+        assert all(issubclass(renderer, TextRenderer) for renderer in FORMATS.values())
+
+    @pytest.mark.parametrize("renderer", [Renderer, BulkRenderer])
+    def test_control_characters(self, tmp_path: Path, renderer: type[Renderer]) -> None:
+        """
+        Тестирование одинаковой ошибки для строк с управляющими символами, недопустимыми в XML.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param type[Renderer] renderer: Класс генерации выходного файла
+        """
+
+        with pytest.raises(ValueError, match="XML compatible"):
+            renderer(["Строка №1", "Строка\x0b№2"]).render(tmp_path / "output.docx")
+
+    def test_text_render(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации простого текста и HTML.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ("Строка №1", "Строка <2> & «3»")
+
+        PlainTextRenderer(iter(rows)).render(tmp_path / "output.txt")
+        assert (tmp_path / "output.txt").read_text(encoding="utf-8") == "1. Строка №1\n2. Строка <2> & «3»\n"
+
+        stream = UnseekableStream()
+        HTMLRenderer(iter(rows)).render(stream)
+        content = stream.data.decode("utf-8")
+        assert content.startswith("<!DOCTYPE html>")
+        assert "<ol>\n<li>Строка №1</li>\n<li>Строка &lt;2&gt; &amp; «3»</li>\n</ol>" in content
+        assert content.endswith("</html>\n")
+
+    def test_jsonl_render(self, tmp_path: Path, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование генерации JSON Lines с атрибутами источников.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        items = (GOSTBook(book_model_fixture), GOSTBook(RECORDS[BookModel].from_model(book_model_fixture)))
+
+        JSONLinesRenderer(items).render(tmp_path / "output.jsonl")
+        lines = (tmp_path / "output.jsonl").read_text(encoding="utf-8").splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {
+                "number": number,
+                "type": "BookModel",
+                "style": "GOSTBook",
+                "fields": book_model_fixture.dict(),
+                "formatted": items[0].formatted,
+            }
+            for number in (1, 2)
+        ]
+
+    def test_bibtex_render(
+        self, tmp_path: Path, book_model_fixture: BookModel, journal_article_model_fixture: JournalArticleModel
+    ) -> None:
+        """
+        Тестирование генерации BibTeX.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param JournalArticleModel journal_article_model_fixture: Фикстура модели статьи из журнала
+        """
+
+        book_model_fixture.title = "Наука & искусство_1"
+        items = (GOSTBook(book_model_fixture), GOSTJournalArticle(journal_article_model_fixture))
+
+        BibTeXRenderer(items).render(tmp_path / "output.bib")
+
+        assert (tmp_path / "output.bib").read_text(encoding="utf-8") == (
+            "@book{book1,\n"
+            "  author = {Иванов И.М. and Петров С.Н.},\n"
+            "  title = {Наука \\& искусство\\_1},\n"
+            "  edition = {3-е},\n"
+            "  address = {СПб.},\n"
+            "  publisher = {Просвещение},\n"
+            "  year = {2020},\n"
+            "  pagetotal = {999},\n"
+            "}\n\n"
+            "@article{article2,\n"
+            "  author = {Richard Evans and Alexander Pritzel and Tim Green.},\n"
+            "  title = {Highly accurate protein structure prediction with AlphaFold},\n"
+            "  journal = {Nature},\n"
+            "  year = {2021},\n"
+            "  number = {596},\n"
+            "  pages = {583--589},\n"
+            "}\n\n"
+        )
@@ -0,0 +1,237 @@
+"""
+Тестирование HTTP-сервиса генерации библиографических списков.
+"""
+import asyncio
+import io
+import json
+import os
+import signal
+import zipfile
+from functools import partial
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import openpyxl
+import pytest
+
+from formatters.models import BookModel
+from readers.reader import SourcesReader
+from server import BibliographyServer, HTTPError, RequestError, render_sources, warm_up
+from settings import TEMPLATE_FILE_PATH
+
+
+def record_warm_up(path: str) -> None:
+    """
+    Загрузка рабочего процесса с записью его идентификатора в файл.
+
+    :param path: Путь к файлу идентификаторов загруженных процессов.
+    """
+
+    warm_up()
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(f"{os.getpid()}\n")
+
+
+async def request(
+    port: int, method: str, target: str, body: bytes = b"", content_type: Optional[str] = None
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    Выполнение HTTP-запроса к сервису.
+
+    :param port: Порт сервиса.
+    :param method: Метод запроса.
+    :param target: Адрес запроса.
+    :param body: Тело запроса.
+    :param content_type: Тип содержимого тела запроса.
+    :return: Код ответа, заголовки (с наименованиями в нижнем регистре) и тело ответа.
+    """
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    headers = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if content_type:
+        headers += f"Content-Type: {content_type}\r\n"
+    writer.write(f"{headers}\r\n".encode("latin-1") + body)
+    await writer.drain()
+
+    data = await reader.read()
+    writer.close()
+    head, content = data.split(b"\r\n\r\n", 1)
+    status_line, *lines = head.decode("latin-1").split("\r\n")
+    response_headers = {name.lower(): value.strip() for name, value in (line.split(":", 1) for line in lines)}
+
+    return int(status_line.split(" ")[1]), response_headers, content
+
+
+def run(test: Callable[[BibliographyServer, int], Awaitable[None]], **kwargs) -> None:
+    """
+    Запуск сервиса на свободном порту и выполнение проверок.
+
+    :param test: Асинхронная функция проверок, принимающая сервис и его порт.
+    :param kwargs: Параметры сервиса.
+    """
+
+    async def main() -> None:
+        server = BibliographyServer(**{"workers": 1, **kwargs})
+        listener = await server.start("127.0.0.1", 0)
+        try:
+            await test(server, listener.sockets[0].getsockname()[1])
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.close()
+
+    asyncio.run(main())
+
+
+class TestServer:
+    """
+    Тестирование HTTP-сервиса генерации библиографических списков.
+    """
+
+    def test_render(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование генерации списка по источникам в JSON и по входному файлу .xlsx.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        sources = json.dumps([{"type": "BookModel", "fields": json.loads(book_model_fixture.json())}])
+        with open(TEMPLATE_FILE_PATH, "rb") as file:
+            workbook = file.read()
+
+        async def test(server: BibliographyServer, port: int) -> None:
+            status, headers, body = await request(
+                port, "POST", "/render?citation=gost&format=txt", sources.encode("utf-8"), "application/json"
+            )
+            assert status == 200
+            assert headers["content-type"] == "text/plain; charset=utf-8"
+            assert body.decode("utf-8") == (
+                "1. Иванов И.М., Петров С.Н. Наука как искусство. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с.\n"
+            )
+
+            status, headers, body = await request(port, "POST", "/render?citation=nlm", workbook)
+            assert status == 200
+            assert headers["content-disposition"] == 'attachment; filename="bibliography.docx"'
+            assert "word/document.xml" in zipfile.ZipFile(io.BytesIO(body)).namelist()
+
+            status, _, body = await request(port, "GET", "/health")
+            assert status == 200
+            assert json.loads(body)["served"] == server.served == 2
+
+        run(test)
+
+    def test_errors(self) -> None:
+        """
+        Тестирование ответов на некорректные запросы.
+        """
+
+        async def test(server: BibliographyServer, port: int) -> None:
+            status, _, body = await request(port, "POST", "/render", b'[{"type": "BookModel"}]', "application/json")
+            assert status == 400
+            assert body.startswith(b"KeyError")
+
+            status, _, _ = await request(port, "POST", "/render", b"broken")
+            assert status == 400
+
+            status, _, _ = await request(port, "POST", "/render?format=pdf", b"[]", "application/json")
+            assert status == 400
+
+            status, _, _ = await request(port, "POST", "/render", b"x" * 2048, "application/json")
+            assert status == 413
+
+            status, _, _ = await request(port, "GET", "/render")
+            assert status == 405
+
+            status, _, _ = await request(port, "GET", "/missing")
+            assert status == 404
+
+            assert server.served == 0
+
+        run(test, max_body_size=1024)
+
+    def test_close_on_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование закрытия рабочей книги при ошибке проверки данных.
+
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        loaded = []
+        close = SourcesReader.close
+        monkeypatch.setattr(
+            SourcesReader, "close", lambda self: loaded.append("workbook" in self.__dict__) or close(self)
+        )
+
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        workbook["Книга"].append(["Иванов И.М.", "Наука", None, "М.", "АСТ", "не год", 100])
+        body = io.BytesIO()
+        workbook.save(body)
+
+        with pytest.raises(RequestError):
+            render_sources(body.getvalue(), "application/octet-stream", "gost", "docx", "bulk")
+        assert loaded == [True]
+
+    def test_not_started(self) -> None:
+        """
+        Тестирование ответа на запрос к незапущенному сервису.
+        """
+
+        with pytest.raises(HTTPError) as error:
+            asyncio.run(BibliographyServer(workers=1).submit(b"[]", "application/json", "gost", "docx", "bulk"))
+        assert error.value.status == 503
+
+    def test_backpressure(self) -> None:
+        """
+        Тестирование отклонения запросов при переполнении очереди ожидания.
+        """
+
+        async def test(server: BibliographyServer, port: int) -> None:
+            assert server.semaphore is not None
+            # все места для обработки заняты, очередь ожидания отсутствует
+            await server.semaphore.acquire()
+            status, headers, _ = await request(port, "POST", "/render", b"[]", "application/json")
+            assert status == 503
+            assert headers["retry-after"] == "1"
+            assert server.rejected == 1
+
+            server.semaphore.release()
+            status, _, _ = await request(port, "POST", "/render?format=txt", b"[]", "application/json")
+            assert status == 200
+
+        run(test, queue_limit=0)
+
+    def test_warm_up(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование загрузки всех рабочих процессов при запуске сервиса.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param monkeypatch: Фикстура подмены атрибутов.
+        """
+
+        log = tmp_path / "warm_up.log"
+        monkeypatch.setattr("server.warm_up", partial(record_warm_up, str(log)))
+
+        async def test(server: BibliographyServer, port: int) -> None:
+            assert len(set(log.read_text(encoding="utf-8").split())) == server.workers == 2
+
+        run(test, workers=2)
+
+    def test_restart(self) -> None:
+        """
+        Тестирование пересоздания пула процессов после аварийного завершения рабочего процесса.
+        """
+
+        async def test(server: BibliographyServer, port: int) -> None:
+            assert server.executor is not None
+            # аварийное завершение рабочего процесса (аналог завершения по нехватке памяти)
+            for pid in list(server.executor._processes):  # pylint: disable=protected-access
+                os.kill(pid, signal.SIGKILL)
+
+            status, _, _ = await request(port, "POST", "/render?format=txt", b"[]", "application/json")
+            assert status == 500
+            assert server.restarts == 1
+
+            status, _, _ = await request(port, "POST", "/render?format=txt", b"[]", "application/json")
+            assert status == 200
+
+        run(test)